@@ -1,4 +1,5 @@
 import json
+import re
 
 # Given a JSON input file with data scraped from the Bilbao Crystalographic server,
 # generatea python file containing all of the crystal Wyckoff positions, for all point groups.
@@ -9,45 +10,42 @@ import json
 #
 
 
-# regex would be cleaner
+# Given an ops string of the form "{{x, y, z}, {-x, -y, z}}",
+# return a list of ops, each a list of 3 component strings, i.e. ["-x", "-y", "z"]
 def split_ops_string(ops_string):
+    return [[component.strip() for component in op.split(",")]
+            for op in re.findall(r"{([^{}]*)}", ops_string)]
 
-    ops = []
-    indices = [i for i, x in enumerate(ops_string) if x == "]"]
-    i = 0
-    for j in indices:
-        ops.append(ops_string[i:j+2])
-        i = j+2
-    return ops
 
+# Integer matrix of an op, such that the op applied to a point
+# (x, y, z) is given by matrix @ point
+def op_matrix(op):
+    assert len(op) == 3, "Expect 3 components per op"
+    matrix = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+    for i, component in enumerate(op):
+        for sign, variable in re.findall(r"([+-]?)([xyz])", component):
+            matrix[i]["xyz".index(variable)] = -1 if sign == "-" else 1
+    return matrix
 
-def function_definition_string(point_group):
 
-    shoenflies = point_group["Shoenflies"].lower()
-    ops_string = point_group["ops"]
-    # Should just modify brackets n "extract_symmetry.py"
-    ops_string = ops_string.translate(str.maketrans("{", "[") ) 
-    ops_string = ops_string.translate(str.maketrans("}", "]") ) 
-    ops = split_ops_string(ops_string)
-    white_space = " " * 25
+def operators_string(point_group):
+    shoenflies = point_group["Shoenflies"]
+    ops = split_ops_string(point_group["ops"])
 
-    function_str = "def wyckoff_positions_" + shoenflies + "(x, y, z): \n"
-    function_str += "    positions = np.array(" + ops[0] + "\n"
-    for i, op in enumerate(ops[1:]):
-        function_str += white_space + op + "\n"
+    string = "    PointGroup." + shoenflies.capitalize() + ": np.array(["
+    white_space = " " * len(string)
+    matrices = [str(op_matrix(op)) for op in ops]
+    string += (",\n" + white_space).join(matrices)
+    string += "], dtype=int),\n"
+    return string
 
-    function_str = function_str.rstrip() + ") \n"
-    function_str += "    return positions \n\n"
 
-    return  function_str 
-
-
-
-# python file defining a function with switch statement 
+# python file defining an operator table for all point groups
 def generate_crystal_point_groups(json_filename, output_dir=""):
     with open(json_filename) as fid:
         json_data = json.load(fid)
 
+    header_string = "# Generated by generate_point_groups.py, from " + json_filename + "\n\n"
     import_string = "import numpy as np \nimport enum \n\n"
 
     # enum class
@@ -55,31 +53,21 @@ def generate_crystal_point_groups(json_filename, output_dir=""):
     for index in json_data:
         point_group = json_data[index]
         shoenflies = point_group["Shoenflies"].lower()
-        enum_class_string += "    " + shoenflies.capitalize() + " = enum.auto\n"
+        enum_class_string += "    " + shoenflies.capitalize() + " = enum.auto()\n"
     enum_class_string += "\n"
 
-    # Each function
-    func_def_string = ''
+    # Operator table
+    table_string = "# Point operations, shape (n_ops, 3, 3). Equivalent points are given by ops @ point\n"
+    table_string += "operators = {\n"
     for index in json_data:
-        point_group = json_data[index]
-        func_def_string += function_definition_string(point_group)
-    
-    # Switch statement via dictionary 
+        table_string += operators_string(json_data[index])
+    table_string += "}\n\n"
+
     function_string = "def wyckoff_positions(point_group: PointGroup, point):\n"
     function_string += "    assert len(point) == 3\n"
-    function_string += "    x = point[0]\n    y = point[1]\n    z = point[2]\n\n"
-    function_string += "    switch = {\n"
+    function_string += "    return np.matmul(operators[point_group], np.asarray(point)) \n"
 
-    for index in json_data:
-        point_group = json_data[index]
-        shoenflies = point_group["Shoenflies"]
-        enum_string = shoenflies.capitalize()
-        function_name = "wyckoff_positions_" + shoenflies.lower()
-        function_string += "        PointGroup." + enum_string + ": " + function_name +  ",\n"
-    function_string +="        }\n"
-    function_string +="    return switch.get(point_group)(point) \n\n"
-
-    file_string = import_string + func_def_string + enum_class_string + function_string 
+    file_string = header_string + import_string + enum_class_string + table_string + function_string
     fid = open(output_dir + "crystal_point_groups.py", 'w')
     fid.write(file_string)
     fid.close()
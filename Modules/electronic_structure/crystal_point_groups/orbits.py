@@ -0,0 +1,98 @@
+# Orbits of points under the operations of a crystal point group.
+#
+# All points are expanded with one einsum over the operator table, and
+# duplicate images of points at special (Wyckoff) positions are removed
+# in bulk.
+#
+# Example usage:
+# orbits = expand_orbits(PointGroup.O_h, asymmetric_unit)
+# positions, orbit_index = orbits.positions, orbits.orbit_index
+
+import numpy as np
+
+from modules.electronic_structure.crystal_point_groups.crystal_point_groups import PointGroup, operators
+
+
+class PointOrbits:
+    """
+    Orbits of a batch of points, stored CSR-style.
+
+    The orbit of points[i] is positions[offsets[i]:offsets[i+1]].
+
+    :param positions: Unique images of all points, shape (n_images, 3)
+    :param offsets: Start of each point's orbit, shape (n_points + 1)
+    :param orbit_index: Index of the point each image is generated from, shape (n_images)
+    :param operator_index: Index of the operation that generates each image, shape (n_images)
+    """
+    def __init__(self, positions, offsets, orbit_index, operator_index):
+        self.positions = positions
+        self.offsets = offsets
+        self.orbit_index = orbit_index
+        self.operator_index = operator_index
+
+    def __len__(self) -> int:
+        return self.offsets.size - 1
+
+    def orbit(self, i: int) -> np.ndarray:
+        """ Images of point i, shape (multiplicity, 3) """
+        return self.positions[self.offsets[i]:self.offsets[i + 1]]
+
+    def multiplicities(self) -> np.ndarray:
+        """ Number of unique images per point, shape (n_points) """
+        return np.diff(self.offsets)
+
+
+def apply_operators(ops: np.ndarray, points) -> np.ndarray:
+    """
+    Apply all operations to all points
+
+    :param ops: Operations, shape (n_ops, 3, 3)
+    :param points: Points, shape (n_points, 3)
+    :return: Images, shape (n_points, n_ops, 3)
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    return np.einsum('oij,nj->noi', ops, points)
+
+
+def unique_images(images: np.ndarray, tolerance=1.e-8, periodic=False) -> np.ndarray:
+    """
+    Mask of the images of each point that are not duplicates of an earlier image of the same point
+
+    :param images: Images, shape (n_points, n_ops, 3)
+    :param tolerance: Images closer than tolerance, in each component, are duplicates
+    :param periodic: Points are fractional coordinates, and images are compared modulo lattice vectors
+    :return: Mask, shape (n_points, n_ops)
+    """
+    difference = images[:, :, np.newaxis, :] - images[:, np.newaxis, :, :]
+    if periodic:
+        difference -= np.rint(difference)
+    duplicate = np.all(np.abs(difference) <= tolerance, axis=-1)
+
+    # An image is kept if it does not duplicate an image of a lower operator index
+    n_ops = images.shape[1]
+    earlier = np.tril(np.ones(shape=(n_ops, n_ops), dtype=bool), k=-1)
+    return ~np.any(duplicate & earlier, axis=-1)
+
+
+def expand_orbits(point_group: PointGroup, points, tolerance=1.e-8, periodic=False) -> PointOrbits:
+    """
+    Orbits of a batch of points, for example the asymmetric unit of a crystal
+
+    :param point_group: Point group
+    :param points: Points, shape (n_points, 3). Fractional coordinates if periodic
+    :param tolerance: Images closer than tolerance, in each component, are duplicates
+    :param periodic: Images are wrapped into [0, 1) and compared modulo lattice vectors
+    :return: PointOrbits. Images of each point are ordered by operator index,
+    starting with the point itself
+    """
+    ops = operators[point_group]
+    images = apply_operators(ops, points)
+    if periodic:
+        images -= np.floor(images)
+    keep = unique_images(images, tolerance, periodic)
+
+    orbit_index, operator_index = np.nonzero(keep)
+    offsets = np.zeros(shape=images.shape[0] + 1, dtype=int)
+    offsets[1:] = np.cumsum(np.count_nonzero(keep, axis=1))
+
+    return PointOrbits(images[keep], offsets, orbit_index, operator_index)
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+
+from modules.electronic_structure.crystal_point_groups.crystal_point_groups import PointGroup, operators, \
+    wyckoff_positions
+from modules.electronic_structure.crystal_point_groups import orbits
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for orbits.py module """
+
+    def test_operator_table(self):
+        # Point groups are distinct enum members
+        self.assertEqual(len(operators), 32)
+        self.assertEqual(operators[PointGroup.O_h].shape, (48, 3, 3))
+        self.assertTrue(np.array_equal(wyckoff_positions(PointGroup.C_2v, [1, 2, 3]),
+                                       [[1, 2, 3], [-1, -2, 3], [1, -2, 3], [-1, 2, 3]]))
+
+    def test_expand_orbits(self):
+        # General position, 3-fold axis, 4-fold axis and the origin
+        points = np.array([[0.1, 0.2, 0.3],
+                           [0.2, 0.2, 0.2],
+                           [0., 0., 0.4],
+                           [0., 0., 0.]])
+        point_orbits = orbits.expand_orbits(PointGroup.O_h, points)
+
+        self.assertEqual(len(point_orbits), 4)
+        self.assertTrue(np.array_equal(point_orbits.multiplicities(), [48, 8, 6, 1]))
+        for i, point in enumerate(points):
+            self.assertTrue(np.allclose(point_orbits.orbit(i)[0], point))
+        self.assertTrue(np.array_equal(point_orbits.orbit_index, np.repeat(np.arange(4), [48, 8, 6, 1])))
+
+    def test_expand_orbits_periodic(self):
+        # In fractional coordinates, -1/2 is equivalent to 1/2
+        point_orbits = orbits.expand_orbits(PointGroup.O_h, [[0.5, 0.5, 0.5], [0.5, 0., 0.]], periodic=True)
+        self.assertTrue(np.array_equal(point_orbits.multiplicities(), [1, 3]))
+        self.assertTrue(np.all((point_orbits.positions >= 0.) & (point_orbits.positions < 1.)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -33,43 +33,87 @@ def mk_function2(ni: int):
     return (i - 1) / ni
 
 
+# Fractional grid points for per-dimension sequences,
+# with the last dimension running fastest. Returns shape (nk, 3)
+def fractional_grid(ikappa, jkappa, kkappa) -> np.ndarray:
+    i, j, k = np.meshgrid(ikappa, jkappa, kkappa, indexing='ij')
+    return np.column_stack((i.ravel(), j.ravel(), k.ravel()))
+
+
 # Monkhorst-Pack grid, as defined by equation 4) in:
 # https://journals.aps.org/prb/pdf/10.1103/PhysRevB.13.5188
 # Even grids avoid Gamma point, odd grids include Gamma point
 #
 # n = Number of sampling points per dimension (uniform grid)
 # b = primitive reciprocal lattice vectors, expected column-wise
+# Returns k-points column-wise, shape (3, nk)
 def grid(n, b):
+    assert len(n) == 3
+    fractional = fractional_grid(mk_function(n[0]), mk_function(n[1]), mk_function(n[2]))
+    return np.matmul(b, fractional.T)
 
-    ikappa = mk_function(n[0])
-    jkappa = mk_function(n[1])
-    kkappa = mk_function(n[2])
-    kgrid = np.empty(shape=(3, np.prod(n)))
-
-    k_cnt = 0
-    for i in ikappa:
-        for j in jkappa:
-            for k in kkappa:
-                kgrid[:, k_cnt] = np.matmul(b, [i, j, k])
-                k_cnt += 1
-
-    return kgrid
 
 # Sequence of points per dimension, defined by equation 1) in:
 # https://doi.org/10.1103/PhysRevB.16.1748
+# Returns k-points column-wise, shape (3, nk)
 def hexagonal_grid(n, b):
     assert len(n) == 3
+    fractional = fractional_grid(mk_function2(n[0]), mk_function2(n[1]), mk_function(n[2]))
+    return np.matmul(b, fractional.T)
+
+
+class IrreducibleGrid:
+    """
+    Irreducible k-points of a grid
+
+    :param kpoints: Irreducible k-points in fractional coordinates, shape (n_ir, 3)
+    :param weights: Number of grid points mapping to each irreducible point, shape (n_ir)
+    :param mapping: Index of the irreducible point for each point of the full grid, shape (nk)
+    """
+    def __init__(self, kpoints, weights, mapping):
+        self.kpoints = kpoints
+        self.weights = weights
+        self.mapping = mapping
+
+    def __len__(self):
+        return self.weights.size
+
+
+# Reduce a grid to the irreducible wedge of the Brillouin zone, using spglib
+#
+# n = Number of sampling points per dimension
+# cell = spglib cell (lattice, fractional positions, atomic numbers), lattice vectors row-wise
+# hexagonal = Reduce the grid of hexagonal_grid rather than grid
+#
+# Ordering of the full grid, and hence mapping, is consistent with grid and hexagonal_grid
+def irreducible_grid(n, cell, hexagonal=False, symprec=1.e-5, time_reversal=True) -> IrreducibleGrid:
+    import spglib
+    assert len(n) == 3
+    n = np.asarray(n, dtype=int)
+
+    if hexagonal:
+        fractional = fractional_grid(mk_function2(n[0]), mk_function2(n[1]), mk_function(n[2]))
+        is_shift = np.array([0, 0, int(even(n[2]))])
+    else:
+        fractional = fractional_grid(mk_function(n[0]), mk_function(n[1]), mk_function(n[2]))
+        is_shift = np.array([int(even(ni)) for ni in n])
+
+    spg_mapping, _ = spglib.get_ir_reciprocal_mesh(n, cell, is_shift=is_shift,
+                                                   is_time_reversal=time_reversal, symprec=symprec)
+
+    # spglib points are (address + shift/2) / n, indexed with the first dimension fastest
+    address = np.mod(np.rint(fractional * n - 0.5 * is_shift).astype(int), n)
+    spg_index = address[:, 0] + n[0] * (address[:, 1] + n[1] * address[:, 2])
+
+    representatives, mapping, weights = np.unique(spg_mapping[spg_index], return_inverse=True,
+                                                  return_counts=True)
+    # Index of each representative in this grid's ordering
+    grid_index = np.empty_like(spg_index)
+    grid_index[spg_index] = np.arange(0, spg_index.size)
 
-    u_p = mk_function2(n[0])
-    u_r = mk_function2(n[1])
-    u_s = mk_function(n[2])
-    kgrid = np.empty(shape=(3, np.prod(n)))
+    return IrreducibleGrid(fractional[grid_index[representatives]], weights, mapping.reshape(-1))
 
-    k_cnt = 0
-    for p in u_p:
-        for r in u_r:
-            for s in u_s:
-                kgrid[:, k_cnt] = np.matmul(b, [p,r,s])
-                k_cnt += 1
 
-    return kgrid
+# Number of irreducible k-points, without constructing the full grid in Cartesian coordinates
+def number_of_irreducible_kpoints(n, cell, hexagonal=False, symprec=1.e-5) -> int:
+    return len(irreducible_grid(n, cell, hexagonal=hexagonal, symprec=symprec))
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+
+from modules.electronic_structure.grids import monkhorst_pack
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for monkhorst_pack.py module """
+
+    def test_grid_against_loops(self):
+        n = [3, 4, 2]
+        b = np.array([[1., 0.2, 0.], [0., 1.1, 0.3], [0.1, 0., 0.9]])
+
+        ref_grid = np.empty(shape=(3, np.prod(n)))
+        k_cnt = 0
+        for i in monkhorst_pack.mk_function(n[0]):
+            for j in monkhorst_pack.mk_function(n[1]):
+                for k in monkhorst_pack.mk_function(n[2]):
+                    ref_grid[:, k_cnt] = np.matmul(b, [i, j, k])
+                    k_cnt += 1
+
+        self.assertTrue(np.allclose(monkhorst_pack.grid(n, b), ref_grid))
+
+
+    def test_irreducible_grid_silicon(self):
+        """ Shifted 4x4x4 grid for diamond silicon has 10 irreducible points """
+        lattice = 0.5 * 5.43 * np.array([[0., 1., 1.], [1., 0., 1.], [1., 1., 0.]])
+        cell = (lattice, [[0., 0., 0.], [0.25, 0.25, 0.25]], [14, 14])
+        n = [4, 4, 4]
+
+        ir_grid = monkhorst_pack.irreducible_grid(n, cell)
+        self.assertEqual(len(ir_grid), 10)
+        self.assertEqual(np.sum(ir_grid.weights), 64)
+        self.assertTrue(np.array_equal(np.bincount(ir_grid.mapping), ir_grid.weights))
+
+        # Each irreducible point is a point of the full grid, which maps to itself
+        full_grid = monkhorst_pack.fractional_grid(*[monkhorst_pack.mk_function(ni) for ni in n])
+        for i_ir, kpoint in enumerate(ir_grid.kpoints):
+            ik = np.where(np.all(np.isclose(full_grid, kpoint), axis=1))[0]
+            self.assertEqual(ik.size, 1)
+            self.assertEqual(ir_grid.mapping[ik[0]], i_ir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -45,3 +45,147 @@ class Atoms:
 class CoordinateType(Enum):
     XYZ = 1
     FRACTIONAL = 2
+
+
+class Structure:
+    """
+    Structure-of-arrays container for a collection of atoms.
+
+    Atomic numbers are stored as one int8 array and positions as one (N, 3)
+    float64 buffer, rather than as a list of Atom objects, each with its own array.
+    Slicing returns a Structure that shares memory with the original.
+
+    :param atomic_numbers: Atomic numbers, shape (N)
+    :param positions: Atomic positions, shape (N, 3)
+    :param lattice: Optional lattice vectors, stored column-wise
+    :param coordinate_type: Coordinate type of positions
+    """
+    def __init__(self, atomic_numbers, positions, lattice=None,
+                 coordinate_type: CoordinateType = CoordinateType.XYZ):
+        self.atomic_numbers = np.asarray(atomic_numbers, dtype=np.int8).reshape(-1)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        assert self.atomic_numbers.size == self.positions.shape[0], \
+            "Number of atomic numbers and positions differ"
+        self.lattice = None if lattice is None else np.asarray(lattice, dtype=np.float64)
+        if self.lattice is not None:
+            assert self.lattice.shape == (3, 3), "lattice.shape /= (3,3)"
+        assert isinstance(coordinate_type, CoordinateType)
+        self.coordinate_type = coordinate_type
+
+    @classmethod
+    def from_species(cls, species: List[str], positions, lattice=None,
+                     coordinate_type: CoordinateType = CoordinateType.XYZ):
+        """
+        Initialise from atomic symbols, consistent with the Atoms signature
+        """
+        atomic_numbers = elements.symbols_to_atomic_numbers(species)
+        return cls(atomic_numbers, positions, lattice, coordinate_type)
+
+    @classmethod
+    def from_atoms(cls, molecule: List[Atom], lattice=None,
+                   coordinate_type: CoordinateType = CoordinateType.XYZ):
+        """
+        Initialise from a list of Atom objects
+        """
+        atomic_numbers = [atom.atomic_number() for atom in molecule]
+        positions = np.empty(shape=(len(molecule), 3))
+        for ia, atom in enumerate(molecule):
+            positions[ia, :] = atom.position
+        return cls(atomic_numbers, positions, lattice, coordinate_type)
+
+    @classmethod
+    def from_ase(cls, ase_atoms):
+        """
+        Initialise from an ASE Atoms object. Positions are Cartesian.
+        ASE stores lattice vectors row-wise.
+        """
+        return cls(ase_atoms.get_atomic_numbers(), ase_atoms.get_positions(),
+                   lattice=np.transpose(np.asarray(ase_atoms.get_cell())),
+                   coordinate_type=CoordinateType.XYZ)
+
+    @classmethod
+    def from_spglib(cls, spg_molecule: tuple):
+        """
+        Initialise from an spglib (lattice, positions, numbers) tuple.
+        spglib stores lattice vectors row-wise and positions in fractional coordinates.
+        """
+        lattice, positions, atomic_numbers = spg_molecule[0:3]
+        return cls(atomic_numbers, positions,
+                   lattice=np.transpose(np.asarray(lattice)),
+                   coordinate_type=CoordinateType.FRACTIONAL)
+
+    def __len__(self) -> int:
+        return self.atomic_numbers.size
+
+    def __getitem__(self, indices):
+        """
+        Basic slices return views of the underlying arrays.
+        Index arrays and masks return copies, as per numpy.
+        """
+        if isinstance(indices, (int, np.integer)):
+            indices = slice(indices, indices + 1 if indices != -1 else None)
+        return Structure(self.atomic_numbers[indices], self.positions[indices],
+                         self.lattice, self.coordinate_type)
+
+    @property
+    def species(self) -> np.ndarray:
+        """
+        Atomic symbols, shape (N)
+        """
+        return elements.symbols[self.atomic_numbers]
+
+    def fractional_positions(self) -> np.ndarray:
+        """
+        Positions in fractional coordinates, shape (N, 3)
+        """
+        if self.coordinate_type == CoordinateType.FRACTIONAL:
+            return self.positions
+        assert self.lattice is not None, "Conversion requires lattice vectors"
+        # r = A f  ->  r^T = f^T A^T
+        return np.linalg.solve(self.lattice, self.positions.T).T
+
+    def cartesian_positions(self) -> np.ndarray:
+        """
+        Positions in Cartesian coordinates, shape (N, 3)
+        """
+        if self.coordinate_type == CoordinateType.XYZ:
+            return self.positions
+        assert self.lattice is not None, "Conversion requires lattice vectors"
+        return np.matmul(self.positions, self.lattice.T)
+
+    def to_atoms(self) -> List[Atom]:
+        """
+        Convert to a list of Atom objects.
+        Each atom's position is a view of a row of the positions buffer.
+        """
+        return [Atom(species, self.positions[ia]) for ia, species in enumerate(self.species)]
+
+    def to_ase(self):
+        """
+        Convert to an ASE Atoms object, in Cartesian coordinates
+        """
+        from ase.atoms import Atoms as ase_Atoms
+        cell = None if self.lattice is None else np.transpose(self.lattice)
+        return ase_Atoms(numbers=self.atomic_numbers.astype(int),
+                         positions=self.cartesian_positions(),
+                         cell=cell,
+                         pbc=self.lattice is not None)
+
+    def to_spglib(self) -> tuple:
+        """
+        Convert to an spglib (lattice, positions, numbers) tuple
+        """
+        assert self.lattice is not None, "spglib requires lattice vectors"
+        return (np.transpose(self.lattice), self.fractional_positions(), self.atomic_numbers.astype(np.intc))
+
+
+def as_structure(molecule, lattice=None,
+                 coordinate_type: CoordinateType = CoordinateType.XYZ) -> Structure:
+    """
+    Return molecule as a Structure, without copying if it already is one.
+    :param molecule: Structure or list of Atom objects
+    :return: Structure
+    """
+    if isinstance(molecule, Structure):
+        return molecule
+    return Structure.from_atoms(molecule, lattice, coordinate_type)
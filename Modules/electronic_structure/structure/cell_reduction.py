@@ -0,0 +1,147 @@
+# Niggli reduction of lattice vectors, and mapping positions between a cell
+# and its reduced cell.
+#
+# The reduced cell spans the same lattice with the shortest, most orthogonal basis.
+# Counting translations for a radial cut-off in the reduced basis avoids the
+# large integer ranges that highly skewed cells give.
+
+import numpy as np
+
+# Integer transformations of the Krivy-Gruber algorithm, applied as lattice @ M
+_swap_a_b = np.array([[0, -1, 0], [-1, 0, 0], [0, 0, -1]])
+_swap_b_c = np.array([[-1, 0, 0], [0, 0, -1], [0, -1, 0]])
+_a_plus_b_plus_c = np.array([[1, 0, 1], [0, 1, 1], [0, 0, 1]])
+
+
+def _metric(lattice) -> tuple:
+    """
+    Niggli parameters (A, B, C, xi, eta, zeta) of lattice vectors, stored column-wise
+    """
+    g = np.matmul(lattice.T, lattice)
+    return g[0, 0], g[1, 1], g[2, 2], 2 * g[1, 2], 2 * g[0, 2], 2 * g[0, 1]
+
+
+def _sign(x: float, eps: float) -> int:
+    if x > eps:
+        return 1
+    if x < -eps:
+        return -1
+    return 0
+
+
+def niggli_reduce(lattice, tolerance=1.e-5, max_iterations=1000) -> tuple:
+    """
+    Niggli-reduced cell, using the algorithm of Krivy and Gruber,
+    Acta Cryst. A32, 297 (1976), with the tolerances of Grosse-Kunstleve et al.,
+    Acta Cryst. A60, 1 (2004).
+
+    :param lattice: lattice vectors, stored column-wise
+    :param tolerance: Relative tolerance in comparisons of the metric
+    :param max_iterations: Max number of reduction steps
+    :return: reduced_lattice, transformation. Reduced lattice vectors are stored column-wise,
+    and reduced_lattice = lattice @ transformation, where transformation is an integer matrix
+    with determinant 1
+    """
+    lattice = np.asarray(lattice, dtype=float)
+    assert lattice.shape == (3, 3), "lattice.shape /= (3,3)"
+    volume = abs(np.linalg.det(lattice))
+    assert volume > 0., "Lattice vectors are linearly dependent"
+    eps = tolerance * volume ** (2. / 3.)
+
+    transformation = np.identity(3, dtype=int)
+
+    def apply(m):
+        nonlocal lattice, transformation
+        lattice = np.matmul(lattice, m)
+        transformation = np.matmul(transformation, m)
+
+    for _ in range(0, max_iterations):
+        A, B, C, xi, eta, zeta = _metric(lattice)
+
+        # Step 1
+        if A > B + eps or (abs(A - B) <= eps and abs(xi) > abs(eta) + eps):
+            apply(_swap_a_b)
+            A, B, C, xi, eta, zeta = _metric(lattice)
+
+        # Step 2
+        if B > C + eps or (abs(B - C) <= eps and abs(eta) > abs(zeta) + eps):
+            apply(_swap_b_c)
+            continue
+
+        # Steps 3 and 4: Make xi, eta and zeta all positive, or all non-positive
+        l, m, n = _sign(xi, eps), _sign(eta, eps), _sign(zeta, eps)
+        if l * m * n == 1:
+            signs = [-1 if s == -1 else 1 for s in (l, m, n)]
+        else:
+            signs = [-1 if s == 1 else 1 for s in (l, m, n)]
+            if np.prod(signs) == -1:
+                # Retain a right-handed basis by also flipping a vector with a zero angle term
+                signs[[l, m, n].index(0)] *= -1
+        if signs != [1, 1, 1]:
+            apply(np.diag(signs))
+            A, B, C, xi, eta, zeta = _metric(lattice)
+
+        # Step 5
+        if abs(xi) > B + eps or (abs(xi - B) <= eps and 2 * eta < zeta - eps) or \
+                (abs(xi + B) <= eps and zeta < -eps):
+            apply(np.array([[1, 0, 0], [0, 1, -np.sign(xi)], [0, 0, 1]], dtype=int))
+            continue
+
+        # Step 6
+        if abs(eta) > A + eps or (abs(eta - A) <= eps and 2 * xi < zeta - eps) or \
+                (abs(eta + A) <= eps and zeta < -eps):
+            apply(np.array([[1, 0, -np.sign(eta)], [0, 1, 0], [0, 0, 1]], dtype=int))
+            continue
+
+        # Step 7
+        if abs(zeta) > A + eps or (abs(zeta - A) <= eps and 2 * xi < eta - eps) or \
+                (abs(zeta + A) <= eps and eta < -eps):
+            apply(np.array([[1, -np.sign(zeta), 0], [0, 1, 0], [0, 0, 1]], dtype=int))
+            continue
+
+        # Step 8
+        total = xi + eta + zeta + A + B
+        if total < -eps or (abs(total) <= eps and 2 * (A + eta) + zeta > eps):
+            apply(_a_plus_b_plus_c)
+            continue
+
+        return lattice, transformation
+
+    raise RuntimeError("Niggli reduction did not converge in " + str(max_iterations) + " iterations")
+
+
+def inverse_transformation(transformation) -> np.ndarray:
+    """
+    Inverse of an integer transformation with determinant +/- 1, which is also an integer matrix
+    """
+    return np.rint(np.linalg.inv(transformation)).astype(int)
+
+
+def to_reduced_fractional(fractional, transformation, wrap=True) -> np.ndarray:
+    """
+    Map fractional positions in a cell to fractional positions in its reduced cell
+
+    :param fractional: Fractional positions w.r.t. the original lattice, shape (n_atoms, 3)
+    :param transformation: As returned by niggli_reduce
+    :param wrap: Wrap positions into the reduced cell, [0, 1)
+    :return: Fractional positions w.r.t. the reduced lattice, shape (n_atoms, 3)
+    """
+    reduced = np.matmul(np.asarray(fractional, dtype=float), inverse_transformation(transformation).T)
+    if wrap:
+        reduced -= np.floor(reduced)
+    return reduced
+
+
+def from_reduced_fractional(fractional, transformation, wrap=False) -> np.ndarray:
+    """
+    Map fractional positions in a reduced cell back to fractional positions in the original cell
+
+    :param fractional: Fractional positions w.r.t. the reduced lattice, shape (n_atoms, 3)
+    :param transformation: As returned by niggli_reduce
+    :param wrap: Wrap positions into the original cell, [0, 1)
+    :return: Fractional positions w.r.t. the original lattice, shape (n_atoms, 3)
+    """
+    original = np.matmul(np.asarray(fractional, dtype=float), np.transpose(transformation))
+    if wrap:
+        original -= np.floor(original)
+    return original
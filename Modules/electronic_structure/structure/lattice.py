@@ -3,7 +3,9 @@
 import numpy as np
 import math
 
-from modules.maths.math import triple_product, angle_between_vectors
+from modules.electronic_structure.structure.cell_reduction import niggli_reduce
+from modules.maths.math import triple_product, angle_between_vectors, \
+    batch_triple_product, batch_norm, batch_angle_between_vectors
 
 
 def parallelpiped_volume(lattice_vectors):
@@ -53,6 +55,61 @@ def cell_angles(lattice, return_unit='radian'):
         quit("Return unit not valid: ", return_unit)
 
 
+def batch_parallelpiped_volume(lattices):
+    """
+    Volumes of a stack of parallepiped cells
+    :param lattices: lattice vectors, shape (M, 3, 3), each stored column-wise
+    :return: volumes, shape (M)
+    """
+    return batch_triple_product(lattices[..., 0], lattices[..., 1], lattices[..., 2])
+
+
+def batch_reciprocal_lattice_vectors(a):
+    """
+    Reciprocal lattice vectors of a stack of real-space lattice vectors {a}
+    :param a: lattice vectors, shape (M, 3, 3), each stored column-wise
+    :return: Reciprocal lattice vectors, shape (M, 3, 3), each stored column-wise
+    """
+    b = np.empty(shape=a.shape)
+    b[..., 0] = 2 * np.pi * np.cross(a[..., 1], a[..., 2]) / \
+                batch_triple_product(a[..., 0], a[..., 1], a[..., 2])[..., np.newaxis]
+    b[..., 1] = 2 * np.pi * np.cross(a[..., 2], a[..., 0]) / \
+                batch_triple_product(a[..., 1], a[..., 2], a[..., 0])[..., np.newaxis]
+    b[..., 2] = 2 * np.pi * np.cross(a[..., 0], a[..., 1]) / \
+                batch_triple_product(a[..., 2], a[..., 0], a[..., 1])[..., np.newaxis]
+    return b
+
+
+def batch_cell_lengths(lattices):
+    """
+    Lengths of the lattice vectors of a stack of cells
+    :param lattices: lattice vectors, shape (M, 3, 3), each stored column-wise
+    :return: lengths (|a|, |b|, |c|), shape (M, 3)
+    """
+    return batch_norm(np.swapaxes(lattices, -1, -2))
+
+
+def batch_cell_angles(lattices, return_unit='radian'):
+    """ Angles of a stack of parallelpiped unit cells. See cell_angles
+    :param lattices: lattice vectors, shape (M, 3, 3), each stored column-wise
+    :return: angles (alpha, beta, gamma), shape (M, 3)
+    """
+    assert lattices.shape[-2:] == (3, 3)
+    a = lattices[..., 0]
+    b = lattices[..., 1]
+    c = lattices[..., 2]
+    angles = np.stack((batch_angle_between_vectors(b, c),
+                       batch_angle_between_vectors(c, a),
+                       batch_angle_between_vectors(a, b)), axis=-1)
+
+    if return_unit == 'radian':
+        return angles
+    elif return_unit == 'degrees':
+        return angles * (180. / np.pi)
+    else:
+        quit("Return unit not valid: ", return_unit)
+
+
 def simple_cubic_cell_translation_integers(lattice, cutoff: float):
     """
     Get the max translation integers required to cut a sphere of radius 'cutoff'
@@ -106,7 +163,8 @@ def translation_integers_for_radial_cutoff(lattice, cutoff: float) :
     a = lattice[:, 0]
     b = lattice[:, 1]
     c = lattice[:, 2]
-    vol = triple_product(a, b, c)
+    # Left-handed cells have a negative triple product
+    vol = abs(triple_product(a, b, c))
 
     # May be no need to evaluate the max here but can't hurt
     n0 = max(cutoff * np.linalg.norm(np.cross(b, c)) / vol, cutoff / np.linalg.norm(a))
@@ -153,22 +211,81 @@ def get_extremal_integers(n, m, l):
     return extremal_integers.transpose()
 
 
-def lattice_sum(lattice: np.ndarray, n, cutoff):
+def translation_integer_grid(n) -> np.ndarray:
+    """
+    All integer triplets (i, j, k) with -n[0] <= i <= n[0], -n[1] <= j <= n[1]
+    and -n[2] <= k <= n[2], generated in one shot.
+
+    Ordering is consistent with:
+
+    for k in range(-n[2], n[2]+1):
+      for j in range(-n[1], n[1]+1):
+        for i in range(-n[0], n[0]+1):
+
+    :param n: max translation integers, as returned by translation_integers_for_radial_cutoff
+    :return: integers, shape (N, 3), where N = prod(2n + 1)
+    """
+    assert len(n) == 3, "len(n) /= 3"
+    i, j, k = [np.arange(-n_i, n_i + 1) for n_i in n]
+    kk, jj, ii = np.meshgrid(k, j, i, indexing='ij')
+    return np.column_stack((ii.ravel(), jj.ravel(), kk.ravel()))
+
+
+def lattice_sum(lattice: np.ndarray, n, cutoff, sort=False, reduce=True) -> np.ndarray:
     """
     Sum over translation vectors, using a radial criterion
-    :param lattice:
-    :param n:
-    :param cutoff:
-    :return:
+
+    The integer grid is symmetric about zero, [-n_i, n_i], and the radial
+    criterion is applied to all translations at once.
+
+    If n is None and reduce is True, integers are counted w.r.t. the Niggli-reduced
+    cell, which for skewed cells requires far fewer translations to be evaluated.
+    The translations returned, and their order, are the same either way.
+
+    :param lattice: lattice vectors, stored column-wise
+    :param n: max translation integers. If None, these are given by
+     translation_integers_for_radial_cutoff(lattice, cutoff)
+    :param cutoff: radial cut-off
+    :param sort: sort translations by shell, i.e. in order of increasing |T|
+    :param reduce: Count translations w.r.t. the reduced cell, when n is None
+    :return: translation vectors with |T| <= cutoff, stored row-wise, shape (N, 3)
     """
     assert lattice.shape == (3,3), "lattice.shape /= (3,3)"
-    assert len(n) == 3, "len(n) /= 3"
-    cutoff_squared = cutoff * cutoff
-    translations = []
-    for k in range(-n[2], n[2]):
-        for j in range(-n[1], n[1]):
-            for i in range(-n[0], n[0]):
-                r = np.matmul(lattice, np.array([i, j, k]))
-                if np.dot(r, r) <= cutoff_squared:
-                    translations.append(r)
-    return translations
+    if n is None and reduce:
+        integers = reduced_translation_integers(lattice, cutoff)
+    else:
+        if n is None:
+            n = translation_integers_for_radial_cutoff(lattice, cutoff)
+        assert len(n) == 3, "len(n) /= 3"
+        integers = translation_integer_grid(n)
+
+    # T^T = n^T A^T, for all integer triplets
+    translations = np.matmul(integers, lattice.T)
+    norms_squared = np.einsum('ij,ij->i', translations, translations)
+    within_cutoff = norms_squared <= cutoff * cutoff
+    translations = translations[within_cutoff]
+
+    if sort:
+        order = np.argsort(norms_squared[within_cutoff], kind='stable')
+        translations = translations[order]
+
+    return np.ascontiguousarray(translations)
+
+
+def reduced_translation_integers(lattice: np.ndarray, cutoff) -> np.ndarray:
+    """
+    Translation integers w.r.t. lattice, that enclose a radial cut-off, counted
+    in the Niggli-reduced cell.
+
+    Integers are ordered consistent with translation_integer_grid, such that lattice
+    sums are unchanged by the reduction, other than in the number of translations evaluated.
+
+    :param lattice: lattice vectors, stored column-wise
+    :param cutoff: radial cut-off
+    :return: integers, shape (N, 3)
+    """
+    reduced_lattice, transformation = niggli_reduce(lattice)
+    n = translation_integers_for_radial_cutoff(reduced_lattice, cutoff)
+    integers = np.matmul(translation_integer_grid(n), transformation.T)
+    order = np.lexsort((integers[:, 0], integers[:, 1], integers[:, 2]))
+    return integers[order]
@@ -0,0 +1,140 @@
+# Neighbour lists for finite and periodic systems, built with a k-d tree
+# rather than a dense distance matrix of an explicit supercell
+
+import numpy as np
+
+from modules.electronic_structure.structure.lattice import translation_integers_for_radial_cutoff, \
+    translation_integer_grid
+from modules.electronic_structure.structure.cell_reduction import niggli_reduce
+from modules.lazy_import import lazy_import
+
+spatial = lazy_import('scipy.spatial')
+
+
+class NeighbourList:
+    """
+    Neighbours of each centre atom, stored CSR-style.
+
+    Neighbours of centres[ic] are given by the slice offsets[ic]:offsets[ic+1] of
+    indices, shifts and distances. For neighbour j of atom i with lattice shift s,
+    the separation vector is positions[j] + lattice s - positions[i].
+
+    :param centres: Indices of the atoms for which neighbours are listed, shape (n_centres)
+    :param offsets: Start of each centre's neighbours, shape (n_centres + 1)
+    :param indices: Atomic indices of neighbours, shape (n_pairs)
+    :param shifts: Integer lattice shift of each neighbour image, shape (n_pairs, 3)
+    :param distances: Distance to each neighbour, shape (n_pairs)
+    """
+    def __init__(self, centres, offsets, indices, shifts, distances):
+        self.centres = centres
+        self.offsets = offsets
+        self.indices = indices
+        self.shifts = shifts
+        self.distances = distances
+
+    def __len__(self) -> int:
+        return self.centres.size
+
+    def neighbours(self, ic: int) -> np.ndarray:
+        """ Atomic indices of the neighbours of centre ic """
+        return self.indices[self.offsets[ic]:self.offsets[ic + 1]]
+
+    def coordination_numbers(self) -> np.ndarray:
+        """ Number of neighbours per centre, shape (n_centres) """
+        return np.diff(self.offsets)
+
+    def to_lists(self) -> list:
+        """ Neighbour indices as one array per centre, as returned by distance matrix-based routines """
+        return np.split(self.indices, self.offsets[1:-1])
+
+    def separation_vectors(self, positions, lattice=None) -> np.ndarray:
+        """
+        Separation vectors positions[j] + lattice s - positions[i], shape (n_pairs, 3)
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        i = np.repeat(self.centres, self.coordination_numbers())
+        vectors = positions[self.indices] - positions[i]
+        if lattice is not None:
+            vectors += np.matmul(self.shifts, np.transpose(lattice))
+        return vectors
+
+
+def neighbour_list(positions, cutoff: float, lattice=None, include_self=False,
+                   centres=None, reduce=True) -> NeighbourList:
+    """
+    List all neighbours within a radial cutoff, for finite or periodic systems.
+
+    For periodic systems, positions are wrapped into the unit cell and all periodic
+    images within the cutoff are found, such that skewed cells are treated
+    correctly and the cutoff can exceed the cell dimensions. Translation integers
+    are those of translation_integers_for_radial_cutoff, which bound the fractional
+    displacement in each direction by the cutoff over the interplanar spacing.
+
+    If reduce is True, positions are wrapped into the Niggli-reduced cell and translations
+    are counted w.r.t. it, which for skewed cells requires far fewer periodic images.
+    Returned shifts are always w.r.t. the input lattice vectors.
+
+    Cost scales linearly with the number of atoms, for fixed density and cutoff.
+
+    :param positions: Cartesian positions, shape (n_atoms, 3)
+    :param cutoff: Radial cut-off. Neighbours with distance <= cutoff are included
+    :param lattice: Optional lattice vectors, stored column-wise. If None, the system is finite
+    :param include_self: Include each centre as its own neighbour (zero shift)
+    :param centres: Optional indices of atoms for which to find neighbours. Defaults to all atoms
+    :param reduce: Search periodic images of the reduced cell
+    :return: NeighbourList
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    n_atoms = positions.shape[0]
+    centres = np.arange(0, n_atoms) if centres is None else np.asarray(centres, dtype=int).reshape(-1)
+    n_centres = centres.size
+
+    # Shifts are found w.r.t. the search lattice, then transformed to the input lattice
+    transformation = np.identity(3, dtype=int)
+
+    if lattice is None:
+        wrap = np.zeros(shape=(n_atoms, 3), dtype=int)
+        wrapped = positions
+        shifts = np.zeros(shape=(1, 3), dtype=int)
+        translations = np.zeros(shape=(1, 3))
+    else:
+        lattice = np.asarray(lattice, dtype=float)
+        assert lattice.shape == (3, 3), "lattice.shape /= (3,3)"
+        if reduce:
+            lattice, transformation = niggli_reduce(lattice)
+        fractional = np.linalg.solve(lattice, positions.T).T
+        wrap = -np.floor(fractional).astype(int)
+        wrapped = np.matmul(fractional + wrap, lattice.T)
+        shifts = translation_integer_grid(translation_integers_for_radial_cutoff(lattice, cutoff))
+        translations = np.matmul(shifts, lattice.T)
+
+    # |r_j + T - r_i| = |r_j - (r_i - T)|: Query all shifted centres against one tree of atoms
+    shifted_centres = (wrapped[centres][np.newaxis, :, :] - translations[:, np.newaxis, :]).reshape(-1, 3)
+    pairs = spatial.cKDTree(shifted_centres).sparse_distance_matrix(spatial.cKDTree(wrapped), cutoff, output_type='ndarray')
+
+    i_shift, ic = np.divmod(pairs['i'], n_centres)
+    j = pairs['j']
+    distances = pairs['v']
+
+    if not include_self:
+        is_self = (centres[ic] == j) & np.all(shifts[i_shift] == 0, axis=1)
+        i_shift, ic, j, distances = i_shift[~is_self], ic[~is_self], j[~is_self], distances[~is_self]
+
+    # Shifts w.r.t. the input (unwrapped) positions
+    pair_shifts = np.matmul(shifts[i_shift] + wrap[j] - wrap[centres[ic]], transformation.T)
+
+    order = np.lexsort((pair_shifts[:, 2], pair_shifts[:, 1], pair_shifts[:, 0], j, ic))
+    offsets = np.zeros(shape=n_centres + 1, dtype=int)
+    offsets[1:] = np.cumsum(np.bincount(ic, minlength=n_centres))
+
+    return NeighbourList(centres, offsets, j[order], pair_shifts[order], distances[order])
+
+
+def surface_atoms(neighbours: NeighbourList, n_neighbours_bulk: int) -> np.ndarray:
+    """
+    Atoms with fewer neighbours than an atom in the bulk
+    :param neighbours: Neighbour list
+    :param n_neighbours_bulk: Number of neighbours of a bulk atom
+    :return: Atomic indices of surface atoms
+    """
+    return neighbours.centres[neighbours.coordination_numbers() < n_neighbours_bulk]
@@ -71,56 +71,233 @@ def supercell_limits(n, centred_on_zero = False):
 # n: Total number of translations in each dimension
 # centred_on_zero: Is the supercell centred on the translation (and hence indices) (0,0,0) ?
 #
-#  TODO(Alex) Write a smarter way of doing this with analytic expressions
-#  Can compare to this as a point of reference
+# Flattened indices run fastest in x, such that index = ix + n[0] * (iy + n[1] * iz)
 #
 def flatten_supercell_limits(m, n, centred_on_zero = False):
     assert(len(m) == 3)
     assert(len(n) == 3)
+    return int(ravel_cell_indices(m, n, centred_on_zero=centred_on_zero))
 
-    index_map = np.zeros(shape=(n[0],n[1],n[2]), dtype=int)
-    flattened_index = 0
-    for iz in range(0, n[2]):
-        for iy in range(0, n[1]):
-            for ix in range(0, n[0]):
-                index_map[ix,iy,iz] = flattened_index
-                flattened_index += 1
-
-    ix = m[0]
-    iy = m[1]
-    iz = m[2]
 
+def _cell_index_offset(n, centred_on_zero: bool) -> np.ndarray:
+    """ Offset such that cell indices + offset lie in [0, n_i) """
     if centred_on_zero:
         limits = supercell_limits(n, centred_on_zero=centred_on_zero)
-        ix += -limits[0].min
-        iy += -limits[1].min
-        iz += -limits[2].min
+        return np.array([-limit.min for limit in limits])
+    return np.zeros(3, dtype=int)
 
-    return index_map[ix,iy,iz]
 
-# Lattice vectors stored columnwise
-def translation_vectors(lattice, n, centred_on_zero = False):
+def ravel_cell_indices(m, n, centred_on_zero = False):
+    """
+    Map cell indices to flattened indices, in O(1) per cell:
+    index = ix + n[0] * (iy + n[1] * iz)
 
-    limits = supercell_limits(n, centred_on_zero = centred_on_zero)
-    translations = []
+    :param m: Cell indices, shape (3) or (n_cells, 3)
+    :param n: Total number of translations in each dimension
+    :param centred_on_zero: Is the supercell centred on the translation (0,0,0) ?
+    Same convention as supercell_limits
+    :return: Flattened index, or indices with shape (n_cells)
+    """
+    assert len(n) == 3, "Expect three integers"
+    m = np.asarray(m, dtype=int)
+    assert m.shape[-1] == 3, "Expect three indices per cell"
+    shifted = m + _cell_index_offset(n, centred_on_zero)
+    return np.ravel_multi_index(tuple(np.moveaxis(shifted, -1, 0)), tuple(n), order='F')
+
+
+def unravel_cell_indices(indices, n, centred_on_zero = False) -> np.ndarray:
+    """
+    Map flattened indices back to cell indices. Inverse of ravel_cell_indices.
+
+    :param indices: Flattened index or indices, shape (n_cells)
+    :param n: Total number of translations in each dimension
+    :param centred_on_zero: Is the supercell centred on the translation (0,0,0) ?
+    :return: Cell indices, shape (3) or (n_cells, 3)
+    """
+    assert len(n) == 3, "Expect three integers"
+    m = np.stack(np.unravel_index(indices, tuple(n), order='F'), axis=-1)
+    return m - _cell_index_offset(n, centred_on_zero)
+
+
+def translation_integers(n, centred_on_zero = False) -> np.ndarray:
+    """
+    Integer translations of all cells in an n[0] x n[1] x n[2] supercell,
+    with the x index running fastest, consistent with:
 
     for iz in range(limits[2].min, limits[2].max):
         for iy in range(limits[1].min, limits[1].max):
             for ix in range(limits[0].min, limits[0].max):
-                translations.append(np.matmul(lattice, np.array([ix, iy, iz])))
 
-    return translations
+    :param n: Number of translations in each dimension
+    :param centred_on_zero: Is the supercell centred on the translation (0,0,0) ?
+    :return: integers, shape (n_cells, 3)
+    """
+    limits = supercell_limits(n, centred_on_zero = centred_on_zero)
+    ix, iy, iz = [np.arange(limit.min, limit.max) for limit in limits]
+    iz, iy, ix = np.meshgrid(iz, iy, ix, indexing='ij')
+    return np.column_stack((ix.ravel(), iy.ravel(), iz.ravel()))
+
+
+def translation_array(lattice, n, centred_on_zero = False) -> np.ndarray:
+    """
+    Translation vectors of all cells in the supercell, stored row-wise
+
+    :param lattice: Lattice vectors stored columnwise
+    :param n: Number of translations in each dimension
+    :param centred_on_zero: Is the supercell centred on the translation (0,0,0) ?
+    :return: translations, shape (n_cells, 3)
+    """
+    return np.matmul(translation_integers(n, centred_on_zero), np.transpose(lattice))
+
+
+# Lattice vectors stored columnwise
+# Returns a list of translation vectors, each a view of a row of translation_array
+def translation_vectors(lattice, n, centred_on_zero = False):
+    return list(translation_array(lattice, n, centred_on_zero = centred_on_zero))
+
+
+def supercell_matrix_translations(P) -> np.ndarray:
+    """
+    Integer translations of the unit cells contained in the supercell
+    (a, b, c) P, for any non-singular integer matrix P (not just diagonal).
+
+    Candidate integers are taken from the bounding box of the supercell, in units of
+    the unit cell, and only those with fractional supercell coordinates in [0, 1) are kept.
+
+    :param P: Integer transformation matrix, shape (3, 3), such that supercell = lattice P
+    :return: integers, shape (|det P|, 3)
+    """
+    P = np.asarray(P)
+    assert P.shape == (3, 3), "P.shape /= (3,3)"
+    n_cells = int(round(abs(np.linalg.det(P))))
+    assert n_cells > 0, "Supercell matrix is singular"
+
+    # Corners of the supercell, in units of the unit cell
+    corners = np.matmul(np.array([[i, j, k] for i in (0, 1) for j in (0, 1) for k in (0, 1)]), P.T)
+    n_min = corners.min(axis=0)
+    n_max = corners.max(axis=0)
+    ix, iy, iz = [np.arange(n_min[i], n_max[i] + 1) for i in range(0, 3)]
+    iz, iy, ix = np.meshgrid(iz, iy, ix, indexing='ij')
+    candidates = np.column_stack((ix.ravel(), iy.ravel(), iz.ravel()))
+
+    # Fractional coordinates w.r.t. the supercell: f = P^{-1} m
+    tol = 1.e-8
+    fractional = np.linalg.solve(P, candidates.T).T
+    inside = np.all((fractional > -tol) & (fractional < 1. - tol), axis=1)
+    integers = candidates[inside]
+    assert integers.shape[0] == n_cells, "Number of cells found /= |det P|"
+    return integers
 
 
 # unit_cell = atomic positions in fractional or angstrom
-# translations = list of translation vectors in same units
+# translations = list or array of translation vectors in same units
+#
+# If unit_cell is an atoms.Structure, an atoms.Structure is returned.
+# If unit_cell is a list of atoms.Atom, a list of atoms.Atom is returned,
+# for which each position is a view of a row of one positions array
 def build_supercell(unit_cell, translations):
-    supercell = []
-    for translation in translations:
-        for atom in unit_cell:
-            position = translation + atom.position
-            supercell.append(atoms.Atom(atom.species, position))
-    return supercell
+    translations = np.asarray(translations).reshape(-1, 3)
+
+    if isinstance(unit_cell, atoms.Structure):
+        return atoms.Structure(np.tile(unit_cell.atomic_numbers, translations.shape[0]),
+                               supercell_positions(unit_cell.positions, translations),
+                               unit_cell.lattice, unit_cell.coordinate_type)
+
+    species = [atom.species for atom in unit_cell]
+    basis_positions = np.array([atom.position for atom in unit_cell], dtype=float).reshape(-1, 3)
+    positions = supercell_positions(basis_positions, translations)
+    n_basis = len(species)
+    return [atoms.Atom(species[ia % n_basis], position) for ia, position in enumerate(positions)]
+
+
+def supercell_positions(basis_positions, translations) -> np.ndarray:
+    """
+    Broadcast basis positions against translations:
+    (n_cells, 1, 3) + (1, n_basis, 3) -> (n_cells * n_basis, 3)
+
+    Atoms are ordered by cell, then by basis index, such that the global index
+    of basis atom ib in cell ic is ic * n_basis + ib.
+
+    :param basis_positions: Positions of basis atoms, shape (n_basis, 3)
+    :param translations: Translation vectors, shape (n_cells, 3)
+    :return: Supercell positions, shape (n_cells * n_basis, 3)
+    """
+    basis_positions = np.asarray(basis_positions).reshape(-1, 3)
+    translations = np.asarray(translations).reshape(-1, 3)
+    return (translations[:, np.newaxis, :] + basis_positions[np.newaxis, :, :]).reshape(-1, 3)
+
+
+def build_supercell_from_matrix(unit_cell: atoms.Structure, P) -> atoms.Structure:
+    """
+    Build the supercell (a, b, c) P for any non-singular integer matrix P
+
+    :param unit_cell: Unit cell, with lattice vectors stored columnwise
+    :param P: Integer transformation matrix, shape (3, 3)
+    :return: Supercell with Cartesian positions and lattice vectors lattice P
+    """
+    assert unit_cell.lattice is not None, "unit_cell requires lattice vectors"
+    translations = np.matmul(supercell_matrix_translations(P), unit_cell.lattice.T)
+    cartesian_cell = atoms.Structure(unit_cell.atomic_numbers, unit_cell.cartesian_positions())
+    super_cell = build_supercell(cartesian_cell, translations)
+    super_cell.lattice = np.matmul(unit_cell.lattice, P)
+    return super_cell
+
+
+def iter_supercell_blocks(unit_cell: atoms.Structure, lattice, n, centred_on_zero = False,
+                          cells_per_block = 4096):
+    """
+    Lazily generate the supercell in blocks of cells, such that the full set of
+    translations and positions is never held in memory at once.
+
+    Cell ordering is the same as translation_integers. Translation integers for each
+    block are generated arithmetically from the flattened cell index.
+
+    :param unit_cell: Unit cell, with positions in the same units as lattice
+    :param lattice: Lattice vectors stored columnwise
+    :param n: Number of translations in each dimension
+    :param centred_on_zero: Is the supercell centred on the translation (0,0,0) ?
+    :param cells_per_block: Maximum number of cells per block
+    :return: Generator of (index of first cell in the block, atoms.Structure of the block)
+    """
+    limits = supercell_limits(n, centred_on_zero = centred_on_zero)
+    shape = [limit.max - limit.min for limit in limits]
+    offset = np.array([limit.min for limit in limits])
+    n_cells = int(np.prod(shape))
+
+    for first_cell in range(0, n_cells, cells_per_block):
+        cell_indices = np.arange(first_cell, min(first_cell + cells_per_block, n_cells))
+        integers = np.column_stack(np.unravel_index(cell_indices, shape, order='F')) + offset
+        translations = np.matmul(integers, np.transpose(lattice))
+        yield first_cell, build_supercell(unit_cell, translations)
+
+
+class CellAtomIndices:
+    """
+    Global atomic indices of the atoms in each cell of a supercell, as built by
+    build_supercell. Indices are computed arithmetically on access, rather than stored:
+    cells[ic] = range(ic * n_basis, (ic + 1) * n_basis)
+    """
+    def __init__(self, n_basis: int, n_cells: int):
+        self.n_basis = n_basis
+        self.n_cells = n_cells
+
+    def __len__(self) -> int:
+        return self.n_cells
+
+    def __getitem__(self, cell_index: int) -> range:
+        if cell_index < 0:
+            cell_index += self.n_cells
+        if not 0 <= cell_index < self.n_cells:
+            raise IndexError("cell index out of range")
+        return range(cell_index * self.n_basis, (cell_index + 1) * self.n_basis)
+
+    def __iter__(self):
+        for cell_index in range(0, self.n_cells):
+            yield self[cell_index]
+
+    def cell_of_atom(self, atom_index):
+        """ Cell index and basis index of global atom index/indices """
+        return np.divmod(atom_index, self.n_basis)
 
 
 # TODO(Alex) Give this funciton a better name
@@ -128,16 +305,7 @@ def build_supercell(unit_cell, translations):
 # each basis atom in the cell  and n =  n1*n2*n3 is the total number of
 # unit cells in the supercell
 def list_global_atom_indices_per_cells(unit_cell, translations):
-    cells = []
-    iatom = 0
-    for translation in translations:
-        cell = []
-        for atom in unit_cell:
-            cell.append(iatom)
-            iatom += 1
-        cells.append(cell)
-
-    return cells
+    return CellAtomIndices(len(unit_cell), len(translations))
 
 # Lattice vectors define the dimensions & shape of the box
 # def molecule_in_supercell(lattice):
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+
+from modules.electronic_structure.structure import atoms
+from modules.electronic_structure.structure.bravais import face_centred_cubic
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for the Structure class of atoms.py """
+
+    def setUp(self):
+        self.lattice_vectors = face_centred_cubic(5.43)
+        self.fractional = np.array([[0., 0., 0.], [0.25, 0.25, 0.25]])
+        self.cartesian = np.matmul(self.lattice_vectors, self.fractional.T).T
+
+
+    def test_legacy_round_trip(self):
+        """ List of Atom -> Structure -> list of Atom """
+        molecule = atoms.Atoms(['Si', 'O'], self.cartesian.tolist())
+        structure = atoms.Structure.from_atoms(molecule)
+
+        self.assertEqual(len(structure), 2)
+        self.assertEqual(structure.atomic_numbers.dtype, np.int8)
+        self.assertEqual(structure.positions.shape, (2, 3))
+        self.assertListEqual(structure.species.tolist(), ['Si', 'O'])
+
+        atom_list = structure.to_atoms()
+        self.assertListEqual([atom.species for atom in atom_list], ['Si', 'O'])
+        self.assertTrue(np.allclose(atom_list[1].position, self.cartesian[1]))
+
+        # Atom positions are views of the structure's buffer
+        self.assertTrue(np.shares_memory(atom_list[1].position, structure.positions))
+
+
+    def test_slices_are_views(self):
+        structure = atoms.Structure.from_species(['Si', 'Si'], self.cartesian)
+        first = structure[0]
+        self.assertEqual(len(first), 1)
+        self.assertTrue(np.shares_memory(first.positions, structure.positions))
+        self.assertIs(atoms.as_structure(structure), structure)
+
+
+    def test_coordinate_conversion(self):
+        structure = atoms.Structure.from_species(['Si', 'Si'], self.fractional,
+                                                 lattice=self.lattice_vectors,
+                                                 coordinate_type=atoms.CoordinateType.FRACTIONAL)
+        self.assertTrue(np.allclose(structure.cartesian_positions(), self.cartesian))
+
+        structure = atoms.Structure.from_species(['Si', 'Si'], self.cartesian,
+                                                 lattice=self.lattice_vectors)
+        self.assertTrue(np.allclose(structure.fractional_positions(), self.fractional))
+
+
+    def test_spglib_round_trip(self):
+        spg_molecule = (self.lattice_vectors.T, self.fractional, [14, 14])
+        structure = atoms.Structure.from_spglib(spg_molecule)
+        self.assertEqual(structure.coordinate_type, atoms.CoordinateType.FRACTIONAL)
+        self.assertTrue(np.allclose(structure.lattice, self.lattice_vectors))
+
+        lattice, positions, numbers = structure.to_spglib()
+        self.assertTrue(np.allclose(lattice, spg_molecule[0]))
+        self.assertTrue(np.allclose(positions, self.fractional))
+        self.assertListEqual(numbers.tolist(), [14, 14])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+
+from modules.electronic_structure.structure import cell_reduction
+from modules.electronic_structure.structure import lattice
+from modules.electronic_structure.structure.bravais import face_centred_cubic
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for cell_reduction.py module """
+
+    def setUp(self):
+        # Skewed description of the fcc lattice
+        self.primitive = face_centred_cubic(5.)
+        self.skewed = np.matmul(self.primitive, np.array([[1, 3, -2], [0, 1, 4], [0, 0, 1]]))
+
+    def test_niggli_reduce(self):
+        reduced, transformation = cell_reduction.niggli_reduce(self.skewed)
+
+        self.assertEqual(round(np.linalg.det(transformation)), 1)
+        self.assertTrue(np.allclose(np.matmul(self.skewed, transformation), reduced))
+
+        # fcc: Reduced cell vectors are the nearest-neighbour vectors, at 60 degrees to one another
+        self.assertTrue(np.allclose(np.linalg.norm(reduced, axis=0), 5. / np.sqrt(2.)))
+        self.assertTrue(np.allclose(lattice.cell_angles(reduced, return_unit='degrees'), 60.))
+
+    def test_fractional_positions_round_trip(self):
+        _, transformation = cell_reduction.niggli_reduce(self.skewed)
+        fractional = np.random.default_rng(0).random(size=(10, 3))
+
+        reduced = cell_reduction.to_reduced_fractional(fractional, transformation)
+        self.assertTrue(np.all((reduced >= 0.) & (reduced < 1.)))
+
+        # Same positions, modulo lattice vectors
+        difference = cell_reduction.from_reduced_fractional(reduced, transformation) - fractional
+        self.assertTrue(np.allclose(difference, np.rint(difference)))
+
+    def test_lattice_sum_in_reduced_cell(self):
+        """
+        Counting translations in the reduced cell should evaluate fewer translations,
+        without changing the lattice sum
+        """
+        cutoff = 12.
+        n_skewed = np.prod(2 * lattice.translation_integers_for_radial_cutoff(self.skewed, cutoff) + 1)
+        n_reduced = len(lattice.reduced_translation_integers(self.skewed, cutoff))
+        self.assertLess(10 * n_reduced, n_skewed)
+
+        translations = lattice.lattice_sum(self.skewed, None, cutoff, reduce=False)
+        self.assertTrue(np.array_equal(translations, lattice.lattice_sum(self.skewed, None, cutoff)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -88,6 +88,29 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(np.all(off_diagonals == 0))
 
 
+    def test_batch_cell_geometry(self):
+        """
+        Batched geometry functions should be identical to those
+        of the single-lattice functions, for each lattice in the stack
+        """
+        rng = np.random.default_rng(42)
+        lattices = np.stack([simple_cubic(5.), body_centred_cubic(4.2), face_centred_cubic(5.1)] +
+                            [rng.uniform(-1., 1., size=(3, 3)) + 4. * np.eye(3) for _ in range(0, 20)])
+
+        volumes = lattice.batch_parallelpiped_volume(lattices)
+        reciprocal_lattices = lattice.batch_reciprocal_lattice_vectors(lattices)
+        lengths = lattice.batch_cell_lengths(lattices)
+        angles = lattice.batch_cell_angles(lattices, return_unit='degrees')
+        self.assertEqual(reciprocal_lattices.shape, lattices.shape)
+        self.assertEqual(angles.shape, (lattices.shape[0], 3))
+
+        for i, lattice_vectors in enumerate(lattices):
+            self.assertEqual(volumes[i], lattice.parallelpiped_volume(lattice_vectors))
+            self.assertTrue(np.array_equal(reciprocal_lattices[i], lattice.reciprocal_lattice_vectors(lattice_vectors)))
+            self.assertTrue(np.array_equal(lengths[i], [np.linalg.norm(v) for v in lattice_vectors.T]))
+            self.assertTrue(np.array_equal(angles[i], lattice.cell_angles(lattice_vectors, return_unit='degrees')))
+
+
     def test_translation_integers_for_simple_cubic_cell(self):
         """
         For a cubic system, expect the naive expression
@@ -102,6 +125,72 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(np.all(integers == integers2))
 
 
+    def test_lattice_sum_against_loops(self):
+        """
+        Batched lattice sum should return the same translations, in the same order,
+        as looping over the integers [-n, n] and applying the radial criterion
+        per translation
+        """
+        lattice_vectors = face_centred_cubic(5.1)
+        cutoff = 12
+        n = lattice.translation_integers_for_radial_cutoff(lattice_vectors, cutoff)
+
+        ref_translations = []
+        for k in range(-n[2], n[2] + 1):
+            for j in range(-n[1], n[1] + 1):
+                for i in range(-n[0], n[0] + 1):
+                    r = np.matmul(lattice_vectors, np.array([i, j, k]))
+                    if np.dot(r, r) <= cutoff * cutoff:
+                        ref_translations.append(r)
+
+        translations = lattice.lattice_sum(lattice_vectors, n, cutoff)
+        self.assertEqual(translations.shape, (len(ref_translations), 3))
+        self.assertTrue(np.allclose(translations, np.asarray(ref_translations)))
+
+        # Default integers are those of translation_integers_for_radial_cutoff
+        self.assertTrue(np.allclose(translations, lattice.lattice_sum(lattice_vectors, None, cutoff)))
+
+
+    def test_lattice_sum_is_symmetric(self):
+        """
+        For every translation T in the sum, -T should also be present,
+        and sorting by shell should give non-decreasing |T|
+        """
+        lattice_vectors = body_centred_cubic(5.)
+        cutoff = 15
+        translations = lattice.lattice_sum(lattice_vectors, None, cutoff, sort=True)
+
+        self.assertTrue(np.allclose(translations[0], 0.))
+        norms = np.linalg.norm(translations, axis=1)
+        self.assertTrue(np.all(np.diff(norms) >= 0.))
+        self.assertTrue(np.all(norms <= cutoff))
+
+        as_set = {tuple(np.round(t, 8)) for t in translations}
+        self.assertTrue(all(tuple(np.round(-t, 8)) in as_set for t in translations))
+
+
+    def test_lattice_sum_of_left_handed_cell(self):
+        """
+        A left-handed cell, and the same cell with two lattice vectors swapped, have the
+        same translations. Both should match a brute-force sum over a large integer grid,
+        with or without cell reduction
+        """
+        lattice_vectors = np.array([[4.1, -3.763, -0.9],
+                                    [-0.845, -0.905, -0.755],
+                                    [-4.224, 1.672, 0.175]])
+        self.assertLess(np.linalg.det(lattice_vectors), 0.)
+        cutoff = 13.589
+
+        integers = lattice.translation_integer_grid([60, 60, 60])
+        ref_translations = np.matmul(integers, lattice_vectors.T)
+        ref_translations = ref_translations[np.linalg.norm(ref_translations, axis=1) <= cutoff]
+
+        for lattice_vectors in [lattice_vectors, lattice_vectors[:, [1, 0, 2]]]:
+            for reduce in [True, False]:
+                translations = lattice.lattice_sum(lattice_vectors, None, cutoff, reduce=reduce)
+                self.assertEqual(translations.shape, ref_translations.shape)
+
+
     # def get_extremal_translations(self, lattice_vectors, max_integers):
     #     """ Used by tests but not a test itself"""
     #     extremal_integers = lattice.get_extremal_integers(max_integers[0],
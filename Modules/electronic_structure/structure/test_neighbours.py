@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from scipy import spatial
+
+from modules.electronic_structure.structure import neighbours
+from modules.electronic_structure.structure import supercell
+from modules.electronic_structure.structure.bravais import simple_triclinic
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for neighbours.py module """
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.lattice_vectors = simple_triclinic(4.1, 5.3, 4.7, 1.3, 1.9, 1.2)
+        # Include positions outside of the unit cell, to test wrapping
+        fractional = rng.uniform(-0.5, 1.5, size=(12, 3))
+        self.positions = np.matmul(fractional, self.lattice_vectors.T)
+
+
+    def test_finite_against_distance_matrix(self):
+        cutoff = 4.
+        d = spatial.distance_matrix(self.positions, self.positions)
+        ref = [np.where((d[i, :] > 0.) & (d[i, :] <= cutoff))[0] for i in range(0, d.shape[0])]
+
+        neighbour_list = neighbours.neighbour_list(self.positions, cutoff)
+        for i, indices in enumerate(neighbour_list.to_lists()):
+            self.assertTrue(np.array_equal(indices, ref[i]))
+        self.assertTrue(np.all(neighbour_list.shifts == 0))
+
+
+    def test_periodic_against_explicit_supercell(self):
+        """
+        Neighbours of each atom, with a cutoff larger than the cell, should
+        match a brute-force search over an explicit supercell of images
+        """
+        cutoff = 7.5
+        n_atoms = self.positions.shape[0]
+        neighbour_list = neighbours.neighbour_list(self.positions, cutoff, lattice=self.lattice_vectors)
+
+        shifts = supercell.translation_integers([13, 13, 13], centred_on_zero=True)
+        images = (self.positions[np.newaxis, :, :] +
+                  np.matmul(shifts, self.lattice_vectors.T)[:, np.newaxis, :]).reshape(-1, 3)
+        d = spatial.distance_matrix(self.positions, images)
+
+        for i in range(0, n_atoms):
+            ref = np.where((d[i, :] > 0.) & (d[i, :] <= cutoff))[0]
+            ref_pairs = {(ia % n_atoms,) + tuple(shifts[ia // n_atoms]) for ia in ref}
+
+            begin, end = neighbour_list.offsets[i], neighbour_list.offsets[i + 1]
+            pairs = {(j,) + tuple(s) for j, s in zip(neighbour_list.indices[begin:end],
+                                                      neighbour_list.shifts[begin:end])}
+            self.assertSetEqual(pairs, ref_pairs)
+
+        vectors = neighbour_list.separation_vectors(self.positions, self.lattice_vectors)
+        self.assertTrue(np.allclose(np.linalg.norm(vectors, axis=1), neighbour_list.distances))
+
+
+    def test_centres_subset(self):
+        cutoff = 6.
+        full = neighbours.neighbour_list(self.positions, cutoff, lattice=self.lattice_vectors)
+        subset = neighbours.neighbour_list(self.positions, cutoff, lattice=self.lattice_vectors,
+                                           centres=[3, 7])
+        self.assertTrue(np.array_equal(subset.neighbours(0), full.neighbours(3)))
+        self.assertTrue(np.array_equal(subset.neighbours(1), full.neighbours(7)))
+        self.assertTrue(np.array_equal(subset.coordination_numbers(),
+                                       full.coordination_numbers()[[3, 7]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import numpy as np
+
+from modules.electronic_structure.structure import atoms
+from modules.electronic_structure.structure import supercell
+from modules.electronic_structure.structure.bravais import face_centred_cubic
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for supercell.py module """
+
+    def setUp(self):
+        self.lattice_vectors = face_centred_cubic(5.43)
+        positions = np.matmul(self.lattice_vectors, np.array([[0., 0., 0.], [0.25, 0.25, 0.25]]).T).T
+        self.unit_cell = atoms.Structure.from_species(['Si', 'Si'], positions, lattice=self.lattice_vectors)
+
+
+    def test_translation_vectors_against_loops(self):
+        n = [3, 2, 3]
+        for centred_on_zero in [False, True]:
+            limits = supercell.supercell_limits(n, centred_on_zero=centred_on_zero)
+            ref_translations = []
+            for iz in range(limits[2].min, limits[2].max):
+                for iy in range(limits[1].min, limits[1].max):
+                    for ix in range(limits[0].min, limits[0].max):
+                        ref_translations.append(np.matmul(self.lattice_vectors, np.array([ix, iy, iz])))
+
+            translations = supercell.translation_array(self.lattice_vectors, n, centred_on_zero)
+            self.assertTrue(np.allclose(translations, np.asarray(ref_translations)))
+
+
+    def test_ravel_cell_indices(self):
+        """ Analytic flattened indices against an explicit index map """
+        n = [3, 5, 3]
+        index_map = np.zeros(shape=(n[0], n[1], n[2]), dtype=int)
+        flattened_index = 0
+        for iz in range(0, n[2]):
+            for iy in range(0, n[1]):
+                for ix in range(0, n[0]):
+                    index_map[ix, iy, iz] = flattened_index
+                    flattened_index += 1
+
+        m = supercell.translation_integers(n, centred_on_zero=True)
+        indices = supercell.ravel_cell_indices(m, n, centred_on_zero=True)
+        self.assertTrue(np.array_equal(indices, index_map[m[:, 0] + 1, m[:, 1] + 2, m[:, 2] + 1]))
+        self.assertTrue(np.array_equal(indices, np.arange(0, np.prod(n))))
+        self.assertTrue(np.array_equal(supercell.unravel_cell_indices(indices, n, centred_on_zero=True), m))
+
+        self.assertEqual(supercell.flatten_supercell_limits([0, 0, 0], n, centred_on_zero=True), 22)
+        self.assertEqual(supercell.flatten_supercell_limits([2, 1, 0], n), index_map[2, 1, 0])
+
+
+    def test_build_supercell(self):
+        """ Structure and list of Atom unit cells give the same ordering of atoms """
+        translations = supercell.translation_vectors(self.lattice_vectors, [2, 2, 2])
+        super_cell = supercell.build_supercell(self.unit_cell, translations)
+        legacy_super_cell = supercell.build_supercell(self.unit_cell.to_atoms(), translations)
+
+        self.assertEqual(len(super_cell), 16)
+        self.assertEqual(len(legacy_super_cell), 16)
+        for ia, atom in enumerate(legacy_super_cell):
+            self.assertEqual(atom.species, 'Si')
+            self.assertTrue(np.allclose(atom.position, super_cell.positions[ia]))
+
+        # Atom 1 of cell 3
+        self.assertTrue(np.allclose(super_cell.positions[3 * 2 + 1],
+                                    translations[3] + self.unit_cell.positions[1]))
+
+        cells = supercell.list_global_atom_indices_per_cells(self.unit_cell, translations)
+        self.assertEqual(len(cells), 8)
+        self.assertListEqual(list(cells[3]), [6, 7])
+        self.assertListEqual(list(cells[-1]), [14, 15])
+
+
+    def test_supercell_matrix_translations(self):
+        # Conventional cubic cell from the FCC primitive cell
+        P = np.array([[-1, 1, 1], [1, -1, 1], [1, 1, -1]])
+        super_cell = supercell.build_supercell_from_matrix(self.unit_cell, P)
+        self.assertEqual(len(super_cell), 8)
+        self.assertTrue(np.allclose(super_cell.lattice, np.eye(3) * 5.43))
+
+        # All atoms lie inside the cubic cell, and are unique
+        fractional = super_cell.fractional_positions()
+        self.assertTrue(np.all((fractional > -1.e-8) & (fractional < 1. - 1.e-8)))
+        self.assertEqual(np.unique(np.round(fractional, 6), axis=0).shape[0], 8)
+
+        # Diagonal P is consistent with translation_integers
+        integers = supercell.supercell_matrix_translations(np.diag([2, 3, 1]))
+        self.assertTrue(np.array_equal(integers, supercell.translation_integers([2, 3, 1])))
+
+
+    def test_iter_supercell_blocks(self):
+        n = [3, 3, 3]
+        full = supercell.build_supercell(self.unit_cell,
+                                         supercell.translation_array(self.lattice_vectors, n, True))
+        blocks = list(supercell.iter_supercell_blocks(self.unit_cell, self.lattice_vectors, n,
+                                                      centred_on_zero=True, cells_per_block=5))
+        self.assertEqual(len(blocks), 6)
+        self.assertEqual(blocks[1][0], 5)
+        positions = np.concatenate([block.positions for _, block in blocks])
+        self.assertTrue(np.allclose(positions, full.positions))
+
+
+if __name__ == '__main__':
+    unittest.main()
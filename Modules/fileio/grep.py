@@ -1,34 +1,70 @@
-import subprocess
+import re
+from collections import deque
 
 
-# Python wrapper for grep
+# Python replacement for grep, performed in-process in a single pass over the file
 # Originally written in Work_2019/DL_POLY_DFTB+/python_plotting/extract.py
 #
 # Example usage:
 # extract(">> Charges saved for restart in charges.bin", fname, n_lines_before=1)
+#
+# Patterns are Python regular expressions
 
 grep_options = {'n_lines_before': '-B',
                 'n_lines_after': '-A'}
 
 
+# Line numbers (indexing from 1) of all lines matching each pattern, from one read of the file
+# patterns = {key: regular expression}
+# Returns {key: [line numbers]}
+def line_numbers(patterns: dict, fname: str) -> dict:
+    compiled = {key: re.compile(pattern) for key, pattern in patterns.items()}
+    matches = {key: [] for key in patterns}
+    with open(fname, 'r') as fid:
+        for i, line in enumerate(fid, start=1):
+            for key, regex in compiled.items():
+                if regex.search(line):
+                    matches[key].append(i)
+    return matches
+
+
 def extract(string: str, fname: str, **kwargs):
 
-    opts = ''
-    for key, value in kwargs.items():
-        opts += grep_options[key] + ' ' + str(value) + ' '
+    for key in kwargs.keys():
+        if key not in grep_options:
+            raise KeyError("Invalid grep option: " + key)
+    n_before = int(kwargs.get('n_lines_before', 0))
+    n_after = int(kwargs.get('n_lines_after', 0))
 
-    grep_str = "grep " + opts + " '" + string + "' " + fname
+    regex = re.compile(string)
+    before = deque(maxlen=n_before)
+    output = []
+    n_after_remaining = 0
+    prior = None
 
-    try:
-        output = subprocess.check_output(grep_str, shell=True).decode("utf-8")
-    except subprocess.CalledProcessError as grepexc:
-        print("subprocess error:", grepexc.returncode, "grep found:", grepexc.output)
-        output = grepexc.output
+    with open(fname, 'r') as fid:
+        for i, line in enumerate(fid, start=1):
+            if regex.search(line):
+                first = i - len(before)
+                # Separate non-contiguous groups of context, as grep does
+                if (n_before or n_after) and prior is not None and first > prior + 1:
+                    output.append('--\n')
+                output.extend(before)
+                output.append(line)
+                before.clear()
+                n_after_remaining = n_after
+                prior = i
+            elif n_after_remaining > 0:
+                output.append(line)
+                n_after_remaining -= 1
+                prior = i
+            elif n_before:
+                before.append(line)
 
-    return output
+    return "".join(line if line.endswith('\n') else line + '\n' for line in output)
 
 
 def number_of_string_matches(string, fname):
-    grep_str = "grep -o '" + string + "' "+fname+" | wc -l"
-    n_matches = subprocess.check_output(grep_str, shell=True).decode("utf-8")
-    return int(n_matches)
+    regex = re.compile(string)
+    with open(fname, 'r') as fid:
+        return sum(len(regex.findall(line)) for line in fid)
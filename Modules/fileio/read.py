@@ -1,29 +1,141 @@
 import typing
+import mmap
 import numpy as np
 import os
 
 # Read  xyz format
+# Returns the species and positions of the first frame
 def xyz(fname: str ) -> tuple:
 
     if not os.path.exists(fname):
         exit("File: "+fname+" does not exist")
 
-    fid = open(fname, "r")
-    data = fid.read()
-    fid.close()
+    with XYZTrajectory(fname) as trajectory:
+        names, pos = trajectory.frame(0)
 
-    natoms = int(data.splitlines()[0])
-    header = data.splitlines()[1]
-    names = []
-    pos = []
-    for line in data.splitlines()[2:]:
-        names.append(line.split()[0])
-        pos.append([float(x) for x in line.split()[1:]])
+    return (names.tolist(), pos.tolist())
 
-    assert(len(pos) == len(names))
 
-    return (names, pos)
+# Multi-frame xyz file (trajectory), with random access to frames.
+#
+# The file is memory-mapped and frame offsets are indexed once, in a single
+# pass over the file, such that only the frames accessed are parsed.
+# Coordinates are parsed in bulk, per frame.
+#
+# Example usage:
+# with XYZTrajectory('md.xyz') as trajectory:
+#     for species, positions in trajectory:
+#         ...
+#     species, positions = trajectory[-1]
+class XYZTrajectory:
+
+    # Bytes of the file searched for newlines at a time, when indexing
+    chunk_size = 1 << 26
+
+    def __init__(self, fname: str):
+        self.fname = fname
+        self._fid = open(fname, 'rb')
+        self._mmap = mmap.mmap(self._fid.fileno(), 0, access=mmap.ACCESS_READ)
+        self.offsets, self.n_atoms = self._index_frames()
+
+    def close(self):
+        self._mmap.close()
+        self._fid.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.n_atoms)
+
+    def __getitem__(self, i: int) -> tuple:
+        return self.frame(i)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self.frame(i)
+
+    # Byte offset of the start of each frame, and number of atoms per frame
+    # Newlines are found chunk-wise, such that memory use is independent of file size
+    def _index_frames(self) -> tuple:
+        buffer = self._mmap
+        size = len(buffer)
+        offsets = []
+        n_atoms = []
+
+        # Index of the line starting the next frame, and of the first line in the current chunk
+        next_frame_line = 0
+        first_line = 0
+        line_starts = np.zeros(shape=1, dtype=np.int64)
+        # A blank header line ends the trajectory
+        end_of_frames = False
+
+        for chunk_start in range(0, size, self.chunk_size):
+            chunk = np.frombuffer(buffer, dtype=np.uint8, count=min(self.chunk_size, size - chunk_start),
+                                  offset=chunk_start)
+            # Start of each line, beginning in this chunk, plus the (possibly partial) last line
+            line_starts = np.concatenate((line_starts, chunk_start + np.flatnonzero(chunk == 10) + 1))
+            n_lines = line_starts.size - 1
+
+            while next_frame_line < first_line + n_lines:
+                offset = int(line_starts[next_frame_line - first_line])
+                header = buffer[offset:buffer.find(b'\n', offset)].strip()
+                if not header:
+                    end_of_frames = True
+                    break
+                offsets.append(offset)
+                n_atoms.append(int(header))
+                next_frame_line += n_atoms[-1] + 2
+
+            if end_of_frames:
+                break
+
+            # Keep the last line start, which may be the start of a frame in the next chunk
+            first_line += n_lines
+            line_starts = line_starts[-1:]
+
+        # Final (blank or partial) line
+        if not end_of_frames and next_frame_line == first_line:
+            offset = int(line_starts[0])
+            header = buffer[offset:].strip()
+            if header:
+                offsets.append(offset)
+                n_atoms.append(int(header))
+
+        return np.array(offsets, dtype=np.int64), np.array(n_atoms, dtype=np.int64)
+
+    def header(self, i: int) -> str:
+        offset = self._mmap.find(b'\n', int(self.offsets[i])) + 1
+        return self._mmap[offset:self._mmap.find(b'\n', offset)].decode().rstrip('\r')
+
+    # Species, shape (n_atoms), and positions, shape (n_atoms, 3), of frame i
+    # Any columns following the positions (extended xyz) are ignored
+    def frame(self, i: int) -> tuple:
+        n_atoms = int(self.n_atoms[i])
+        start = self._mmap.find(b'\n', self._mmap.find(b'\n', int(self.offsets[i])) + 1) + 1
+
+        if n_atoms == 0:
+            return np.empty(shape=0, dtype=str), np.empty(shape=(0, 3))
+
+        end = start
+        for _ in range(0, n_atoms):
+            end = self._mmap.find(b'\n', end) + 1
+            if end == 0:
+                end = len(self._mmap)
+                break
+
+        tokens = np.array(self._mmap[start:end].split())
+        assert tokens.size % n_atoms == 0, "Inconsistent number of columns in frame " + str(i)
+        tokens = tokens.reshape(n_atoms, -1)
+        species = tokens[:, 0].astype(str)
+        positions = tokens[:, 1:4].astype(np.float64)
+        return species, positions
 
+    def positions(self, i: int) -> np.ndarray:
+        return self.frame(i)[1]
 
 
 # Experiment with reading
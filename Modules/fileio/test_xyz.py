@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+
+from modules.fileio import read, write
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for xyz reading and writing """
+
+    def test_trajectory_round_trip(self):
+        species = np.array(['Si', 'O', 'O'])
+        frames = [np.arange(9, dtype=float).reshape(3, 3) + 0.125 * i for i in range(5)]
+        headers = ['frame ' + str(i) for i in range(5)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'trajectory.xyz')
+            write.xyz_frames(file_name, species, frames[:3], headers[:3], buffer_size=1)
+            write.xyz_frames(file_name, species, frames[3:], headers[3:], append=True)
+
+            # Small chunks, such that frames span chunk boundaries
+            with mock.patch.object(read.XYZTrajectory, 'chunk_size', 16), \
+                    read.XYZTrajectory(file_name) as trajectory:
+                self.assertEqual(len(trajectory), 5)
+                self.assertEqual(trajectory.header(3), 'frame 3')
+                for i, (frame_species, positions) in enumerate(trajectory):
+                    self.assertTrue(np.array_equal(frame_species, species))
+                    self.assertTrue(np.allclose(positions, frames[i]))
+
+            names, positions = read.xyz(file_name)
+            self.assertEqual(names, ['Si', 'O', 'O'])
+            self.assertEqual(positions, frames[0].tolist())
+
+    def test_trailing_blank_lines(self):
+        species = np.array(['Si', 'O'])
+        frames = [np.arange(6, dtype=float).reshape(2, 3) + i for i in range(2)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'trajectory.xyz')
+            write.xyz_frames(file_name, species, frames, ['frame 0', 'frame 1'])
+            with open(file_name, 'r') as fid:
+                contents = fid.read()
+
+            for n_blank in range(1, 9):
+                with open(file_name, 'w') as fid:
+                    fid.write(contents + '\n' * n_blank)
+
+                # All chunk sizes, such that the run of blank lines crosses chunk boundaries
+                for chunk_size in list(range(1, len(contents) + n_blank + 1)) + [1 << 26]:
+                    with mock.patch.object(read.XYZTrajectory, 'chunk_size', chunk_size), \
+                            read.XYZTrajectory(file_name) as trajectory:
+                        self.assertEqual(len(trajectory), 2)
+                        self.assertTrue(np.allclose(trajectory.positions(1), frames[1]))
+
+if __name__ == '__main__':
+    unittest.main()
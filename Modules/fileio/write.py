@@ -1,19 +1,40 @@
+import numpy as np
 
-# Write structure in xyz format
-# Input = list of atoms.Atom i.e. [atoms.Atom(species,pos), atoms.Atom(species,pos), ...]
-def xyz_string(molecule, header = None):
+from modules.electronic_structure.structure import atoms
+
+# Single frame in xyz format
+# Formatting is performed in one operation over the whole frame, rather than per atom
+# species: shape (n_atoms), positions: shape (n_atoms, 3)
+def xyz_frame_string(species, positions, header = None, fmt = '%.8f') -> str:
     hdr = ''
     if header != None:
         hdr += header
 
-    string = str(len(molecule)) + '\n'
-    string += hdr + '\n'
+    n_atoms = len(species)
+    positions = np.asarray(positions, dtype=np.float64).reshape(n_atoms, 3)
 
-    for atom in molecule:
-        string += atom.species + " " + "".join(str(atom.position))[1:-1] + '\n'
+    # Interleave species and coordinates, such that each row is (symbol, x, y, z)
+    values = np.empty(shape=(n_atoms, 4), dtype=object)
+    values[:, 0] = species
+    values[:, 1:] = positions
+    line_fmt = '%s ' + ' '.join([fmt] * 3) + '\n'
 
+    string = str(n_atoms) + '\n' + hdr + '\n'
+    string += (line_fmt * n_atoms) % tuple(values.ravel())
     return string
 
+# Write structure in xyz format
+# Input = list of atoms.Atom i.e. [atoms.Atom(species,pos), atoms.Atom(species,pos), ...]
+# or atoms.Structure
+def xyz_string(molecule, header = None):
+    if isinstance(molecule, atoms.Structure):
+        species, positions = molecule.species, molecule.positions
+    else:
+        species = [atom.species for atom in molecule]
+        positions = [atom.position for atom in molecule]
+
+    return xyz_frame_string(species, positions, header)
+
 def xyz(file_name, molecule, header = None):
     if file_name[-4:] != ".xyz":
         file_name += ".xyz"
@@ -23,6 +44,31 @@ def xyz(file_name, molecule, header = None):
     fid.close()
     return
 
+# Write multiple frames (a trajectory) in xyz format
+# species: shape (n_atoms), common to all frames
+# frames: Iterable of positions, each of shape (n_atoms, 3). Can be a generator, such that
+# the full trajectory is never held in memory
+# headers: Optional iterable of comment lines, one per frame
+# buffer_size: Bytes of formatted frames accumulated before each write
+def xyz_frames(file_name, species, frames, headers = None, append = False, fmt = '%.8f',
+               buffer_size = 1 << 24):
+    mode = "a" if append else "w"
+    if headers is None:
+        headers = iter(lambda: None, 0)
+
+    with open(file_name, mode) as fid:
+        buffer = []
+        n_bytes = 0
+        for positions, header in zip(frames, headers):
+            buffer.append(xyz_frame_string(species, positions, header, fmt))
+            n_bytes += len(buffer[-1])
+            if n_bytes >= buffer_size:
+                fid.write("".join(buffer))
+                buffer = []
+                n_bytes = 0
+        fid.write("".join(buffer))
+    return
+
 # Also accepted by periodic xTB
 # TODO(Alex) Be able to pass lattice vectors instead of lattice_opts
 # TODO(Alex) Pass cell positions in fractional coordinates
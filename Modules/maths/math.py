@@ -4,6 +4,19 @@ import numpy as np
 def triple_product(a, b, c):
     return np.dot(a, np.cross(b,c))
 
+# a . b for stacks of vectors, shape (..., 3)
+# matmul is used, rather than einsum, as it gives results identical to np.dot
+def batch_dot(a, b):
+    return np.matmul(a[..., np.newaxis, :], b[..., :, np.newaxis])[..., 0, 0]
+
+# a. (b ^ c) for stacks of vectors, shape (..., 3)
+def batch_triple_product(a, b, c):
+    return batch_dot(a, np.cross(b, c))
+
+# |v| for stacks of vectors, shape (..., 3), identical to np.linalg.norm of each vector
+def batch_norm(v):
+    return np.sqrt(batch_dot(v, v))
+
 def unit_vector(vector):
     """ Returns the unit vector of the vector.  """
     return vector / np.linalg.norm(vector)
@@ -19,3 +32,11 @@ def angle_between_vectors(v1, v2):
     v2 = unit_vector(v2)
     return np.arccos(np.clip(np.dot(v1, v2), -1.0, 1.0))
 
+def batch_angle_between_vectors(v1, v2):
+    """ Angles in radians between stacks of vectors 'v1' and 'v2',
+        of shape (..., 3). See angle_between_vectors.
+    """
+    v1 = v1 / batch_norm(v1)[..., np.newaxis]
+    v2 = v2 / batch_norm(v2)[..., np.newaxis]
+    return np.arccos(np.clip(batch_dot(v1, v2), -1.0, 1.0))
+
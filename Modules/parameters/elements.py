@@ -1,3 +1,15 @@
+# Periodic table.
+#
+# Dictionaries for single look-ups, and arrays indexed by atomic number for
+# converting and tabulating whole structures at once. Index 0 is a placeholder,
+# such that column[atomic_number] is the property of that element.
+#
+# Example usage:
+# numbers = symbols_to_atomic_numbers(species)
+# masses = atomic_masses[numbers]
+
+import numpy as np
+
 # Atomic number to atomic symbol
 an_to_symbol = {1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C', 7: 'N', 8: 'O', 9: 'F',
                 10: 'Ne', 11: 'Na', 12: 'Mg', 13: 'Al', 14: 'Si', 15: 'P', 16: 'S', 17: 'Cl', 18: 'Ar', 19: 'K',
@@ -13,5 +25,134 @@ an_to_symbol = {1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C', 7: 'N', 8: 'O
                 109: 'Mt',
                 110: 'Ds', 111: 'Rg', 112: 'Cn', 113: 'Nh', 114: 'Fl', 115: 'Mc', 116: 'Lv', 117: 'Ts', 118: 'Og'}
 
-# Atomic symbol to atomic number  
+# Atomic symbol to atomic number
 symbol_to_an = {symbol: an for an, symbol in an_to_symbol.items()}
+
+n_elements = len(an_to_symbol)
+
+# Atomic symbols, indexed by atomic number
+symbols = np.array([''] + [an_to_symbol[an] for an in range(1, n_elements + 1)])
+
+# Standard atomic weights (IUPAC 2016), in Dalton
+atomic_masses = np.array([np.nan,
+    1.008, 4.002602, 6.94, 9.0121831, 10.81, 12.011, 14.007, 15.999,
+    18.998403163, 20.1797, 22.98976928, 24.305, 26.9815385, 28.085, 30.973761998, 32.06,
+    35.45, 39.948, 39.0983, 40.078, 44.955908, 47.867, 50.9415, 51.9961,
+    54.938044, 55.845, 58.933194, 58.6934, 63.546, 65.38, 69.723, 72.63,
+    74.921595, 78.971, 79.904, 83.798, 85.4678, 87.62, 88.90584, 91.224,
+    92.90637, 95.95, 97.90721, 101.07, 102.9055, 106.42, 107.8682, 112.414,
+    114.818, 118.71, 121.76, 127.6, 126.90447, 131.293, 132.90545196, 137.327,
+    138.90547, 140.116, 140.90766, 144.242, 144.91276, 150.36, 151.964, 157.25,
+    158.92535, 162.5, 164.93033, 167.259, 168.93422, 173.054, 174.9668, 178.49,
+    180.94788, 183.84, 186.207, 190.23, 192.217, 195.084, 196.966569, 200.592,
+    204.38, 207.2, 208.9804, 208.98243, 209.98715, 222.01758, 223.01974, 226.02541,
+    227.02775, 232.0377, 231.03588, 238.02891, 237.04817, 244.06421, 243.06138, 247.07035,
+    247.07031, 251.07959, 252.083, 257.09511, 258.09843, 259.101, 262.11, 267.122,
+    268.126, 271.134, 270.133, 269.1338, 278.156, 281.165, 281.166, 285.177,
+    286.182, 289.19, 289.194, 293.204, 293.208, 294.214,
+])
+
+# Covalent radii of Cordero et al, Dalton Trans. 2832 (2008), in angstrom.
+# Sp3 carbon, low-spin Mn, Fe and Co. Not defined beyond Cm
+covalent_radii = np.array([np.nan,
+    0.31, 0.28, 1.28, 0.96, 0.84, 0.76, 0.71, 0.66, 0.57, 0.58,
+    1.66, 1.41, 1.21, 1.11, 1.07, 1.05, 1.02, 1.06, 2.03, 1.76,
+    1.7, 1.6, 1.53, 1.39, 1.39, 1.32, 1.26, 1.24, 1.32, 1.22,
+    1.22, 1.2, 1.19, 1.2, 1.2, 1.16, 2.2, 1.95, 1.9, 1.75,
+    1.64, 1.54, 1.47, 1.46, 1.42, 1.39, 1.45, 1.44, 1.42, 1.39,
+    1.39, 1.38, 1.39, 1.4, 2.44, 2.15, 2.07, 2.04, 2.03, 2.01,
+    1.99, 1.98, 1.98, 1.96, 1.94, 1.92, 1.92, 1.89, 1.9, 1.87,
+    1.87, 1.75, 1.7, 1.62, 1.51, 1.44, 1.41, 1.36, 1.36, 1.32,
+    1.45, 1.46, 1.48, 1.4, 1.5, 1.5, 2.6, 2.21, 2.15, 2.06,
+    2.0, 1.96, 1.9, 1.87, 1.8, 1.69, np.nan, np.nan, np.nan, np.nan,
+    np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
+    np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
+])
+
+# rgkmax giving a consistent total-energy precision per elemental crystal, H to Rn.
+# Found empirically by Sven in the Delta-DFT project. Also used by wp_benchmarks optimal_muffin_tins
+fixed_precision_rgkmax = np.full(shape=n_elements + 1, fill_value=np.nan)
+fixed_precision_rgkmax[1:87] = [
+    5.835430, 8.226318, 8.450962, 8.307929,
+    8.965808, 9.376204, 9.553568, 10.239864, 10.790975, 10.444355, 10.636286, 10.579793,
+    10.214125, 10.605334, 10.356352, 9.932381, 10.218153, 10.466519, 10.877475, 10.774763,
+    11.580691, 11.800971, 11.919804, 12.261896, 12.424606, 12.571031, 12.693836, 12.781331,
+    12.619806, 12.749802, 12.681350, 12.802838, 12.785680, 12.898916, 12.400000, 10.596757,
+    11.346060, 10.857573, 11.324413, 11.664200, 11.859519, 11.892673, 12.308470, 12.551024,
+    12.740728, 12.879424, 13.027090, 13.080576, 13.230621, 13.450665, 13.495632, 13.261039,
+    13.432654, 11.329591, 13.343047, 13.011835, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
+    np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, 15.134859, 14.955721,
+    14.607311, 13.930505, 13.645267, 13.629439, 13.450805, 13.069046, 13.226699, 13.261342,
+    13.365992, 13.557571, 13.565048, 13.579543, np.nan, 12.273924,
+]
+
+
+def atomic_numbers_to_symbols(atomic_numbers) -> np.ndarray:
+    """
+    Atomic symbols of an array of atomic numbers
+
+    :param atomic_numbers: Atomic numbers, any shape
+    :return: Atomic symbols, with the shape of atomic_numbers
+    """
+    atomic_numbers = np.asarray(atomic_numbers, dtype=int)
+    if atomic_numbers.size and (atomic_numbers.min() < 1 or atomic_numbers.max() > n_elements):
+        raise KeyError("Atomic numbers must be in [1, " + str(n_elements) + "]")
+    return symbols[atomic_numbers]
+
+
+def _symbol_code(characters: np.ndarray) -> np.ndarray:
+    """
+    Integer code of one- and two-character ASCII symbols, from their code points
+    """
+    return characters[..., 0] * 128 + characters[..., 1]
+
+
+# Atomic number of each symbol code, 0 for codes that are not atomic symbols
+_code_to_an = np.zeros(shape=128 * 128, dtype=int)
+_code_to_an[_symbol_code(np.array(symbols[1:], dtype='U2')[:, np.newaxis].view(np.uint32))] = \
+    np.arange(1, n_elements + 1)
+
+
+def symbols_to_atomic_numbers(species) -> np.ndarray:
+    """
+    Atomic numbers of an array of atomic symbols.
+
+    Symbols are converted via their character codes with a single table look-up,
+    rather than per-atom dictionary look-ups.
+
+    :param species: Atomic symbols, any shape
+    :return: Atomic numbers, with the shape of species
+    """
+    species = np.asarray(species)
+    if species.size == 0:
+        return np.zeros(shape=species.shape, dtype=int)
+    if species.dtype.kind != 'U':
+        species = species.astype(str)
+
+    # Code points of each symbol, padded to at least two characters
+    n_chars = species.dtype.itemsize // 4
+    characters = np.ascontiguousarray(species).view(np.uint32).reshape(species.shape + (n_chars,))
+    if n_chars < 2:
+        characters = np.concatenate((characters, np.zeros_like(characters)), axis=-1)
+
+    valid = (characters[..., 0] | characters[..., 1]) < 128
+    if n_chars > 2:
+        valid &= ~np.any(characters[..., 2:], axis=-1)
+    atomic_numbers = _code_to_an[np.where(valid, _symbol_code(characters), 0)]
+    if not np.all(atomic_numbers):
+        unknown = np.unique(species[atomic_numbers == 0])
+        raise KeyError("Unknown atomic symbols: " + ', '.join(unknown.tolist()))
+    return atomic_numbers
+
+
+def species_codes(species) -> tuple:
+    """
+    Intern an array of atomic symbols as integer codes into its distinct species
+
+    :param species: Atomic symbols, shape (n_atoms)
+    :return: unique_numbers, codes. Atomic numbers of the distinct species in ascending order,
+    and the index of each atom's species in unique_numbers, shape (n_atoms)
+    """
+    atomic_numbers = symbols_to_atomic_numbers(species).ravel()
+    unique_numbers, codes = np.unique(atomic_numbers, return_inverse=True)
+    return unique_numbers, codes.ravel()
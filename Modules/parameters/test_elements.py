@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+
+from modules.parameters import elements
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for elements.py module """
+
+    def test_symbols_atomic_numbers_round_trip(self):
+        atomic_numbers = np.arange(1, elements.n_elements + 1)
+        symbols = elements.atomic_numbers_to_symbols(atomic_numbers)
+        self.assertEqual(symbols.tolist(), [elements.an_to_symbol[an] for an in atomic_numbers])
+        self.assertTrue(np.array_equal(elements.symbols_to_atomic_numbers(symbols), atomic_numbers))
+
+        # Shape is retained, and lists of str are accepted
+        species = [['Zr', 'O'], ['O', 'H']]
+        self.assertTrue(np.array_equal(elements.symbols_to_atomic_numbers(species), [[40, 8], [8, 1]]))
+
+        unique_numbers, codes = elements.species_codes(['Zr', 'O', 'O', 'H'])
+        self.assertTrue(np.array_equal(unique_numbers, [1, 8, 40]))
+        self.assertTrue(np.array_equal(codes, [2, 1, 1, 0]))
+
+    def test_unknown_symbols(self):
+        for species in [['Zr', 'Xx'], ['Zrx'], ['o'], ['']]:
+            with self.assertRaises(KeyError):
+                elements.symbols_to_atomic_numbers(species)
+        with self.assertRaises(KeyError):
+            elements.atomic_numbers_to_symbols([0, 1])
+
+    def test_property_columns(self):
+        numbers = elements.symbols_to_atomic_numbers(['H', 'C', 'Zr'])
+        self.assertTrue(np.allclose(elements.atomic_masses[numbers], [1.008, 12.011, 91.224]))
+        self.assertTrue(np.allclose(elements.covalent_radii[numbers], [0.31, 0.76, 1.75]))
+        self.assertTrue(np.allclose(elements.fixed_precision_rgkmax[numbers], [5.835430, 9.376204, 11.664200]))
+        # No rgkmax for lanthanides
+        self.assertTrue(np.isnan(elements.fixed_precision_rgkmax[elements.symbol_to_an['Gd']]))
+
+
+if __name__ == '__main__':
+    unittest.main()
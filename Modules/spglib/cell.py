@@ -2,77 +2,85 @@
 # Functions for working with spglib 'molecule' and 'dataset' objects 
 
 import numpy as np
-from ase.atoms import Atoms as ase_Atoms, Atom as ase_Atom
 
-from modules.parameters.elements import an_to_symbol
+from modules.lazy_import import lazy_import
+from modules.parameters.elements import atomic_numbers_to_symbols
 
+ase_atoms = lazy_import('ase.atoms')
 
-def spglib_to_ase(molecule, indices=None):
-    basis = molecule[1]
-    atomic_numbers = molecule[2]
-    if indices == None:
-        indices = range(0, len(atomic_numbers))
-
-    lattice = np.transpose(np.asarray(molecule[0]))
-    #print(lattice)
 
-    ase_molecule = []
-    for ia in indices:
-        atomic_symbol = an_to_symbol[atomic_numbers[ia]]
-        # Have to store in Cartesian
-        pos = np.matmul(lattice, np.asarray(basis[ia]))
-        # Fractional
-        #print(ia, basis[ia])
-        ase_molecule.append(ase_Atom(atomic_symbol, pos))
+def spglib_to_ase(molecule, indices=None):
+    basis = np.asarray(molecule[1], dtype=float)
+    atomic_numbers = np.asarray(molecule[2], dtype=int)
+    if indices is None:
+        indices = slice(None)
+    else:
+        indices = np.asarray(indices, dtype=int)
 
-    return ase_Atoms(ase_molecule, cell=molecule[0])
+    # Have to store in Cartesian. Lattice vectors are stored row-wise
+    positions = np.matmul(basis[indices], np.asarray(molecule[0], dtype=float))
+    return ase_atoms.Atoms(symbols=atomic_numbers_to_symbols(atomic_numbers[indices]), positions=positions,
+                           cell=molecule[0])
 
 
 
 # Given an spg_molcule and set of atomic indices, return a new spg module
+# Positions and atomic numbers are returned as arrays, sliced with indices
 def create_spg_molecule(input_molecule, indices):
-    lattice        = input_molecule[0]
-    old_positions      = input_molecule[1]
-    old_atomic_numbers = input_molecule[2]
-    positions = []
-    atomic_numbers = []
+    lattice = input_molecule[0]
+    indices = np.asarray(indices, dtype=int)
+    positions = np.asarray(input_molecule[1], dtype=float)[indices]
+    atomic_numbers = np.asarray(input_molecule[2])[indices]
+    return (lattice, positions, atomic_numbers)
 
-    origin = [0,0,0]
-    #origin = np.asarray(old_positions[0])
 
-    for iatom in indices:
-        positions.append(tuple(old_positions[iatom] - origin))
-        atomic_numbers.append(old_atomic_numbers[iatom])
+class Orbits:
+    """
+    Decomposition of atoms into orbits (sets of symmetry-equivalent atoms), stored CSR-style.
 
-    return (lattice, positions, atomic_numbers)
+    Members of orbit i are given by members[offsets[i]:offsets[i+1]], in ascending order.
 
+    :param representatives: Representative atom of each orbit, in ascending order. Shape (n_orbits)
+    :param sizes: Number of atoms in each orbit. Shape (n_orbits)
+    :param offsets: Start of each orbit in members. Shape (n_orbits + 1)
+    :param members: Atomic indices, grouped by orbit. Shape (n_atoms)
+    :param orbit_index: Orbit of each atom. Shape (n_atoms)
+    """
+    def __init__(self, representatives, sizes, offsets, members, orbit_index):
+        self.representatives = representatives
+        self.sizes = sizes
+        self.offsets = offsets
+        self.members = members
+        self.orbit_index = orbit_index
 
-# dataset is returned from calling spglib.get_symmetry_dataset(spg_molecule)
-def asymmetric_cell_atom_indices(dataset):
-    # atomic indices in supercell
-    atom_indices = []
-    for x in dataset['equivalent_atoms']:
-        atom_indices.append(x)
+    def __len__(self) -> int:
+        return self.representatives.size
 
-    # Reduce to unique indices
-    atom_indices = list(set(atom_indices))
-    atom_indices.sort()
-    return atom_indices
+    def orbit(self, i: int) -> np.ndarray:
+        return self.members[self.offsets[i]:self.offsets[i + 1]]
 
+    def to_lists(self) -> list:
+        return [orbit.tolist() for orbit in np.split(self.members, self.offsets[1:-1])]
 
-# dataset is returned from calling spglib.get_symmetry_dataset(spg_molecule)
-def group_reducible_atomic_indices(dataset):
-    sets_of_reducibles = []
-    one_set = []
-    ref_atom = dataset['equivalent_atoms'][0]
 
-    for reducible_atom, i in enumerate(dataset['equivalent_atoms']):
+# equivalent_atoms is returned from calling spglib.get_symmetry_dataset(spg_molecule)
+# Equivalent atoms do not need to be contiguous
+def orbit_decomposition(equivalent_atoms) -> Orbits:
+    equivalent_atoms = np.asarray(equivalent_atoms)
+    representatives, orbit_index, sizes = np.unique(equivalent_atoms, return_inverse=True, return_counts=True)
+    offsets = np.zeros(shape=sizes.size + 1, dtype=int)
+    offsets[1:] = np.cumsum(sizes)
+    members = np.argsort(orbit_index, kind='stable')
+    return Orbits(representatives, sizes, offsets, members, orbit_index)
 
-        if (i != ref_atom):
-            sets_of_reducibles.append(one_set)
-            one_set = []
-            ref_atom = reducible_atom
 
-        one_set.append(reducible_atom)
+# dataset is returned from calling spglib.get_symmetry_dataset(spg_molecule)
+# Sorted atomic indices of the asymmetric cell
+def asymmetric_cell_atom_indices(dataset):
+    return np.unique(dataset['equivalent_atoms']).tolist()
 
-    return sets_of_reducibles
+
+# dataset is returned from calling spglib.get_symmetry_dataset(spg_molecule)
+# Atomic indices, grouped into sets of equivalent atoms
+def group_reducible_atomic_indices(dataset):
+    return orbit_decomposition(dataset['equivalent_atoms']).to_lists()
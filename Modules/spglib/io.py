@@ -2,12 +2,13 @@
 # Helper functions for printing, reading and writing of SPGLIB data
 # https://github.com/atztogo/spglib/blob/master/python/examples/example.py
 
-# Libraries
-from ase.io import write as ase_write
-
 #My modules
+from modules.lazy_import import lazy_import
 from modules.spglib.cell import spglib_to_ase
 
+# Libraries
+ase_io = lazy_import('ase.io')
+
 
 def show_symmetry(symmetry, n_symmetries=None):
     if n_symmetries == None:
@@ -69,7 +70,7 @@ def write(f_name, spg_molecule, pbc = None):
         assert(isinstance(pbc, tuple))
         ase_primitive_cell.set_pbc(pbc)
 
-    ase_write(f_name, ase_primitive_cell)
+    ase_io.write(f_name, ase_primitive_cell)
     return
 
 
@@ -0,0 +1,162 @@
+# Batch symmetry analysis with spglib, with results memoised per cell.
+#
+# Cells are spglib tuples (lattice, positions, numbers), with lattice vectors
+# stored row-wise and fractional positions.
+#
+# Example usage:
+# data = get_symmetry_data(cell)
+# print(data.pointgroup, data.equivalent_atoms)
+#
+# data_per_cell = batch_symmetry_data(cells, n_processes=8)
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from modules.lazy_import import lazy_import
+
+spglib = lazy_import('spglib')
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """ Flag an array as read-only, such that cached results cannot be modified in-place """
+    array.flags.writeable = False
+    return array
+
+
+class SymmetryData:
+    """
+    Compact, array-based summary of an spglib symmetry dataset.
+
+    Supports dictionary-style access, such that it can be used in place
+    of the dataset, for example with io.show_spg_symmetry_info.
+
+    :param number: Space group number
+    :param international: Space group, international symbol
+    :param hall: Hall symbol
+    :param hall_number: Hall number
+    :param pointgroup: Point group, international symbol
+    :param rotations: Rotations of the symmetry operations, shape (n_ops, 3, 3)
+    :param translations: Translations of the symmetry operations, shape (n_ops, 3)
+    :param equivalent_atoms: Index of the representative of each atom's orbit, shape (n_atoms)
+    :param wyckoffs: Wyckoff letter of each atom, shape (n_atoms)
+    """
+    def __init__(self, number: int, international: str, hall: str, hall_number: int, pointgroup: str,
+                 rotations: np.ndarray, translations: np.ndarray, equivalent_atoms: np.ndarray,
+                 wyckoffs: np.ndarray):
+        self.number = number
+        self.international = international
+        self.hall = hall
+        self.hall_number = hall_number
+        self.pointgroup = pointgroup
+        self.rotations = rotations
+        self.translations = translations
+        self.equivalent_atoms = equivalent_atoms
+        self.wyckoffs = wyckoffs
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def __setstate__(self, state: dict):
+        # Unpickled arrays, for example those returned from a process pool, are writeable
+        self.__dict__.update({key: read_only(value) if isinstance(value, np.ndarray) else value
+                              for key, value in state.items()})
+
+    @classmethod
+    def from_dataset(cls, dataset):
+        """
+        :param dataset: Returned from spglib.get_symmetry_dataset. Dictionary for spglib < 2.0,
+        else a dataclass
+        """
+        def get(key: str):
+            return dataset[key] if isinstance(dataset, dict) else getattr(dataset, key)
+
+        # Arrays are shared by every lookup of the cached cell, so are read-only
+        return cls(int(get('number')),
+                   get('international'),
+                   get('hall'),
+                   int(get('hall_number')),
+                   get('pointgroup'),
+                   read_only(np.array(get('rotations'), dtype=np.int32)),
+                   read_only(np.array(get('translations'), dtype=np.float64)),
+                   read_only(np.array(get('equivalent_atoms'), dtype=np.int64)),
+                   read_only(np.array(get('wyckoffs'), dtype='U1')))
+
+
+# {cell key: SymmetryData or None}
+_cache = {}
+
+
+def cell_key(cell, symprec: float, angle_tolerance: float) -> str:
+    """
+    Canonical hash of a cell and tolerances.
+
+    Arrays are converted to fixed types, and positions are wrapped into [0, 1),
+    such that equivalent representations of the same cell share a key.
+    Atom order is retained, as equivalent_atoms depends upon it.
+    """
+    lattice = np.ascontiguousarray(cell[0], dtype=np.float64)
+    positions = np.mod(np.asarray(cell[1], dtype=np.float64), 1.) + 0.
+    numbers = np.ascontiguousarray(cell[2], dtype=np.int64)
+
+    sha = hashlib.sha256()
+    for array in [lattice, np.ascontiguousarray(positions), numbers,
+                  np.array([symprec, angle_tolerance], dtype=np.float64)]:
+        sha.update(array.tobytes())
+    return sha.hexdigest()
+
+
+def _symmetry_data(cell, symprec: float, angle_tolerance: float):
+    dataset = spglib.get_symmetry_dataset(cell, symprec=symprec, angle_tolerance=angle_tolerance)
+    if dataset is None:
+        return None
+    return SymmetryData.from_dataset(dataset)
+
+
+def get_symmetry_data(cell, symprec=1e-5, angle_tolerance=-1.0):
+    """
+    Symmetry data of a cell, memoised
+
+    :return: SymmetryData, or None if spglib fails
+    """
+    key = cell_key(cell, symprec, angle_tolerance)
+    if key not in _cache:
+        _cache[key] = _symmetry_data(cell, symprec, angle_tolerance)
+    return _cache[key]
+
+
+def batch_symmetry_data(cells: list, symprec=1e-5, angle_tolerance=-1.0, n_processes=None) -> list:
+    """
+    Symmetry data for a batch of cells, memoised.
+
+    Cells not already cached are analysed once each, over a pool of processes.
+
+    :param cells: List of spglib cells
+    :param n_processes: Number of processes. None uses all available cores, 1 runs serially
+    :return: List of SymmetryData (or None if spglib fails), ordered as cells
+    """
+    keys = [cell_key(cell, symprec, angle_tolerance) for cell in cells]
+
+    # First occurrence of each uncached cell
+    uncached = {}
+    for key, cell in zip(keys, cells):
+        if key not in _cache and key not in uncached:
+            uncached[key] = cell
+
+    if n_processes == 1 or len(uncached) <= 1:
+        results = [_symmetry_data(cell, symprec, angle_tolerance) for cell in uncached.values()]
+    else:
+        n_cells = len(uncached)
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            results = list(executor.map(_symmetry_data, uncached.values(),
+                                        [symprec] * n_cells, [angle_tolerance] * n_cells))
+
+    for key, result in zip(uncached.keys(), results):
+        _cache[key] = result
+
+    return [_cache[key] for key in keys]
+
+
+def clear_cache():
+    _cache.clear()
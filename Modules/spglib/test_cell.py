@@ -0,0 +1,28 @@
+import unittest
+import numpy as np
+
+from modules.spglib import cell
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for cell.py module """
+
+    def test_orbit_decomposition(self):
+        # Non-contiguous orbits
+        equivalent_atoms = np.array([0, 0, 2, 2, 0, 5, 2, 5])
+        orbits = cell.orbit_decomposition(equivalent_atoms)
+
+        self.assertEqual(len(orbits), 3)
+        self.assertTrue(np.array_equal(orbits.representatives, [0, 2, 5]))
+        self.assertTrue(np.array_equal(orbits.sizes, [3, 3, 2]))
+        self.assertTrue(np.array_equal(orbits.orbit(1), [2, 3, 6]))
+        self.assertTrue(np.array_equal(orbits.representatives[orbits.orbit_index], equivalent_atoms))
+
+        # The last group is retained
+        dataset = {'equivalent_atoms': equivalent_atoms}
+        self.assertEqual(cell.group_reducible_atomic_indices(dataset), [[0, 1, 4], [2, 3, 6], [5, 7]])
+        self.assertEqual(cell.asymmetric_cell_atom_indices(dataset), [0, 2, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+
+from modules.spglib import symmetry
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for symmetry.py module """
+
+    def setUp(self):
+        symmetry.clear_cache()
+        lattice = 0.5 * 5.43 * np.array([[0., 1., 1.], [1., 0., 1.], [1., 1., 0.]])
+        self.silicon = (lattice, [[0., 0., 0.], [0.25, 0.25, 0.25]], [14, 14])
+        self.simple_cubic = (np.eye(3), [[0., 0., 0.]], [1])
+
+    def test_silicon(self):
+        data = symmetry.get_symmetry_data(self.silicon)
+        self.assertEqual(data.number, 227)
+        self.assertEqual(data['pointgroup'], 'm-3m')
+        self.assertEqual(data.rotations.shape, (48, 3, 3))
+        self.assertEqual(data.translations.shape, (48, 3))
+        self.assertTrue(np.array_equal(data.equivalent_atoms, [0, 0]))
+        self.assertEqual(data.wyckoffs.shape, (2,))
+        self.assertEqual(data.wyckoffs[0], data.wyckoffs[1])
+
+    def test_batch_is_memoised(self):
+        # Same cell, with a position translated by a lattice vector
+        silicon_translated = (self.silicon[0], [[1., 0., 0.], [0.25, 0.25, 0.25]], [14, 14])
+        cells = [self.silicon, self.simple_cubic, silicon_translated]
+
+        data = symmetry.batch_symmetry_data(cells, n_processes=2)
+        self.assertEqual([d.number for d in data], [227, 221, 227])
+        self.assertIs(data[0], data[2])
+        self.assertIs(symmetry.get_symmetry_data(self.simple_cubic), data[1])
+
+    def test_cached_arrays_are_read_only(self):
+        cells = [self.silicon, self.simple_cubic]
+        data = [symmetry.get_symmetry_data(self.silicon)] + symmetry.batch_symmetry_data(cells, n_processes=2)
+
+        for d in data:
+            for array in [d.rotations, d.translations, d.equivalent_atoms, d.wyckoffs]:
+                self.assertFalse(array.flags.writeable)
+            with self.assertRaises(ValueError):
+                d.rotations[0, 0, 0] = 2
+
+        # Copies are writeable
+        rotations = data[0].rotations.copy()
+        rotations[0, 0, 0] = 2
+        self.assertEqual(symmetry.get_symmetry_data(self.silicon).rotations[0, 0, 0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from modules.lazy_import import lazy_import, LazyModule
+
+# Directory containing the modules package
+modules_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def modules_loaded_on_import(module_names: list, heavy_modules: list) -> list:
+    """
+    Heavy modules that are loaded, when importing module_names in a fresh interpreter
+    """
+    statement = '; '.join('import ' + name for name in module_names) + \
+                '; import sys; print(" ".join(m for m in ' + repr(heavy_modules) + ' if m in sys.modules))'
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([modules_root, env.get('PYTHONPATH', '')]).rstrip(os.pathsep)
+    result = subprocess.run([sys.executable, '-c', statement], env=env, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+class MyTestCase(unittest.TestCase):
+    """ Unit tests for lazy_import.py module """
+
+    def test_lazy_import(self):
+        # Already imported modules are returned as is
+        self.assertIs(lazy_import('os'), os)
+
+        json = lazy_import('json')
+        if 'json' not in sys.modules:
+            self.assertIsInstance(json, LazyModule)
+        self.assertEqual(json.dumps([1]), '[1]')
+
+        missing = lazy_import('a_module_that_does_not_exist')
+        with self.assertRaises(ImportError):
+            missing.attribute
+
+    def test_heavy_dependencies_are_deferred(self):
+        module_names = ['modules.fileio.read',
+                        'modules.spglib.cell',
+                        'modules.spglib.io',
+                        'modules.spglib.symmetry',
+                        'modules.electronic_structure.structure.neighbours']
+        loaded = modules_loaded_on_import(module_names, ['ase', 'scipy', 'spglib'])
+        self.assertEqual(loaded, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
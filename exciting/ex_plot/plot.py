@@ -2,7 +2,9 @@
 Plot classes that 'should' reduce boilerplate code.
 If it doesn't reduce code, it's a waste of time.
 """
-import matplotlib.pyplot as plt
+from exciting_utils.lazy_import import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
 
 
 class Plot:
@@ -0,0 +1,101 @@
+"""
+Deferred import of heavy dependencies, and measurement of cold-start import times.
+
+matplotlib, h5py and excitingtools each take a large fraction of a second to import,
+which dominates the run time of short parse tasks that never use them.
+A lazy module is only imported on first attribute access:
+
+  plt = lazy_import('matplotlib.pyplot')
+  ...
+  fig, ax = plt.subplots()   # matplotlib is imported here
+
+The exciting scripts are deliberately standalone and do not import the Modules tree,
+so this module duplicates modules.lazy_import, which the Modules and pycharm_projects
+trees use. Changes to one should be mirrored in the other.
+"""
+import importlib
+import os
+import sys
+import types
+from typing import List, Optional
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module, which imports the module on first attribute access.
+
+    If the module is not installed, ImportError is raised on first use rather
+    than when the stand-in is created.
+
+    :param str name: Fully-qualified module name
+    """
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        if self._module is None:
+            self.__dict__['_module'] = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return "<lazy module '" + self.__name__ + "' (" + state + ")>"
+
+
+def lazy_import(name: str):
+    """
+    Import a module on first use
+
+    :param str name: Fully-qualified module name, for example 'matplotlib.pyplot'
+    :return: The module, if already imported, else a LazyModule
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def parse_importtime(output: str) -> dict:
+    """
+    Parse the output of python -X importtime
+
+    :param str output: stderr of the interpreter
+    :return: {module name: (self time, cumulative time)}, in microseconds
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def cold_import_times(module_names: List[str], python_path: Optional[List[str]] = None) -> dict:
+    """
+    Import times of modules, and all modules they import, in a fresh interpreter.
+
+    :param module_names: Fully-qualified module names, imported in order
+    :param python_path: Directories prepended to PYTHONPATH
+    :return: {module name: (self time, cumulative time)}, in microseconds.
+    Cumulative times exclude dependencies already imported by an earlier module
+    """
+    # Only needed for benchmarking, so not imported with the module
+    import subprocess
+
+    env = dict(os.environ)
+    if python_path:
+        env['PYTHONPATH'] = os.pathsep.join(python_path + [env.get('PYTHONPATH', '')]).rstrip(os.pathsep)
+
+    statement = '; '.join('import ' + name for name in module_names)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.splitlines()[-1] if result.stderr else 'Import of ' + statement + ' failed')
+    return parse_importtime(result.stderr)
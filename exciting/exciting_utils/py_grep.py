@@ -1,42 +1,126 @@
 """
-Python wrapper for grep and other useful spec
+In-process replacement for grep, and other useful spec
+
+Files are scanned once, line by line, for any number of regular expressions
+(Python syntax), without spawning a subprocess per query.
 """
-import subprocess
+import re
+from collections import deque
+from typing import Iterable, List
+
+
+class Match:
+    """
+    A line matching a pattern
+
+    :param line_number: Line number of the match, indexing from 1 (consistent with grep)
+    :param line: Matching line, without the newline
+    :param before: Lines preceding the match
+    :param after: Lines following the match
+    """
+    def __init__(self, line_number: int, line: str, before: list, after: list):
+        self.line_number = line_number
+        self.line = line
+        self.before = before
+        self.after = after
+
+
+def scan_lines(lines: Iterable[str], patterns: dict, n_lines_before=0, n_lines_after=0) -> dict:
+    """
+    Single pass over lines, recording matches to all patterns
+
+    :param lines: Iterable of lines, for example an open file or the result of readlines()
+    :param patterns: Dictionary of {key: regular expression}
+    :param n_lines_before: Number of lines of context to store before each match
+    :param n_lines_after: Number of lines of context to store after each match
+    :return: Dictionary of {key: List[Match]}, with matches in the order they occur
+    """
+    compiled = {key: re.compile(pattern) for key, pattern in patterns.items()}
+    matches = {key: [] for key in patterns}
+    before = deque(maxlen=n_lines_before)
+    awaiting_context = []
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip('\n')
 
+        if awaiting_context:
+            for match in awaiting_context:
+                match.after.append(line)
+            awaiting_context = [match for match in awaiting_context if len(match.after) < n_lines_after]
 
-# TODO Fix to take **args too and refactor line_number
-def grep(string: str, fname: str, **kwargs):
+        for key, regex in compiled.items():
+            if regex.search(line):
+                match = Match(line_number, line, list(before), [])
+                matches[key].append(match)
+                if n_lines_after > 0:
+                    awaiting_context.append(match)
+
+        if n_lines_before > 0:
+            before.append(line)
+
+    return matches
+
+
+def scan(fname: str, patterns: dict, n_lines_before=0, n_lines_after=0) -> dict:
+    """
+    Single pass over a file, recording matches to all patterns.
+    See scan_lines for a description of the arguments.
+    """
+    with open(fname, 'r') as fid:
+        return scan_lines(fid, patterns, n_lines_before=n_lines_before, n_lines_after=n_lines_after)
+
+
+def grep_string(matches: List[Match], line_number=False) -> str:
     """
-    Grep wrapper
+    Format matches consistent with grep's output: Context lines are included,
+    overlapping context is merged and non-contiguous groups are separated by '--'
 
-    :param string:
-    :param fname:
-    :param kwargs:
-    :return:
+    :param matches: Matches, in the order they occur
+    :param line_number: Prefix lines with line numbers
+    :return: grep-style output
     """
-    grep_options = {'n_lines_before': '-B',
-                    'n_lines_after': '-A',
-                    'line_number': '-n'}
+    has_context = any(match.before or match.after for match in matches)
+
+    # {line number: (line, is a match)}
+    output_lines = {}
+    for match in matches:
+        first = match.line_number - len(match.before)
+        for i, line in enumerate(match.before):
+            output_lines.setdefault(first + i, (line, False))
+        output_lines[match.line_number] = (match.line, True)
+        for i, line in enumerate(match.after):
+            output_lines.setdefault(match.line_number + 1 + i, (line, False))
 
-    opts = ''
-    for key, value in kwargs.items():
-        opts += grep_options[key] + ' ' + str(value) + ' '
+    output = []
+    prior = None
+    for i in sorted(output_lines.keys()):
+        if has_context and prior is not None and i != prior + 1:
+            output.append('--')
+        line, is_match = output_lines[i]
+        if line_number:
+            line = str(i) + (':' if is_match else '-') + line
+        output.append(line)
+        prior = i
 
-    grep_str = "grep " + opts + " '" + string + "' " + fname
+    return "".join(line + '\n' for line in output)
 
-    try:
-        output = subprocess.check_output(grep_str, shell=True).decode("utf-8")
-    except subprocess.CalledProcessError as grepexc:
-        print("subprocess error:", grepexc.returncode, "grep found:", grepexc.output)
-        #TODO throw error if string not returned
-        output = grepexc.output
 
-    return output
+def grep(string: str, fname: str, **kwargs) -> str:
+    """
+    grep, performed in-process
+
+    :param string: Regular expression to search for
+    :param fname: File name
+    :param kwargs: n_lines_before, n_lines_after, line_number
+    :return: Matching lines, formatted as grep does. Empty if no matches
+    """
+    grep_options = {'n_lines_before', 'n_lines_after', 'line_number'}
+    for key in kwargs.keys():
+        if key not in grep_options:
+            raise KeyError("Invalid grep option: " + key)
 
+    matches = scan(fname, {string: string},
+                   n_lines_before=int(kwargs.get('n_lines_before', 0)),
+                   n_lines_after=int(kwargs.get('n_lines_after', 0)))[string]
 
-#
-#
-# def number_of_string_matches(string, fname):
-#     grep_str = "grep -o '" + string + "' "+fname+" | wc -l"
-#     n_matches = subprocess.check_output(grep_str, shell=True).decode("utf-8")
-#     return int(n_matches)
\ No newline at end of file
+    return grep_string(matches, line_number='line_number' in kwargs)
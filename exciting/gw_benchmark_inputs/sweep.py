@@ -0,0 +1,260 @@
+"""
+Generate exciting GW inputs for large parameter sweeps.
+
+Species files are parsed once and compiled into templates, input variants for the
+Cartesian product of settings are produced lazily, and only directories whose inputs
+have changed since the last sweep are written.
+
+Example usage:
+
+  bases = {'zr_lmax6_o_lmax5': {'zr': SpeciesBasis('zr', load_species_template(root + '/groundstate/Zr.xml'),
+                                                   default_los['zr'], lorecommendations['zr']),
+                                'o': ...}}
+  variants = gw_input_variants(gs_input, bases, energy_cutoffs={'zr_lmax6_o_lmax5': set_lo_channel_cutoffs(l_max)},
+                               ngridq=[[2, 2, 2], [4, 4, 4]], nempty=[100, 2000], nomeg=[16, 32])
+  n_written, n_skipped = write_variants(root, variants, copy_from=root + '/groundstate')
+"""
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import string
+from collections import OrderedDict
+from typing import Callable, Iterator, List, Optional
+
+from parse.parse_basis_xml import parse_basis_as_string
+from parse.set_gw_input import GWInput
+from process.optimised_basis import DefaultLOs, filter_lo_functions, generate_lo_l_string
+
+# File in the sweep root, storing the content hash of the inputs of each directory
+hash_file_name = '.input_hashes.json'
+
+
+class CompiledTemplate:
+    """
+    str.format template, split once into literal text and field names,
+    such that rendering is a single join
+
+    :param str template: Template with {field} replacement fields
+    """
+    def __init__(self, template: str):
+        self.literals = []
+        self.fields = []
+        for literal, field, format_spec, conversion in string.Formatter().parse(template):
+            assert not format_spec and not conversion, "Format specifications are not supported"
+            self.literals.append(literal)
+            self.fields.append(field)
+
+    def render(self, values: dict) -> str:
+        """
+        :param values: {field: value}. Values are converted with str
+        """
+        return ''.join(literal if field is None else literal + str(values[field])
+                       for literal, field in zip(self.literals, self.fields))
+
+
+# {(file name, mtime): CompiledTemplate}
+_species_templates = {}
+
+
+def load_species_template(file_name: str) -> CompiledTemplate:
+    """
+    Parse a species file, with tags for optimised LOs, into a compiled template.
+    Files are only re-parsed if they have changed.
+
+    :param str file_name: species.xml
+    :return: Compiled basis template, with fields custom_l0, custom_l1, ...
+    """
+    key = (os.path.abspath(file_name), os.stat(file_name).st_mtime_ns)
+    if key not in _species_templates:
+        _species_templates[key] = CompiledTemplate(parse_basis_as_string(file_name))
+    return _species_templates[key]
+
+
+class SpeciesBasis:
+    """
+    Optimised LO basis of a species, for a fixed default basis.
+
+    Species files are rendered once per set of energy cut-offs.
+
+    :param str species: Lowercase species string
+    :param CompiledTemplate template: Default basis template, from load_species_template
+    :param DefaultLOs default_los: Default LO basis details
+    :param lorecommendations: LO energy recommendations for all l-channels of the species
+    :param int max_matching_order: Max matching order of the optimised LOs
+    """
+    def __init__(self, species: str, template: CompiledTemplate, default_los: DefaultLOs,
+                 lorecommendations, max_matching_order=1):
+        self.species = species
+        self.template = template
+        self.default_los = default_los
+        self.lorecommendations = lorecommendations
+        self.max_matching_order = max_matching_order
+        self._rendered = {}
+
+    @property
+    def file_name(self) -> str:
+        return self.species.capitalize() + '.xml'
+
+    def render(self, energy_cutoff: dict) -> str:
+        """
+        :param dict energy_cutoff: {l: LO cut-off energy}
+        :return: Species file contents
+        """
+        key = tuple(sorted(energy_cutoff.items()))
+        if key not in self._rendered:
+            optimised_los = filter_lo_functions(self.lorecommendations, self.default_los, energy_cutoff)
+            lo_strings = {'custom_l' + str(los.l_value):
+                          generate_lo_l_string(los.l_value, los.get_optimised_energies(), self.max_matching_order)
+                          for los in optimised_los}
+            self._rendered[key] = self.template.render(lo_strings)
+        return self._rendered[key]
+
+
+def parameter_grid(**settings) -> Iterator[OrderedDict]:
+    """
+    Cartesian product of settings, with the last setting varying fastest
+
+    :param settings: {name: list of values}
+    :return: Generator of {name: value}
+    """
+    names = list(settings.keys())
+    for values in itertools.product(*settings.values()):
+        yield OrderedDict(zip(names, values))
+
+
+def gw_input_variants(gs_input: str,
+                      bases: dict,
+                      energy_cutoffs: dict,
+                      ngridq: List[list],
+                      nempty: List[int],
+                      nomeg: List[int],
+                      run_script: Optional[Callable] = None,
+                      **gw_options) -> Iterator[tuple]:
+    """
+    Inputs for the Cartesian product of basis, q-grid, nempty, nomeg and energy cut-offs.
+
+    Directories follow the convention of write_input_file:
+      <basis label>/gw_q<q>_omeg<nomeg>_nempty<nempty>/max_energy_i<i>
+
+    :param str gs_input: Ground state input, with a {GW_INPUT} tag
+    :param dict bases: {basis label: {species: SpeciesBasis}}, for example one label per l_max pair
+    :param dict energy_cutoffs: {basis label: list of energy cut-offs}, as returned by restructure_energy_cutoffs
+    :param ngridq: q-grids
+    :param nempty: Numbers of empty states
+    :param nomeg: Numbers of imaginary frequency points
+    :param run_script: Optional function of (directory, settings), returning the contents of run.sh
+    :param gw_options: Further GWInput arguments, fixed for all variants
+    :return: Generator of (directory, {file name: contents}, settings)
+    """
+    gs_template = CompiledTemplate(gs_input.replace('do="skip"', 'do="fromfile"'))
+    gw_options.setdefault('taskname', 'g0w0')
+    gw_options.setdefault('skipgnd', False)
+
+    # input.xml is shared by all cut-offs and bases
+    input_strings = {}
+
+    for label, species_bases in bases.items():
+        grid = parameter_grid(ngridq=ngridq, nempty=nempty, nomeg=nomeg,
+                              energy_index=range(0, len(energy_cutoffs[label])))
+
+        for settings in grid:
+            gw_key = (tuple(settings['ngridq']), settings['nempty'], settings['nomeg'])
+            if gw_key not in input_strings:
+                gw_input = GWInput(ngridq=settings['ngridq'], nempty=settings['nempty'],
+                                   n_omega=settings['nomeg'], **gw_options)
+                input_strings[gw_key] = gs_template.render({'GW_INPUT': gw_input.string})
+
+            q_str = ''.join(str(q) for q in settings['ngridq'])
+            directory = os.path.join(label,
+                                     "gw_q" + q_str + "_omeg" + str(settings['nomeg']) +
+                                     "_nempty" + str(settings['nempty']),
+                                     'max_energy_i' + str(settings['energy_index']))
+
+            energy_cutoff = energy_cutoffs[label][settings['energy_index']]
+            files = OrderedDict([('input.xml', input_strings[gw_key])])
+            for species, basis in species_bases.items():
+                files[basis.file_name] = basis.render(energy_cutoff[species])
+
+            settings['basis'] = label
+            if run_script is not None:
+                files['run.sh'] = run_script(directory, settings)
+
+            yield directory, files, settings
+
+
+def content_hash(files: dict) -> str:
+    """
+    :param files: {file name: contents}
+    :return: sha256 of the file names and contents
+    """
+    sha = hashlib.sha256()
+    for file_name in sorted(files.keys()):
+        sha.update(file_name.encode())
+        sha.update(b'\0')
+        sha.update(files[file_name].encode())
+        sha.update(b'\0')
+    return sha.hexdigest()
+
+
+def write_variants(root_path: str, variants: Iterator[tuple], copy_from: Optional[str] = None,
+                   force=False, verbose=False) -> tuple:
+    """
+    Write input variants, skipping directories whose inputs are unchanged since the last sweep,
+    and whose input files all still exist.
+
+    Content hashes of all directories are read and written once, in a single file in root_path,
+    rather than per directory.
+
+    :param str root_path: Top level path to calculations
+    :param variants: Iterable of (directory, {file name: contents}, ...), as returned by gw_input_variants.
+    Directories are relative to root_path
+    :param copy_from: Optional directory, for example the ground state, copied to new or changed directories
+    before the inputs are written
+    :param bool force: Write all variants
+    :param bool verbose: Print the directories written
+    :return: Number of directories written, number skipped
+    """
+    hash_file = os.path.join(root_path, hash_file_name)
+    hashes = {}
+    if os.path.isfile(hash_file):
+        with open(hash_file, 'r') as fid:
+            hashes = json.load(fid)
+
+    n_written, n_skipped = 0, 0
+    try:
+        for variant in variants:
+            directory, files = variant[0], variant[1]
+            job_dir = os.path.join(root_path, directory)
+            digest = content_hash(files)
+
+            unchanged = hashes.get(directory) == digest and \
+                all(os.path.isfile(os.path.join(job_dir, file_name)) for file_name in files)
+            if not force and unchanged:
+                n_skipped += 1
+                continue
+
+            if verbose:
+                print('Writing inputs to:', job_dir)
+            if copy_from is not None:
+                shutil.copytree(copy_from, job_dir, dirs_exist_ok=True)
+            else:
+                os.makedirs(job_dir, exist_ok=True)
+
+            for file_name, contents in files.items():
+                with open(os.path.join(job_dir, file_name), 'w') as fid:
+                    fid.write(contents)
+
+            hashes[directory] = digest
+            n_written += 1
+
+    finally:
+        # Record what was written, even if the sweep is interrupted
+        if n_written:
+            os.makedirs(root_path, exist_ok=True)
+            with open(hash_file + '.tmp', 'w') as fid:
+                json.dump(hashes, fid, indent=0, sort_keys=True)
+            os.replace(hash_file + '.tmp', hash_file)
+
+    return n_written, n_skipped
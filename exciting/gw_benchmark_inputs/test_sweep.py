@@ -0,0 +1,122 @@
+import os
+
+import numpy as np
+import pytest
+
+from parse.lorecommendations_parser import parse_lorecommendations_array
+from parse.parse_basis_xml import parse_basis_as_string
+from parse.set_gw_input import GWInput
+from process.optimised_basis import DefaultLOs, filter_lo_functions, generate_optimised_basis_string
+from gw_benchmark_inputs.input_utils import write_input_file, write_optimised_lo_basis
+from gw_benchmark_inputs.sweep import CompiledTemplate, SpeciesBasis, gw_input_variants, load_species_template, \
+    write_variants
+
+gs_input = """<input>
+   <groundstate do="skip" ngridk="2 2 2"></groundstate>
+   {GW_INPUT}
+</input>
+"""
+
+
+class FakeBasis:
+    """
+    Stand-in for SpeciesBasis, rendering the energy cut-off into the species file
+    """
+    def __init__(self, species: str):
+        self.species = species
+
+    @property
+    def file_name(self) -> str:
+        return self.species.capitalize() + '.xml'
+
+    def render(self, energy_cutoff) -> str:
+        return '<species chemicalSymbol="' + self.species + '" cutoff="' + str(energy_cutoff) + '"/>'
+
+
+def sweep_variants(zr_cutoffs=(100, 200)):
+    bases = {'zr_lmax6': {'zr': FakeBasis('zr')}}
+    energy_cutoffs = {'zr_lmax6': [{'zr': cutoff} for cutoff in zr_cutoffs]}
+    return gw_input_variants(gs_input, bases, energy_cutoffs,
+                             ngridq=[[2, 2, 2], [4, 4, 4]], nempty=[100], nomeg=[16, 32])
+
+
+@pytest.mark.parametrize('template', ['', 'no fields', '{a}', '{a}{b}', 'x {a} y {b} {a} z', '{{literal}} {a} }}'])
+def test_compiled_template_matches_str_format(template):
+    values = {'a': 1, 'b': 'two'}
+    assert CompiledTemplate(template).render(values) == template.format(**values)
+
+
+def test_gw_input_variants_match_write_input_file(tmp_path):
+    variants = list(sweep_variants())
+    assert len(variants) == 2 * 2 * 2, "One variant per q-grid, nomeg and energy cut-off"
+
+    for directory, files, settings in variants:
+        gw_input = GWInput(taskname='g0w0', nempty=settings['nempty'], ngridq=settings['ngridq'],
+                           skipgnd=False, n_omega=settings['nomeg'])
+        gw_root = write_input_file(str(tmp_path / settings['basis']), gs_input, gw_input)
+        expected_directory = os.path.join(gw_root, 'max_energy_i' + str(settings['energy_index']))
+
+        assert os.path.join(str(tmp_path), directory) == expected_directory
+        with open(os.path.join(gw_root, 'input.xml')) as fid:
+            assert files['input.xml'] == fid.read()
+        assert files['Zr.xml'] == FakeBasis('zr').render([100, 200][settings['energy_index']])
+
+
+def test_write_variants_skips_unchanged_inputs(tmp_path):
+    root = str(tmp_path)
+    n_variants = 8
+
+    assert write_variants(root, sweep_variants()) == (n_variants, 0)
+    directory, files, _ = next(sweep_variants())
+    for file_name, contents in files.items():
+        with open(os.path.join(root, directory, file_name)) as fid:
+            assert fid.read() == contents
+
+    assert write_variants(root, sweep_variants()) == (0, n_variants), "Unchanged inputs are skipped"
+
+    # Changing the second cut-off changes half of the species files
+    assert write_variants(root, sweep_variants(zr_cutoffs=(100, 300))) == (n_variants // 2, n_variants // 2)
+    with open(os.path.join(root, 'zr_lmax6/gw_q222_omeg16_nempty100/max_energy_i1/Zr.xml')) as fid:
+        assert fid.read() == FakeBasis('zr').render(300)
+
+    # Deleted inputs are rewritten, even though their hash is unchanged
+    os.remove(os.path.join(root, directory, 'Zr.xml'))
+    assert write_variants(root, sweep_variants(zr_cutoffs=(100, 300))) == (1, n_variants - 1)
+    assert os.path.isfile(os.path.join(root, directory, 'Zr.xml'))
+
+    assert write_variants(root, sweep_variants(zr_cutoffs=(100, 300)), force=True) == (n_variants, 0)
+
+
+def test_species_basis_matches_generate_optimised_basis_string(tmp_path):
+    """
+    Render the example Zr basis with SpeciesBasis, and compare to the species file
+    of the original, per-directory, set-up.
+    Path assumes run from project root
+    """
+    species_file = 'parse/example_data/Zr.xml'
+    # Example recommendations are for l = 0 to 6: Pad to the 8 l-channels expected of exciting
+    lorecommendations = parse_lorecommendations_array('parse/example_data/lorecommendations.dat')[0]
+    lorecommendations = np.concatenate((lorecommendations, lorecommendations[-1:]))
+    # Zr.xml has custom LOs for l = 0 to 5
+    default_los = DefaultLOs({0: [-1.39], 1: [-0.51], 2: [0.33], 3: [1.0], 4: [1.0], 5: [1.0]}, energy_tol=0.1)
+    energy_cutoffs = [{l: 60. for l in range(0, 6)},
+                      {0: 150., 1: 120., 2: 100., 3: 100., 4: 80., 5: 60.}]
+
+    basis = SpeciesBasis('zr', load_species_template(species_file), default_los, lorecommendations)
+    default_basis_string = parse_basis_as_string(species_file)
+
+    for i, energy_cutoff in enumerate(energy_cutoffs):
+        expected = generate_optimised_basis_string(default_basis_string,
+                                                   filter_lo_functions(lorecommendations, default_los, energy_cutoff),
+                                                   max_matching_order=1)
+        assert '{custom_l' not in expected
+        assert basis.render(energy_cutoff) == expected
+        assert basis.render(energy_cutoff) is basis.render(energy_cutoff), "Rendered once per set of cut-offs"
+
+        job_dir = str(tmp_path / str(i))
+        os.makedirs(job_dir)
+        write_optimised_lo_basis('zr', 5, energy_cutoff, lorecommendations, default_basis_string, default_los, job_dir)
+        with open(os.path.join(job_dir, basis.file_name)) as fid:
+            assert fid.read() == basis.render(energy_cutoff)
+
+    assert basis.render(energy_cutoffs[0]) != basis.render(energy_cutoffs[1])
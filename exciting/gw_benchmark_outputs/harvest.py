@@ -0,0 +1,122 @@
+"""
+Harvest GW results from many calculation directories.
+
+Directories are parsed over a pool of processes, and results are cached on disk
+such that only directories whose outputs have changed since the last harvest
+are re-parsed.
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from parse.parse_gw import parse_gw_info, parse_gw_evalqp
+from process.process_gw import process_gw_gamma_point
+
+# Files parsed per directory, which determine whether cached results are valid
+gw_output_files = ['GW_INFO.OUT', 'EVALQP.DAT']
+
+
+def file_signature(file_path: str) -> tuple:
+    """
+    Signature of the GW outputs in a directory, used as a cache key
+
+    :param str file_path: Calculation directory
+    :return: tuple of (file name, mtime, size) per output. mtime and size are
+     None if the output does not exist
+    """
+    signature = []
+    for file_name in gw_output_files:
+        try:
+            stat = os.stat(os.path.join(file_path, file_name))
+            signature.append((file_name, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((file_name, None, None))
+    return tuple(signature)
+
+
+def parse_gw_gamma_point(file_path: str) -> dict:
+    """
+    Parse a GW calculation directory and process the gap and self-energies at Gamma
+
+    :param str file_path: Calculation directory
+    :return: dict, as returned by process_gw_gamma_point. Empty if outputs are missing
+    """
+    gw_data = parse_gw_info(file_path)
+    qp_data = parse_gw_evalqp(file_path)
+    return process_gw_gamma_point(gw_data, qp_data)
+
+
+class GWResultsCache:
+    """
+    On-disk cache of processed GW results, keyed by directory and
+    the file signature of its outputs
+
+    :param str cache_file: Cache file name. If None, nothing is persisted
+    """
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file
+        self.entries = {}
+        if cache_file is not None and os.path.isfile(cache_file):
+            with open(cache_file, 'rb') as fid:
+                self.entries = pickle.load(fid)
+
+    def get(self, file_path: str, signature: tuple):
+        """
+        :return: Cached results if the signature matches, else None
+        """
+        key = os.path.abspath(file_path)
+        if key in self.entries and self.entries[key][0] == signature:
+            return self.entries[key][1]
+        return None
+
+    def put(self, file_path: str, signature: tuple, results: dict):
+        self.entries[os.path.abspath(file_path)] = (signature, results)
+
+    def save(self):
+        if self.cache_file is None:
+            return
+        # Write then rename, such that an interrupted save cannot corrupt the cache
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'wb') as fid:
+            pickle.dump(self.entries, fid)
+        os.replace(tmp_file, self.cache_file)
+
+
+def harvest_gw_results(directories: List[str], cache_file=None, n_processes=1, verbose=True) -> List[dict]:
+    """
+    Parse GW results at Gamma from each directory.
+
+    Directories with cached results whose outputs are unchanged are not re-parsed.
+    Remaining directories are parsed in parallel if n_processes > 1.
+
+    :param List[str] directories: Calculation directories
+    :param cache_file: Optional cache file name
+    :param n_processes: Number of processes. None uses all available cores
+    :param bool verbose: Print the directories that are parsed
+    :return: List of results, as returned by process_gw_gamma_point, ordered as directories
+    """
+    cache = GWResultsCache(cache_file)
+    signatures = [file_signature(directory) for directory in directories]
+    results = [cache.get(directory, signature) for directory, signature in zip(directories, signatures)]
+
+    stale = [i for i, result in enumerate(results) if result is None]
+    if verbose:
+        for i in stale:
+            print('Reading data from ', directories[i])
+
+    stale_directories = [directories[i] for i in stale]
+    if n_processes == 1 or len(stale) <= 1:
+        parsed = [parse_gw_gamma_point(directory) for directory in stale_directories]
+    else:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            parsed = list(executor.map(parse_gw_gamma_point, stale_directories))
+
+    for i, result in zip(stale, parsed):
+        results[i] = result
+        cache.put(directories[i], signatures[i], result)
+
+    if stale:
+        cache.save()
+
+    return results
@@ -11,8 +11,7 @@ from typing import List
 from exciting_utils import py_grep
 
 from process.optimised_basis import parse_species_string, create_lo_label
-from parse.parse_gw import parse_gw_info, parse_gw_evalqp
-from process.process_gw import process_gw_gamma_point
+from gw_benchmark_outputs.harvest import harvest_gw_results
 
 from gw_benchmark_inputs.input_utils import restructure_energy_cutoffs
 
@@ -70,7 +69,7 @@ def max_energy_ext_per_directory(energy_cutoffs):
 
 
 # TODO Split this routine up and call the one below
-def parse_gw_results(root: str, settings: dict, dir_prefix='max_energy_') -> dict:
+def parse_gw_results(root: str, settings: dict, dir_prefix='max_energy_', cache_file=None, n_processes=1) -> dict:
     """
 
     QP direct-gap (relative to the KS gap)
@@ -78,6 +77,9 @@ def parse_gw_results(root: str, settings: dict, dir_prefix='max_energy_') -> dic
 
     Almost easier to just path full directive strings.
 
+    :param cache_file: Optional cache file. Only directories with modified outputs are re-parsed
+    :param n_processes: Number of processes used to parse directories. None uses all cores
+
     :return: dictionary containing the above.
     """
 
@@ -101,23 +103,20 @@ def parse_gw_results(root: str, settings: dict, dir_prefix='max_energy_') -> dic
     q_str = "".join(str(q) for q in q_grid)
 
     # Lmax in LO basis
+    file_paths = []
     for i, l_max in enumerate(l_max_values):
         basis_root = root + '/' + directory_to_string(l_max) + 'rgkmax' + str(rgkmax)
         gw_root = basis_root + "/gw_q" + q_str + "_omeg" + str(n_img_freq) + "_nempty" + str(n_empty_ext[i])
 
         # Max energy cut-off of LOs in each l-channel
-        for ienergy, energy in enumerate(max_energy_exts):
-            file_path = gw_root + '/' + dir_prefix + str(energy)
-
-            gw_data = parse_gw_info(file_path)
-            qp_data = parse_gw_evalqp(file_path)
+        for energy in max_energy_exts:
+            file_paths.append(gw_root + '/' + dir_prefix + str(energy))
 
-            print('Reading data from ', file_path)
-            #print(gw_data['i_VBM'], gw_data['i_CBm'])
-            qp_gamma = qp_data[0]['results']
-            #print(qp_gamma[gw_data['i_CBm']]['E_KS'] - qp_gamma[gw_data['i_VBM']]['E_KS'])
+    all_results = harvest_gw_results(file_paths, cache_file=cache_file, n_processes=n_processes)
 
-            results = process_gw_gamma_point(gw_data, qp_data)
+    for i in range(0, len(l_max_values)):
+        for ienergy in range(0, len(max_energy_exts)):
+            results = all_results[i * len(max_energy_exts) + ienergy]
             E_qp[ienergy, i] = results['E_qp']
             E_ks[ienergy, i] = results['E_ks']
             delta_E_qp[ienergy, i] = results['E_qp'] - results['E_ks']
@@ -132,7 +131,7 @@ def parse_gw_results(root: str, settings: dict, dir_prefix='max_energy_') -> dic
             }
 
 
-def parse_gw_results_two(gw_root: str, directories: list) -> dict:
+def parse_gw_results_two(gw_root: str, directories: list, cache_file=None, n_processes=1) -> dict:
     """
 
     QP direct-gap (relative to the KS gap)
@@ -140,6 +139,9 @@ def parse_gw_results_two(gw_root: str, directories: list) -> dict:
 
     Almost easier to just path full directive strings.
 
+    :param cache_file: Optional cache file. Only directories with modified outputs are re-parsed
+    :param n_processes: Number of processes used to parse directories. None uses all cores
+
     :return: dictionary containing the above.
     """
 
@@ -149,12 +151,10 @@ def parse_gw_results_two(gw_root: str, directories: list) -> dict:
     re_self_energy_CBm = np.empty(shape=delta_E_qp.shape)
 
     # Directory extension
-    for ienergy, directory in enumerate(directories):
-        file_path = gw_root + '/' + directory
-        gw_data = parse_gw_info(file_path)
-        qp_data = parse_gw_evalqp(file_path)
-        print('Reading data from ', file_path)
-        results = process_gw_gamma_point(gw_data, qp_data)
+    file_paths = [gw_root + '/' + directory for directory in directories]
+    all_results = harvest_gw_results(file_paths, cache_file=cache_file, n_processes=n_processes)
+
+    for ienergy, results in enumerate(all_results):
         delta_E_qp[ienergy] = results['E_qp'] - results['E_ks']
         re_self_energy_VBM[ienergy] = results['re_sigma_VBM']
         re_self_energy_CBm[ienergy] = results['re_sigma_CBm']
@@ -0,0 +1,263 @@
+"""
+HDF5 store of parsed exciting GW outputs.
+
+Results of many calculations are held in a single file, such that plot scripts
+read them from one place rather than re-parsing many small text files.
+
+Layout, per calculation:
+
+  /<basis>/<run path>/            attrs: signature of the parsed outputs
+      evalqp/k_points             (n_k, 3)
+      evalqp/weights              (n_k)
+      evalqp/<key>                (n_k, n_states), for key in evalqp_keys
+      gw_info                     attrs: GW_INFO.OUT variables
+      timings                     attrs: GW_INFO.OUT timings
+      linengy/<atom label>/<l>    linear energies of the l-channel
+
+Array datasets are chunked and compressed, and support partial reads.
+
+Example usage:
+
+  with GWResultsStore('results.h5') as store:
+      store.update(run_path, 'default', directory)
+      e_gw_gamma = store.read_evalqp(run_path, 'default', keys=['E_GW'], k_points=0)['E_GW']
+"""
+import os
+
+import h5py
+import numpy as np
+
+from parse.parse_gw import parse_gw_evalqp, parse_gw_info, parse_gw_timings, evalqp_keys
+from parse.parse_linengy import parse_lo_linear_energies
+from gw_benchmark_outputs.harvest import file_signature
+
+compression = 'gzip'
+
+
+def _write_array(group: h5py.Group, name: str, data: np.ndarray):
+    """
+    Write or overwrite a dataset.
+
+    Datasets are written in place if the shape and type are unchanged,
+    else replaced.
+    """
+    data = np.asarray(data)
+    if name in group:
+        dataset = group[name]
+        if dataset.shape == data.shape and dataset.dtype == data.dtype:
+            dataset[...] = data
+            return
+        del group[name]
+
+    if data.ndim == 0 or data.size == 0:
+        group.create_dataset(name, data=data)
+    else:
+        group.create_dataset(name, data=data, chunks=True, compression=compression)
+
+
+def _write_attributes(group: h5py.Group, name: str, data: dict):
+    """
+    Write a dictionary of scalars as attributes of a (sub)group, replacing any prior (sub)group
+    """
+    # Track order, such that attributes are read back in the order written
+    if name in group:
+        del group[name]
+    sub_group = group.create_group(name, track_order=True)
+    for key, value in data.items():
+        sub_group.attrs[key] = value
+
+
+class GWResultsStore:
+    """
+    HDF5-backed store of GW results, grouped by basis settings and run path
+
+    :param str file_name: HDF5 file name. Created if it does not exist
+    :param str mode: h5py file mode. 'a' to read and append, 'r' for read-only
+    """
+    def __init__(self, file_name: str, mode='a'):
+        self.file_name = file_name
+        self.file = h5py.File(file_name, mode)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def key(run_path: str, basis: str) -> str:
+        return basis + '/' + run_path.strip('/')
+
+    def contains(self, run_path: str, basis: str) -> bool:
+        return self.key(run_path, basis) in self.file
+
+    def runs(self, basis: str) -> list:
+        """
+        :return: Run paths stored for the basis settings
+        """
+        if basis not in self.file:
+            return []
+        run_paths = []
+        # Runs are the groups containing results, which may be nested
+        self.file[basis].visititems(lambda name, obj: run_paths.append(name)
+                                    if isinstance(obj, h5py.Group) and 'signature' in obj.attrs else None)
+        return run_paths
+
+    def signature(self, run_path: str, basis: str):
+        """
+        :return: File signature of the outputs when last stored, or None
+        """
+        key = self.key(run_path, basis)
+        if key not in self.file or 'signature' not in self.file[key].attrs:
+            return None
+        return self.file[key].attrs['signature']
+
+    # Writing
+
+    def write_evalqp(self, run_path: str, basis: str, qp_data: dict):
+        """
+        :param qp_data: Returned from parse_gw_evalqp
+        """
+        if not qp_data:
+            return
+        group = self.file.require_group(self.key(run_path, basis)).require_group('evalqp')
+        _write_array(group, 'k_points', qp_data['k_points'])
+        _write_array(group, 'weights', qp_data['weights'])
+        for key in qp_data['results'].dtype.names:
+            _write_array(group, key, qp_data['results'][key])
+
+    def write_gw_info(self, run_path: str, basis: str, gw_data: dict):
+        """
+        :param gw_data: Returned from parse_gw_info
+        """
+        _write_attributes(self.file.require_group(self.key(run_path, basis)), 'gw_info', gw_data)
+
+    def write_timings(self, run_path: str, basis: str, timings: dict):
+        """
+        :param timings: Returned from parse_gw_timings
+        """
+        _write_attributes(self.file.require_group(self.key(run_path, basis)), 'timings', timings)
+
+    def write_linear_energies(self, run_path: str, basis: str, linear_energies: dict):
+        """
+        :param linear_energies: Returned from parse_lo_linear_energies
+        """
+        run = self.file.require_group(self.key(run_path, basis))
+        if 'linengy' in run:
+            del run['linengy']
+        group = run.create_group('linengy', track_order=True)
+        for atom_label, energies in linear_energies.items():
+            atom_group = group.create_group(atom_label)
+            for l_value, energy_parameters in energies.items():
+                _write_array(atom_group, str(l_value), np.asarray(energy_parameters, dtype=np.float64))
+
+    def update(self, run_path: str, basis: str, directory: str, force=False) -> bool:
+        """
+        Parse the outputs of a calculation and store them.
+
+        Outputs are only parsed if they have changed since they were last stored.
+        Results of outputs that no longer exist are removed, such that the store
+        never holds results that are inconsistent with the stored signature.
+
+        :param str run_path: Key of the calculation, for example its path relative to the benchmark root
+        :param str basis: Basis settings label
+        :param str directory: Calculation directory
+        :param bool force: Parse, regardless of whether outputs have changed
+        :return: True if the stored results were updated
+        """
+        signature = repr(file_signature(directory) + linengy_signature(directory))
+        if not force and self.signature(run_path, basis) == signature:
+            return False
+
+        run = self.file.require_group(self.key(run_path, basis))
+
+        def remove(name: str):
+            if name in run:
+                del run[name]
+
+        qp_data = parse_gw_evalqp(directory)
+        if qp_data:
+            self.write_evalqp(run_path, basis, qp_data)
+        else:
+            remove('evalqp')
+
+        if os.path.isfile(os.path.join(directory, 'GW_INFO.OUT')):
+            self.write_gw_info(run_path, basis, parse_gw_info(directory))
+            self.write_timings(run_path, basis, parse_gw_timings(directory))
+        else:
+            remove('gw_info')
+            remove('timings')
+
+        if os.path.isfile(os.path.join(directory, 'LINENGY.OUT')):
+            self.write_linear_energies(run_path, basis, parse_lo_linear_energies(directory))
+        else:
+            remove('linengy')
+
+        run.attrs['signature'] = signature
+        return True
+
+    # Reading
+
+    def read_evalqp(self, run_path: str, basis: str, keys=None, k_points=slice(None), states=slice(None)) -> dict:
+        """
+        Read EVALQP quantities. Only the requested elements are read from disk.
+
+        :param keys: Quantities to read, from evalqp_keys. Defaults to all
+        :param k_points: k-point index or slice
+        :param states: State index or slice, indexing from zero
+        :return: dict of k_points, weights and each requested quantity. Empty if not stored
+        """
+        key = self.key(run_path, basis) + '/evalqp'
+        if key not in self.file:
+            return {}
+        group = self.file[key]
+
+        if keys is None:
+            keys = [key for key in evalqp_keys if key in group]
+
+        data = {'k_points': group['k_points'][k_points],
+                'weights': group['weights'][k_points]}
+        for key in keys:
+            data[key] = group[key][k_points, states]
+        return data
+
+    def _read_attributes(self, run_path: str, basis: str, name: str) -> dict:
+        key = self.key(run_path, basis) + '/' + name
+        if key not in self.file:
+            return {}
+        return {key: value.item() if isinstance(value, np.generic) else value
+                for key, value in self.file[key].attrs.items()}
+
+    def read_gw_info(self, run_path: str, basis: str) -> dict:
+        return self._read_attributes(run_path, basis, 'gw_info')
+
+    def read_timings(self, run_path: str, basis: str) -> dict:
+        return self._read_attributes(run_path, basis, 'timings')
+
+    def read_linear_energies(self, run_path: str, basis: str) -> dict:
+        """
+        :return: Linear energies, in the form returned by parse_lo_linear_energies
+        """
+        key = self.key(run_path, basis) + '/linengy'
+        if key not in self.file:
+            return {}
+
+        linear_energies = {}
+        for atom_label, atom_group in self.file[key].items():
+            l_values = sorted(int(l_value) for l_value in atom_group.keys())
+            linear_energies[atom_label] = {l_value: atom_group[str(l_value)][()] for l_value in l_values}
+        return linear_energies
+
+
+def linengy_signature(directory: str) -> tuple:
+    """
+    Signature of LINENGY.OUT, complementing file_signature
+    """
+    try:
+        stat = os.stat(os.path.join(directory, 'LINENGY.OUT'))
+        return (('LINENGY.OUT', stat.st_mtime_ns, stat.st_size),)
+    except FileNotFoundError:
+        return (('LINENGY.OUT', None, None),)
@@ -3,12 +3,14 @@ Plots
 """
 from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
 
+from exciting_utils.lazy_import import lazy_import
 from parse.parse_gw import parse_gw_info, parse_gw_evalqp
 from process.process_gw import process_gw_gamma_point
 from units_and_constants.unit_conversions import ha_to_mev
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 def directory_string(l_max:OrderedDict) -> str:
     """
@@ -5,13 +5,15 @@ Generate Plots and Post-process Data
 # External libraries
 from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
 
 # My modules
+from exciting_utils.lazy_import import lazy_import
 from units_and_constants.unit_conversions import ha_to_mev
 from ex_plot.plot import Plot
 from gw_benchmark_outputs.post_process_utils import parse_gw_results, get_basis_labels, combine_species_basis_labels
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 def process_basis_numbers(l_max_values, delta_E_qp, max_energy_exts:list, max_energy):
     """
@@ -3,13 +3,15 @@ Plots
 """
 # External libraries
 from collections import OrderedDict
-import matplotlib.pyplot as plt
 
 # My modules
+from exciting_utils.lazy_import import lazy_import
 from units_and_constants.unit_conversions import ha_to_mev
 from gw_benchmark_outputs.post_process_utils import parse_gw_results, get_basis_labels, combine_species_basis_labels, \
     n_local_orbitals
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 def process_basis_numbers(delta_E_qp, max_energy_exts:list):
     """
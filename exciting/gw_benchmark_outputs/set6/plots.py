@@ -2,14 +2,16 @@
 Plots
 """
 # External libraries
-import matplotlib.pyplot as plt
 from typing import List
 import re
 
 # My modules
+from exciting_utils.lazy_import import lazy_import
 from units_and_constants.unit_conversions import ha_to_mev
 from gw_benchmark_outputs.post_process_utils import parse_gw_results_two, n_local_orbitals, get_basis_labels_AHH
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 def change_in_qp_gap(delta_E_qp, max_energy_exts: list):
     """
@@ -4,13 +4,15 @@ Plots
 # External libraries
 from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
 
 # My modules
+from exciting_utils.lazy_import import lazy_import
 from units_and_constants.unit_conversions import ha_to_mev
 from gw_benchmark_outputs.post_process_utils import parse_gw_results, get_basis_labels, combine_species_basis_labels, \
     n_local_orbitals
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 def process_basis_numbers(delta_E_qp, max_energy_exts:list):
     """
@@ -60,6 +62,8 @@ def gw_basis_convergence(root: str):
         l-max = (4, 4)
     """
     D = OrderedDict
+    # Results of unchanged calculations are read from the cache, rather than re-parsed
+    cache_file = root + '/gw_results_cache.pkl'
 
     # --------------------------------------------
     # Extra Zr l-Channel. l_max(Zr, O) = (4, 2)
@@ -73,7 +77,7 @@ def gw_basis_convergence(root: str):
                    'max_energy_cutoffs': ['i0', 'i1', 'i2', 'i3', 'i4']
                    }
 
-    data_set_zr = parse_gw_results(root, settings_zr)
+    data_set_zr = parse_gw_results(root, settings_zr, cache_file=cache_file)
     E_qp_zr = data_set_zr['E_qp'][:, 0] * ha_to_mev
     E_ks_zr = data_set_zr['E_ks'][:, 0] * ha_to_mev
     delta_E_qp_zr = data_set_zr['delta_E_qp'][:, 0] * ha_to_mev
@@ -99,7 +103,7 @@ def gw_basis_convergence(root: str):
                   'max_energy_cutoffs': max_energy_exts_o
                   }
 
-    data_set_o = parse_gw_results(root, settings_o)
+    data_set_o = parse_gw_results(root, settings_o, cache_file=cache_file)
     E_qp_o = data_set_o['E_qp'][:, 0] * ha_to_mev
     E_ks_o = data_set_o['E_ks'][:, 0] * ha_to_mev
     delta_E_qp_o = data_set_o['delta_E_qp'][:, 0] * ha_to_mev
@@ -132,7 +136,7 @@ def gw_basis_convergence(root: str):
                    'max_energy_cutoffs': ['i1', 'i2', 'i3', 'i4']  # i0 failed => 'i0',ignore it for now
                    }
 
-    data_set_zr = parse_gw_results(root, settings_zr)
+    data_set_zr = parse_gw_results(root, settings_zr, cache_file=cache_file)
     E_qp_zr = data_set_zr['E_qp'][:, 0] * ha_to_mev
     E_ks_zr = data_set_zr['E_ks'][:, 0] * ha_to_mev
     print("KS gap has changed by 0.3 meV when moving to the (5, 3) basis\n"
@@ -160,7 +164,7 @@ def gw_basis_convergence(root: str):
                    'max_energy_cutoffs': ['i0', 'i1', 'i2']
                    }
 
-    data_set_o = parse_gw_results(root, settings_o)
+    data_set_o = parse_gw_results(root, settings_o, cache_file=cache_file)
     E_qp_o = data_set_o['E_qp'][:, 0] * ha_to_mev
     E_ks_o = data_set_o['E_ks'][:, 0] * ha_to_mev
     delta_E_qp_o = data_set_o['delta_E_qp'][:, 0] * ha_to_mev
@@ -1,11 +1,13 @@
 import os
 from typing import List
-import matplotlib.pyplot as plt
 
+from exciting_utils.lazy_import import lazy_import
 from units_and_constants.unit_conversions import ha_to_mev
 
 from plots import process_gw_calculation
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 def get_empty_states_vs_qp(root: str, nempty_states: List[int]):
     """
@@ -5,9 +5,9 @@ Plot set 8 data
 import numpy as np
 import os
 from typing import List
-import matplotlib.pyplot as plt
 from collections import OrderedDict
 
+from exciting_utils.lazy_import import lazy_import
 from parse.set_gw_input import GWInput
 from parse.parse_gw import parse_gw_info, parse_gw_evalqp
 from process.process_gw import process_gw_gamma_point, process_gw_gap
@@ -17,6 +17,8 @@ from gw_benchmark_outputs.post_process_utils import get_basis_labels
 # Energy cutoffs
 from gw_benchmark_inputs.set8.basis import set_lo_channel_cutoffs, n_energies_per_channel
 
+plt = lazy_import('matplotlib.pyplot')
+
 # GLOBAL
 save_plots = True
 
@@ -1,15 +1,17 @@
 """
 Extract/Plot each quasi-particle gap as a function of q-points
 """
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 from typing import List, Optional
 
+from exciting_utils.lazy_import import lazy_import
 from parse.parse_gw import parse_gw_info, parse_gw_evalqp
 from process.process_gw import process_gw_gap
 from units_and_constants.unit_conversions import ha_to_mev
 
+plt = lazy_import('matplotlib.pyplot')
+
 
 class Gap:
     def __init__(self, v: list, c: list, v_label: Optional[str] = '', c_label: Optional[str] = ''):
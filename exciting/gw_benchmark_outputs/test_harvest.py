@@ -0,0 +1,68 @@
+import os
+import shutil
+
+from gw_benchmark_outputs import harvest
+from gw_benchmark_outputs.harvest import GWResultsCache, file_signature, harvest_gw_results
+
+
+class CountingParser:
+    """
+    Wrap parse_gw_gamma_point, recording the directories parsed
+    """
+    def __init__(self, parse):
+        self.parse = parse
+        self.parsed = []
+
+    def __call__(self, file_path: str) -> dict:
+        self.parsed.append(file_path)
+        return self.parse(file_path)
+
+
+def test_harvest_gw_results_cache(tmp_path, monkeypatch):
+    """
+    Harvest example outputs, then harvest again after touching or modifying outputs.
+    Path assumes run from project root
+    """
+    directories = []
+    for i in range(0, 3):
+        directory = str(tmp_path / ('run_' + str(i)))
+        shutil.copytree('parse/example_data', directory)
+        directories.append(directory)
+    cache_file = str(tmp_path / 'gw_results.pkl')
+
+    parser = CountingParser(harvest.parse_gw_gamma_point)
+    monkeypatch.setattr(harvest, 'parse_gw_gamma_point', parser)
+
+    results = harvest_gw_results(directories, cache_file=cache_file, verbose=False)
+    assert parser.parsed == directories, "All directories are parsed on the first harvest"
+    assert os.path.isfile(cache_file)
+    assert results[0] == results[1] == results[2]
+    assert set(results[0].keys()) == {'E_ks', 'E_qp', 're_sigma_VBM', 're_sigma_CBm'}
+
+    parser.parsed = []
+    assert harvest_gw_results(directories, cache_file=cache_file, verbose=False) == results
+    assert parser.parsed == [], "Unchanged outputs are read from the cache"
+
+    # Touching an output changes its mtime, so invalidates its cache entry
+    evalqp = os.path.join(directories[1], 'EVALQP.DAT')
+    stat = os.stat(evalqp)
+    os.utime(evalqp, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    parser.parsed = []
+    assert harvest_gw_results(directories, cache_file=cache_file, verbose=False) == results
+    assert parser.parsed == [directories[1]]
+
+    # Modifying an output changes its size, even if its mtime is restored
+    gw_info = os.path.join(directories[2], 'GW_INFO.OUT')
+    stat = os.stat(gw_info)
+    with open(gw_info, 'a') as fid:
+        fid.write('\n')
+    os.utime(gw_info, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert file_signature(directories[2]) != GWResultsCache(cache_file).entries[directories[2]][0]
+
+    parser.parsed = []
+    harvest_gw_results(directories, cache_file=cache_file, verbose=False)
+    assert parser.parsed == [directories[2]]
+
+    # Removed outputs are not served from the cache
+    os.remove(os.path.join(directories[0], 'EVALQP.DAT'))
+    assert GWResultsCache(cache_file).get(directories[0], file_signature(directories[0])) is None
@@ -0,0 +1,63 @@
+import shutil
+
+import numpy as np
+
+from parse.parse_gw import parse_gw_evalqp, parse_gw_info, parse_gw_timings
+from parse.parse_linengy import parse_lo_linear_energies
+from gw_benchmark_outputs.results_store import GWResultsStore
+
+
+def test_results_store_round_trip(tmp_path):
+    """
+    Store the example outputs and read them back.
+    Path assumes run from project root
+    """
+    directory = 'parse/example_data'
+    file_name = str(tmp_path / 'results.h5')
+
+    with GWResultsStore(file_name) as store:
+        assert store.update('set1/run', 'default', directory)
+        assert not store.update('set1/run', 'default', directory), "Unchanged outputs are not re-parsed"
+
+    with GWResultsStore(file_name, mode='r') as store:
+        assert store.runs('default') == ['set1/run']
+        assert store.read_gw_info('set1/run', 'default') == parse_gw_info(directory)
+        assert store.read_timings('set1/run', 'default') == parse_gw_timings(directory)
+
+        linear_energies = parse_lo_linear_energies(directory)
+        stored_linear_energies = store.read_linear_energies('set1/run', 'default')
+        assert list(stored_linear_energies) == list(linear_energies)
+        for atom_label, energies in linear_energies.items():
+            for l_value, energy_parameters in energies.items():
+                assert np.array_equal(stored_linear_energies[atom_label][l_value], energy_parameters)
+
+        qp_data = parse_gw_evalqp(directory)
+        gamma = store.read_evalqp('set1/run', 'default', keys=['E_GW'], k_points=0, states=slice(0, 20))
+        assert np.allclose(gamma['k_points'], 0.)
+        assert np.array_equal(gamma['E_GW'], qp_data['results']['E_GW'][0, 0:20])
+
+
+def test_results_of_removed_outputs_are_removed(tmp_path):
+    """
+    Outputs deleted since the last update should not leave stale results behind
+    """
+    directory = tmp_path / 'run'
+    shutil.copytree('parse/example_data', directory)
+    file_name = str(tmp_path / 'results.h5')
+
+    with GWResultsStore(file_name) as store:
+        assert store.update('run', 'default', str(directory))
+        assert store.read_evalqp('run', 'default') and store.read_linear_energies('run', 'default')
+
+        (directory / 'EVALQP.DAT').unlink()
+        (directory / 'LINENGY.OUT').unlink()
+        assert store.update('run', 'default', str(directory))
+        assert store.read_evalqp('run', 'default') == {}
+        assert store.read_linear_energies('run', 'default') == {}
+        assert store.read_gw_info('run', 'default') == parse_gw_info(str(directory))
+
+        (directory / 'GW_INFO.OUT').unlink()
+        assert store.update('run', 'default', str(directory))
+        assert store.read_gw_info('run', 'default') == {}
+        assert store.read_timings('run', 'default') == {}
+        assert store.runs('default') == ['run']
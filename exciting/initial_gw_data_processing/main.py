@@ -1,7 +1,7 @@
 from parse.parse_gw import parse_gw_evalqp, parse_gw_info, parse_gw_timings
 
 gw_data = parse_gw_info(file_path="./parse")
-qp_data = parse_gw_evalqp("./parse", nempty=600, nkpts=3)
+qp_data = parse_gw_evalqp("./parse")
 gw_timings = parse_gw_timings(file_path="./parse")
 
 
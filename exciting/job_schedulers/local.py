@@ -0,0 +1,400 @@
+"""
+Run a batch of jobs locally, for example on a workstation or inside a single
+(multi-node) allocation, rather than submitting each job to the scheduler.
+
+Jobs are defined from the same directives used to generate SLURM and PBS Pro
+scripts, or from the SunJob objects used to generate SGE scripts
+(Modules/scheduler/sun.py). Jobs are started in order of priority, and
+lower-priority jobs are backfilled onto idle cores provided they do not delay
+the start of the highest-priority waiting job (EASY backfilling). This requires
+job wall times, which are taken from the directives.
+
+Example, running a set of GW calculations on 4 nodes of 36 cores:
+
+    executor = LocalExecutor(cores_per_node=36, hosts=['node01', 'node02', 'node03', 'node04'])
+    for job_dir in job_dirs:
+        executor.submit(job_from_slurm(job_dir, slurm_directives, env_vars))
+    return_codes = executor.run()
+    failed = [job.directory for job, code in return_codes.items() if code != 0]
+"""
+from typing import Optional, List
+from collections import OrderedDict
+import math
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import time
+
+from job_schedulers.pbs_pro import pbs_resources_string_to_vars
+
+
+def time_string_to_seconds(time_string: str) -> float:
+    """
+    Convert a wall time string to seconds
+
+    :param str time_string: Time of the form days-hours:mins:secs (SLURM) or hours:mins:secs (PBS Pro)
+    :return: Time in seconds
+    """
+    days = 0
+    if '-' in time_string:
+        days, time_string = time_string.split('-')
+    hours, mins, secs = time_string.split(':')
+    return ((int(days) * 24 + int(hours)) * 60 + int(mins)) * 60 + int(secs)
+
+
+def slurm_resources_to_vars(slurm_directives: OrderedDict) -> tuple:
+    """
+    Extract nodes, mpi_per_node, omp_per_process from slurm directives.
+    Directives that are not set (None) default to 1.
+
+    :param slurm_directives: Ordered dictionary of slurm directives
+    :return tuple nodes, mpi_per_node, omp_per_process: Number of nodes, mpi processes per node and
+    OMP threads per process.
+    """
+    def to_int(key: str) -> int:
+        value = slurm_directives.get(key)
+        return 1 if value in [None, 'None'] else int(value)
+
+    return to_int('nodes'), to_int('ntasks-per-node'), to_int('cpus-per-task')
+
+
+class LocalJob:
+    """
+    Job to run locally
+
+    :param str directory: Directory in which to run the job
+    :param OrderedDict env_vars: Ordered dictionary of environment variables to set.
+     EXE must be specified. If OUT is specified, stdout and stderr are written to it
+    :param int nodes: Number of nodes
+    :param int mpi_per_node: MPI processes per node
+    :param int omp_per_process: OMP threads per MPI process
+    :param Optional[float] walltime: Maximum run time in seconds. Jobs are killed once exceeded.
+     If None, the job cannot be backfilled and may wait behind backfilled jobs
+    :param int priority: Jobs with higher priority are started first
+    :param Optional[list] mpi_options: Optional list of mpirun options
+    :param Optional[str] name: Job name
+    """
+    def __init__(self,
+                 directory: str,
+                 env_vars: OrderedDict,
+                 nodes: int = 1,
+                 mpi_per_node: int = 1,
+                 omp_per_process: int = 1,
+                 walltime: Optional[float] = None,
+                 priority: int = 0,
+                 mpi_options: Optional[list] = None,
+                 name: Optional[str] = None):
+        assert 'EXE' in env_vars, "EXE must be specified in env_vars"
+        assert nodes > 0, "Number of nodes must be > 0"
+        assert mpi_per_node > 0, "Number of MPI processes per node must be > 0"
+        assert omp_per_process > 0, "Number of OMP threads must be > 0"
+        self.directory = directory
+        self.env_vars = env_vars
+        self.nodes = nodes
+        self.mpi_per_node = mpi_per_node
+        self.omp_per_process = omp_per_process
+        self.walltime = walltime
+        self.priority = priority
+        self.mpi_options = [] if mpi_options is None else mpi_options
+        self.name = directory if name is None else name
+
+    @property
+    def cores_per_node(self) -> int:
+        return self.mpi_per_node * self.omp_per_process
+
+    def command(self, mpi_launcher: str, hosts: Optional[List[str]] = None, host_flag='--host') -> list:
+        """
+        Run command, consistent with the generated submission scripts:
+          mpirun -np total_mpi_procs [host_flag host1,host2] mpi_options EXE
+
+        :param str mpi_launcher: MPI launcher
+        :param Optional[List[str]] hosts: Hosts allocated to the job. Only passed to the launcher if more than one
+        :param str host_flag: Launcher option specifying the hosts
+        """
+        command = [mpi_launcher, '-np', str(self.nodes * self.mpi_per_node)]
+        if hosts is not None and len(hosts) > 1:
+            command += [host_flag, ",".join(hosts)]
+        for option in self.mpi_options:
+            command += shlex.split(option)
+        return command + shlex.split(self.env_vars['EXE'])
+
+
+def job_from_slurm(directory: str, slurm_directives: OrderedDict, env_vars: OrderedDict, priority=0) -> LocalJob:
+    """
+    Local job from the settings used to generate a slurm script, with set_slurm_script
+
+    :param str directory: Directory in which to run the job
+    :param OrderedDict slurm_directives: Ordered dictionary of slurm directives
+    :param OrderedDict env_vars: Ordered dictionary of environment variables to set
+    :param int priority: Job priority
+    :return: LocalJob
+    """
+    nodes, mpi_per_node, omp = slurm_resources_to_vars(slurm_directives)
+    walltime = slurm_directives.get('time')
+    return LocalJob(directory, env_vars, nodes, mpi_per_node, omp,
+                    walltime=None if walltime is None else time_string_to_seconds(walltime),
+                    priority=priority,
+                    name=slurm_directives.get('job-name'))
+
+
+def job_from_pbs_pro(directory: str, pbs_directives: OrderedDict, env_vars: OrderedDict,
+                     mpi_options: Optional[list] = None, priority=0) -> LocalJob:
+    """
+    Local job from the settings used to generate a PBS Pro script, with set_pbs_pro
+
+    :param str directory: Directory in which to run the job
+    :param OrderedDict pbs_directives: Ordered dictionary of PBS Pro directives
+    :param OrderedDict env_vars: Ordered dictionary of environment variables to set
+    :param Optional[list] mpi_options: Optional list of mpirun options
+    :param int priority: Job priority
+    :return: LocalJob
+    """
+    nodes, mpi_per_node, omp = pbs_resources_string_to_vars(pbs_directives)
+    walltime = pbs_directives.get('l walltime=')
+    return LocalJob(directory, env_vars, nodes, mpi_per_node, omp,
+                    walltime=None if walltime is None else time_string_to_seconds(walltime),
+                    priority=priority,
+                    mpi_options=mpi_options,
+                    name=pbs_directives.get('N'))
+
+
+def job_from_sun(directory: str, sun_job, priority=0) -> LocalJob:
+    """
+    Local job from the settings used to generate an SGE script, with generate_sun_script.
+
+    The SGE script runs 'mpirun -np ppn EXE INPUT > OUT' on a single node, so the local job does too.
+    sun_job is only accessed by attribute, such that this does not depend on the Modules tree.
+
+    :param str directory: Directory in which to run the job
+    :param sun_job: SunJob, from Modules/scheduler/sun.py
+    :param int priority: Job priority
+    :return: LocalJob
+    """
+    env_vars = OrderedDict([('EXE', sun_job.exe + ' ' + sun_job.input), ('OUT', sun_job.output)])
+    walltime = sun_job.walltime
+    if walltime in [None, 'None']:
+        walltime = None
+    else:
+        hours, mins, secs = walltime
+        walltime = (int(hours) * 60 + int(mins)) * 60 + int(secs)
+    return LocalJob(directory, env_vars, nodes=1, mpi_per_node=sun_job.ppn, omp_per_process=1,
+                    walltime=walltime, priority=priority, name=sun_job.job_name)
+
+
+def fit_job(job: LocalJob, free: List[int]) -> Optional[List[int]]:
+    """
+    Find nodes with sufficient free cores for a job, preferring the nodes with the fewest
+    free cores, to leave larger blocks free for other jobs
+
+    :param LocalJob job: Job
+    :param List[int] free: Free cores per node
+    :return: Indices of allocated nodes, or None if the job does not fit
+    """
+    candidates = sorted((n_free, i) for i, n_free in enumerate(free) if n_free >= job.cores_per_node)
+    if len(candidates) < job.nodes:
+        return None
+    return [i for _, i in candidates[:job.nodes]]
+
+
+def plan_jobs(pending: List[LocalJob], free: List[int], running: List[tuple], now: float) -> List[tuple]:
+    """
+    Select pending jobs to start now, using priority order and EASY backfilling.
+
+    Jobs are considered in order of priority. The first job that does not fit is given a
+    reservation at the earliest time at which sufficient cores are released by running jobs.
+    Subsequent jobs are only started if they fit now, and either finish before the reservation
+    or leave sufficient cores for the reserved job.
+
+    :param List[LocalJob] pending: Pending jobs, in order of priority
+    :param List[int] free: Free cores per node. Modified to account for started jobs
+    :param List[tuple] running: (end_time, nodes, cores_per_node) of each running job
+    :param float now: Current time
+    :return: List of (job, nodes) to start
+    """
+    to_start = []
+    reserved_job = None
+    shadow_time, shadow_free = math.inf, None
+
+    for job in pending:
+        nodes = fit_job(job, free)
+
+        if reserved_job is None:
+            if nodes is not None:
+                to_start.append((job, nodes))
+                for i in nodes:
+                    free[i] -= job.cores_per_node
+                running = running + [(now + (math.inf if job.walltime is None else job.walltime),
+                                      nodes, job.cores_per_node)]
+                continue
+
+            # Reserve the earliest time at which the job fits, as running jobs finish
+            reserved_job = job
+            shadow_free = list(free)
+            for end_time, running_nodes, cores_per_node in sorted(running, key=lambda x: x[0]):
+                for i in running_nodes:
+                    shadow_free[i] += cores_per_node
+                if fit_job(job, shadow_free) is not None:
+                    shadow_time = end_time
+                    break
+            continue
+
+        # Backfill
+        if nodes is None:
+            continue
+
+        if job.walltime is not None and now + job.walltime <= shadow_time:
+            ends_before_reservation = True
+        else:
+            ends_before_reservation = False
+            remaining = list(shadow_free)
+            for i in nodes:
+                remaining[i] -= job.cores_per_node
+            if fit_job(reserved_job, remaining) is None:
+                continue
+            shadow_free = remaining
+
+        to_start.append((job, nodes))
+        for i in nodes:
+            free[i] -= job.cores_per_node
+
+    return to_start
+
+
+class _RunningJob:
+    def __init__(self, job: LocalJob, process: subprocess.Popen, nodes: List[int], start_time: float, output):
+        self.job = job
+        self.process = process
+        self.nodes = nodes
+        self.start_time = start_time
+        self.output = output
+
+    @property
+    def end_time(self) -> float:
+        return self.start_time + (math.inf if self.job.walltime is None else self.job.walltime)
+
+
+class LocalExecutor:
+    """
+    Run jobs on a fixed set of nodes, with a priority queue and backfilling.
+
+    :param Optional[int] cores_per_node: Cores per node. Defaults to the number of cores of this machine
+    :param Optional[List[str]] hosts: Host names of the nodes. Defaults to this machine only
+    :param str mpi_launcher: MPI launcher
+    :param str host_flag: Launcher option specifying the hosts. '--host' for OpenMPI, '-hosts' for Intel MPI
+    :param float poll_interval: Time in seconds between checks for finished jobs
+    """
+    def __init__(self,
+                 cores_per_node: Optional[int] = None,
+                 hosts: Optional[List[str]] = None,
+                 mpi_launcher='mpirun',
+                 host_flag='--host',
+                 poll_interval=1.0):
+        self.cores_per_node = os.cpu_count() if cores_per_node is None else cores_per_node
+        self.hosts = [socket.gethostname()] if hosts is None else hosts
+        self.mpi_launcher = mpi_launcher
+        self.host_flag = host_flag
+        self.poll_interval = poll_interval
+        self.pending = []
+        self._n_submitted = 0
+
+    def submit(self, job: LocalJob):
+        """
+        Add a job to the queue. Jobs of equal priority start in order of submission
+        """
+        if job.nodes > len(self.hosts) or job.cores_per_node > self.cores_per_node:
+            raise ValueError(f'Job {job.name} requests {job.nodes} nodes of {job.cores_per_node} cores, '
+                             f'but only {len(self.hosts)} nodes of {self.cores_per_node} cores are available')
+        self.pending.append((-job.priority, self._n_submitted, job))
+        self._n_submitted += 1
+
+    def _launch(self, job: LocalJob, nodes: List[int]) -> _RunningJob:
+        env = {**os.environ, **job.env_vars, 'OMP_NUM_THREADS': str(job.omp_per_process)}
+        output = open(os.path.join(job.directory, job.env_vars['OUT']), 'w') if 'OUT' in job.env_vars else None
+        stdout = subprocess.DEVNULL if output is None else output
+        command = job.command(self.mpi_launcher, [self.hosts[i] for i in nodes], self.host_flag)
+        process = subprocess.Popen(command, cwd=job.directory, env=env, stdout=stdout, stderr=subprocess.STDOUT,
+                                   start_new_session=True)
+        return _RunningJob(job, process, nodes, time.time(), output)
+
+    @staticmethod
+    def _kill(running_job: _RunningJob):
+        """
+        Kill a job's process group. Jobs run in their own session, so do not receive
+        signals sent to this process, such as Ctrl-C
+        """
+        if running_job.process.poll() is None:
+            try:
+                os.killpg(running_job.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            running_job.process.wait()
+
+    def run(self, verbose=True) -> OrderedDict:
+        """
+        Run all submitted jobs, returning once all have finished.
+
+        If run is interrupted, for example by an exception or KeyboardInterrupt, all running jobs are killed
+        before the exception propagates. Jobs that have not started remain pending.
+
+        :param bool verbose: Print when jobs start and finish
+        :return: Ordered dictionary of {LocalJob: return code}, in order of completion.
+         Jobs are keys, rather than job names, as names need not be unique.
+         Jobs killed for exceeding their wall time have return code -9
+        """
+        free = [self.cores_per_node] * len(self.hosts)
+        running = []
+        return_codes = OrderedDict()
+
+        try:
+            self._run(free, running, return_codes, verbose)
+        finally:
+            for running_job in running:
+                self._kill(running_job)
+                if running_job.output is not None:
+                    running_job.output.close()
+                if verbose:
+                    print('Killed job', running_job.job.name)
+
+        return return_codes
+
+    def _run(self, free: List[int], running: List[_RunningJob], return_codes: OrderedDict, verbose: bool):
+        """
+        Scheduling loop of run. running and return_codes are modified in place, such that
+        run can clean up if the loop is interrupted
+        """
+        while self.pending or running:
+            now = time.time()
+
+            # Collect finished jobs, and kill any exceeding their wall time
+            for running_job in list(running):
+                if now > running_job.end_time:
+                    self._kill(running_job)
+                return_code = running_job.process.poll()
+                if return_code is None:
+                    continue
+                running.remove(running_job)
+                for i in running_job.nodes:
+                    free[i] += running_job.job.cores_per_node
+                if running_job.output is not None:
+                    running_job.output.close()
+                return_codes[running_job.job] = return_code
+                if verbose:
+                    print('Finished job', running_job.job.name, 'with return code', return_code)
+
+            self.pending.sort(key=lambda x: x[0:2])
+            pending_jobs = [job for _, _, job in self.pending]
+            planned = plan_jobs(pending_jobs, free, [(r.end_time, r.nodes, r.job.cores_per_node) for r in running],
+                                now)
+
+            started = set()
+            for job, nodes in planned:
+                if verbose:
+                    print('Starting job', job.name, 'on', ",".join(self.hosts[i] for i in nodes))
+                running.append(self._launch(job, nodes))
+                started.add(id(job))
+            self.pending = [entry for entry in self.pending if id(entry[2]) not in started]
+
+            if self.pending or running:
+                time.sleep(self.poll_interval)
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+import os
+
+import pytest
+
+import local
+from local import LocalExecutor, LocalJob, job_from_slurm, job_from_pbs_pro, job_from_sun, plan_jobs, \
+    time_string_to_seconds
+from slurm import set_slurm_directives
+from pbs_pro import set_pbs_pro_directives
+
+
+def test_jobs_from_directives():
+    env_vars = OrderedDict([('EXE', 'exciting_mpismp'), ('OUT', 'terminal.out')])
+
+    directives = set_slurm_directives(time=[1, 2, 0, 0], nodes=4, ntasks_per_node=2, cpus_per_task=18)
+    job = job_from_slurm('./', directives, env_vars)
+    assert (job.nodes, job.mpi_per_node, job.omp_per_process) == (4, 2, 18)
+    assert job.walltime == time_string_to_seconds('1-02:00:00') == 26 * 3600
+    assert job.command('mpirun') == ['mpirun', '-np', '8', 'exciting_mpismp']
+
+    directives = set_pbs_pro_directives(time=[24, 0, 0], nodes=1, mpi_ranks_per_node=8,
+                                        omp_threads_per_process=16, cores_per_node=128)
+    job = job_from_pbs_pro('./', directives, env_vars, mpi_options=['omplace -nt 16'])
+    assert (job.nodes, job.mpi_per_node, job.omp_per_process) == (1, 8, 16)
+    assert job.walltime == 24 * 3600
+    assert job.command('mpirun') == ['mpirun', '-np', '8', 'omplace', '-nt', '16', 'exciting_mpismp']
+
+
+def test_plan_jobs_with_backfill():
+    """
+    One node of 8 cores, with 6 cores busy until t = 100.
+    The highest-priority job needs all 8 cores, so is reserved for t = 100.
+    """
+    env_vars = OrderedDict([('EXE', 'exe')])
+    running = [(100., [0], 6)]
+    big = LocalJob('./', env_vars, omp_per_process=8, walltime=1000., name='big')
+    short = LocalJob('./', env_vars, omp_per_process=2, walltime=50., name='short')
+    long = LocalJob('./', env_vars, omp_per_process=2, walltime=500., name='long')
+
+    # short ends before the reservation, so can be backfilled
+    free = [2]
+    planned = plan_jobs([big, short], free, running, now=0.)
+    assert [job.name for job, _ in planned] == ['short']
+    assert free == [0]
+
+    # long would delay the reservation
+    free = [2]
+    assert plan_jobs([big, long], free, running, now=0.) == []
+    assert free == [2]
+
+    # Without a blocked job, jobs start in order of priority
+    free = [8]
+    planned = plan_jobs([long, short], free, [], now=0.)
+    assert [job.name for job, _ in planned] == ['long', 'short']
+    assert free == [4]
+
+
+def fake_launcher(tmp_path) -> str:
+    """
+    Launcher that drops '-np N' and runs the command, in place of mpirun
+    """
+    launcher = tmp_path / 'fake_mpirun'
+    launcher.write_text('#!/bin/sh\nshift 2\nexec "$@"\n')
+    launcher.chmod(0o755)
+    return str(launcher)
+
+
+def test_run_jobs_with_duplicate_names(tmp_path):
+    executor = LocalExecutor(cores_per_node=1, mpi_launcher=fake_launcher(tmp_path), poll_interval=0.01)
+    jobs = []
+    for i, command in enumerate(['sh -c "echo job_0"', 'sh -c "echo job_1; exit 3"']):
+        directory = tmp_path / str(i)
+        directory.mkdir()
+        # Job names default to 'default_name' in the directive builders
+        job = LocalJob(str(directory), OrderedDict([('EXE', command), ('OUT', 'terminal.out')]),
+                       walltime=60., name='default_name')
+        executor.submit(job)
+        jobs.append(job)
+
+    return_codes = executor.run(verbose=False)
+
+    # One core, so jobs run one after the other, in order of submission
+    assert list(return_codes.keys()) == jobs
+    assert list(return_codes.values()) == [0, 3]
+    assert (tmp_path / '0' / 'terminal.out').read_text() == 'job_0\n'
+    assert (tmp_path / '1' / 'terminal.out').read_text() == 'job_1\n'
+
+
+def test_interrupted_run_kills_jobs(tmp_path, monkeypatch):
+    executor = LocalExecutor(cores_per_node=1, mpi_launcher=fake_launcher(tmp_path), poll_interval=0.01)
+    executor.submit(LocalJob(str(tmp_path), OrderedDict([('EXE', "sh -c 'echo $$ > pid; exec sleep 60'")]),
+                             walltime=120.))
+
+    # Interrupt the polling loop once the job has started
+    def interrupt(seconds):
+        while not (tmp_path / 'pid').is_file() or not (tmp_path / 'pid').read_text():
+            pass
+        raise KeyboardInterrupt
+    monkeypatch.setattr(local.time, 'sleep', interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        executor.run(verbose=False)
+
+    # The job has been killed and reaped
+    with pytest.raises(ProcessLookupError):
+        os.kill(int((tmp_path / 'pid').read_text()), 0)
+
+
+def test_job_from_sun():
+    class SunJob:
+        exe, input, output, ppn, job_name, walltime = 'tb.exe', 'input.fdf', 'terminal.out', 8, 'TBtest', [2, 30, 0]
+
+    job = job_from_sun('./', SunJob())
+    assert (job.nodes, job.mpi_per_node, job.omp_per_process) == (1, 8, 1)
+    assert job.walltime == 2.5 * 3600
+    assert job.command('mpirun') == ['mpirun', '-np', '8', 'tb.exe', 'input.fdf']
+    assert job.env_vars['OUT'] == 'terminal.out'
@@ -47,37 +47,37 @@ def parse_lorecommendations(file_name: str, species: list) -> dict:
     :return: basis_per_species dictionary
     """
 
-    fid = open(file=file_name, mode='r')
-    lines = fid.readlines()
-    fid.close()
+    lorecommendations = parse_lorecommendations_array(file_name)
+    assert len(species) <= lorecommendations.shape[0], "More species requested than in " + file_name
 
-    # Hard-coded in exciting
-    l_min = 0
-    l_max = 7
-    n_min = 0
-    n_max = 20
+    basis_per_species = {}
+    for i_atom, key in enumerate(species):
+        basis_per_species[key] = list(lorecommendations[i_atom])
 
-    lo_trial_energy = np.empty(shape=(n_max+1))
+    return basis_per_species
 
-    # Skip header and first species index
-    lines = lines[3:]
 
-    i = 0
-    basis_per_species = {}
-    for i_atom in range(0, len(species)):
-        lo_l = []
-        for i_l in range(l_min, l_max + 1):
-            # l_index line
-            i+=1
-            for i_n in range(n_min, n_max + 1):
-                lo_trial_energy[i_n] = float(lines[i].split()[2])
-                i+=1
-            # Single line break
-            lo_l.append(np.copy(lo_trial_energy))
-            i+=1
-        # skip species index line
-        i+=1
-        key = species[i_atom]
-        basis_per_species[key] = lo_l
+def parse_lorecommendations_array(file_name: str) -> np.ndarray:
+    """
+    Parse lorecommendations into a single array.
 
-    return basis_per_species
+    The file is split into tokens in one operation, and the energy parameter following
+    each 'n=' index is extracted with a mask, rather than walking lines with fixed offsets.
+    The number of l-channels and nodes are inferred from the file. exciting hard-codes
+    l_max = 7 and n_max = 20, giving shape (n_species, 8, 21).
+
+    :param file_name: file containing lorecommendations
+    :return: lorecommendations, of shape (n_species, n_l_channels, n_nodes)
+    """
+    with open(file=file_name, mode='r') as fid:
+        tokens = np.array(fid.read().split())
+
+    n_species = np.count_nonzero(tokens == 'species')
+    n_l_channels = np.count_nonzero(tokens == 'l=') // n_species
+
+    energy_indices = np.flatnonzero(tokens == 'n=') + 2
+    n_nodes = energy_indices.size // (n_species * n_l_channels)
+    assert energy_indices.size == n_species * n_l_channels * n_nodes, \
+        "Expect the same number of energy parameters per species and l-channel"
+
+    return tokens[energy_indices].astype(np.float64).reshape(n_species, n_l_channels, n_nodes)
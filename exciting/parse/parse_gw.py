@@ -1,13 +1,12 @@
 """
 Parse various GW output files
 """
-import subprocess
 import warnings
 import numpy as np
 from pathlib import Path
 import os
 
-from exciting_utils.py_grep import grep
+from exciting_utils.py_grep import scan, scan_lines
 
 
 def parse_kpoints(file_path:str, file_name='KPOINTS.OUT') -> dict:
@@ -35,8 +34,23 @@ def get_nempty_from_evalqp(file_path: str, file_name='EVALQP.DAT') -> int:
     :param file_name: file name to parse
     :return: nempty, number of empty states per k-point
     """
-    lines = grep('k-point', file_path + '/' + file_name, n_lines_before=2)
-    return int(lines.splitlines()[2].split()[0])
+    k_point_matches = scan(file_path + '/' + file_name, {'k-point': 'k-point'}, n_lines_before=2)['k-point']
+    return _nempty_from_k_point_matches(k_point_matches)
+
+
+def _nempty_from_k_point_matches(k_point_matches: list) -> int:
+    """
+    Last state index of the first k-point block, which is two lines
+    before the second k-point header.
+
+    :param k_point_matches: Matches to 'k-point' in EVALQP.DAT, with 2 lines of prior context
+    :return: nempty
+    """
+    return int(k_point_matches[1].before[0].split()[0])
+
+
+# Columns of EVALQP.DAT, following the state index
+evalqp_keys = ['E_KS', 'E_HF', 'E_GW', 'sigma_x', 'Re_sigma_c', 'Im_sigma_c', 'V_xc', 'delta_HF', 'delta_GW', 'Znk']
 
 
 def parse_gw_evalqp(file_path: str, file_name='EVALQP.DAT') -> dict:
@@ -53,12 +67,17 @@ def parse_gw_evalqp(file_path: str, file_name='EVALQP.DAT') -> dict:
 
     where Gamma always appears to be the first k-point in the file.
 
+    All state lines are read in bulk into a single array, rather than per state.
+
     file_path:
     file_name:
-    nkpts: Number of irreducible q-points, I assume
 
-    :return: dictionary of form {ik: k-point, results},
-    where results[istate].keys = ['E_KS', 'E_HF', 'E_GW', 'sigma_x',' Re_sigma_c', 'Im_sigma_c', 'V_xc', 'delta_HF', 'delta_GW', 'Znk']
+    :return: dictionary of the form
+        {'k_points': k-points, shape (n_k, 3),
+         'weights': k-point weights, shape (n_k),
+         'results': structured array with fields evalqp_keys, shape (n_k, n_states)}
+    such that results['E_GW'][ik, istate - 1] is the GW energy of state istate (1-indexed,
+    consistent with fortran) at k-point ik.
     """
 
     if not os.path.isfile(os.path.join(file_path, file_name)):
@@ -66,46 +85,34 @@ def parse_gw_evalqp(file_path: str, file_name='EVALQP.DAT') -> dict:
         print("Skipping file")
         return {}
 
-    # Value in input can exceed the total number of empty states.
-    # The value used by exciting in GW is the smallest 'n_empty' value in KPOINTS.OUT,
-    # as each k-point can differ due to the plane-wave cut-off
-    # TODO(Alex) This doesn't always. As in, it may not be the minimum work as in
-    # n_empty = parse_kpoints(file_path)['n_empty']
-    n_empty = get_nempty_from_evalqp(file_path)
-
-    # TODO Note, if n_empty in input is not max number, this will be used for number of entries
-    # in EVALQP.DAT, not the lowest value from KPOINTS file
-
-    #  Note, not kpoints in the KPOINTS file
-    #  I assume irreducuble number of k pr q? Not sure.
-    nkpts_details = grep("k-point", file_path + '/' + file_name).splitlines()
-    nkpts = int(nkpts_details[-1].split()[2].replace(':', ''))
-
     fid = open(file_path + "/" + file_name, "r")
     file_string = fid.readlines()
     fid.close()
 
-    keys = ['E_KS', 'E_HF', 'E_GW', 'sigma_x', 'Re_sigma_c', 'Im_sigma_c', 'V_xc', 'delta_HF', 'delta_GW', 'Znk']
+    # Note, not kpoints in the KPOINTS file
+    # I assume irreducuble number of k pr q? Not sure.
+    k_point_lines = []
+    state_lines = []
+    for line in file_string:
+        stripped = line.lstrip()
+        if stripped.startswith('k-point'):
+            k_point_lines.append(line)
+        elif stripped and not stripped.startswith('state'):
+            state_lines.append(line)
 
-    data = {}
-    i = 0
-    for ik in range(0, nkpts):
-        k_point = [float(k) for k in file_string[i].split()[3:6]]
+    # k-point #     1:    0.000000    0.000000    0.000000    0.125000
+    k_data = np.array([line.split()[3:7] for line in k_point_lines], dtype=float).reshape(-1, 4)
+    nkpts = k_data.shape[0]
 
-        # iterate past k-point and skip header
-        i += 2
-        results = {}
-        for istate in range(0, n_empty):
-            line = file_string[i].split()[1:]
-            # 1-Indexing consistent with fortran
-            results[istate + 1] = {keys[i]: float(line[i]) for i in range(0, len(keys))}
-            i += 1
+    # Same number of states per k-point, n_empty in the GW input
+    data = np.loadtxt(state_lines, ndmin=2)
+    assert data.shape[0] % nkpts == 0, "Expect the same number of states per k-point"
+    n_states = data.shape[0] // nkpts
 
-        # skips extra blank line per k-point block
-        i += 1
-        data[ik] = {'k_point': k_point, 'results': results.copy()}
+    dtype = np.dtype([(key, np.float64) for key in evalqp_keys])
+    results = np.ascontiguousarray(data[:, 1:]).view(dtype).reshape(nkpts, n_states)
 
-    return data
+    return {'k_points': k_data[:, 0:3], 'weights': k_data[:, 3], 'results': results}
 
 
 def parse_gw_timings(file_path: str, file_name='GW_INFO.OUT'):
@@ -118,13 +125,14 @@ def parse_gw_timings(file_path: str, file_name='GW_INFO.OUT'):
     """
     file_path += '/' + file_name
 
-    # Get line number GW timing info
-    start_line = int(grep("GW timing info", file_path, line_number='').split(':')[0])
-    #end_line = int(grep("Total", file_path, line_number='').splitlines()[-1].split(':')[0])
     fid = open(file_path, "r")
-    timing_lines = fid.readlines()[start_line+2:]
+    lines = fid.readlines()
     fid.close()
 
+    # Get line number GW timing info
+    start_line = scan_lines(lines, {'timing': "GW timing info"})['timing'][0].line_number
+    timing_lines = lines[start_line+2:]
+
     timings = {}
     for line in timing_lines:
         data = line.split()
@@ -169,15 +177,28 @@ def parse_gw_info(file_path: str, file_name='GW_INFO.OUT') -> dict:
         print('File not found:', file_path)
         return {}
 
-    data = {'max_n_lapw': int(grep("Maximum number of LAPW states", file_path).split()[-1]),
-            'min_n_lapw': int(grep("Minimal number of LAPW states", file_path).split()[-1]),
-            'n_KS': int(grep("total KS", file_path).split()[-1]),
-            'n_occupied': int(grep("occupied", file_path).split()[2]),
-            'n_unoccupied': int(grep("occupied", file_path).split()[5]),
-            'i_VBM': int(grep("Band index of VBM", file_path).split()[-1]),
-            'i_CBm': int(grep("Band index of CBm", file_path).split()[-1])}
+    matches = scan(file_path, {'max_n_lapw': "Maximum number of LAPW states",
+                               'min_n_lapw': "Minimal number of LAPW states",
+                               'n_KS': "total KS",
+                               'occupied': "occupied",
+                               'i_VBM': "Band index of VBM",
+                               'i_CBm': "Band index of CBm"})
+
+    # Last match in each case. For band indices, this corresponds to the GW band indices
+    def last_integer(key: str) -> int:
+        return int(matches[key][-1].line.split()[-1])
+
+    # Lines of the form '- occupied   12' and '- unoccupied   500'
+    occupied = [match.line.split() for match in matches['occupied']]
+
+    data = {'max_n_lapw': last_integer('max_n_lapw'),
+            'min_n_lapw': last_integer('min_n_lapw'),
+            'n_KS': last_integer('n_KS'),
+            'n_occupied': int(occupied[0][2]),
+            'n_unoccupied': int(occupied[1][2]),
+            'i_VBM': last_integer('i_VBM'),
+            'i_CBm': last_integer('i_CBm')}
 
-    # Save the second line in each case, which corresponds to the GW band indices
     assert data['i_CBm'] == data['i_VBM'] + 1
 
     return data
@@ -1,7 +1,13 @@
 """
 Basis operations
 """
-from exciting_utils.py_grep import grep
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+
+from exciting_utils.py_grep import scan
 
 def get_default_basis():
     """
@@ -21,13 +27,20 @@ def get_atom_labels(file_name:str) -> list:
 
     :return: list of atom labels
     """
-    atom_labels = []
-    species_lines = grep("Species", file_name).splitlines()
-    for line in species_lines:
-        symbol = line.split(',')[0][-4:].replace("(", "").replace(")", "")
-        atom_labels.append(symbol.strip().lower())
+    species_matches = scan(file_name, {'species': "Species"})['species']
+    return _atom_labels_from_species_matches(species_matches)
+
 
-    return atom_labels
+def _atom_labels_from_species_matches(species_matches: list) -> list:
+    """
+    Atom labels from lines of the form 'Species :    1 (Zr), atom :    1'
+    """
+    return [_atom_label_from_species_line(match.line) for match in species_matches]
+
+
+def _atom_label_from_species_line(line: str) -> str:
+    symbol = line.split(',')[0][-4:].replace("(", "").replace(")", "")
+    return symbol.strip().lower()
 
 
 def get_unique_atom_labels(atom_labels:list) -> list:
@@ -63,65 +76,72 @@ def parse_lo_linear_energies(file_path:str, file_name='LINENGY.OUT') -> dict:
                        }
     where linear_energies_i is also a dictionary of the form
 
-    linear_energies_i = {0: [-5.12000000, -1.390000000],
-                         1: [-0.51000000, -0.510000000],
-                         2: [0.330000000,  0.330000000],
-                         3: [1.000000000,  1.000000000],
-                         4: [1.000000000,  1.000000000]}
+    linear_energies_i = {0: np.array([-5.12000000, -1.390000000]),
+                         1: np.array([-0.51000000, -0.510000000]),
+                         2: np.array([0.330000000,  0.330000000]),
+                         3: np.array([1.000000000,  1.000000000]),
+                         4: np.array([1.000000000,  1.000000000])}
 
     Only one of each species is included in linear_energies.
     Valid for default and optimised basis sets
 
+    The file is parsed in a single pass, with a state machine that switches on
+    species headers and on the start of APW and local-orbital blocks.
+
     :return: linear_energies
     """
+    file_name = os.path.join(file_path, file_name)
 
-    file_name = file_path + '/' + file_name
-    fid = open(file_name, "r")
-    file = fid.readlines()
-    fid.close()
-
-    atom_labels = get_atom_labels(file_name)
-    n_atoms = len(atom_labels)
-
-    # Get species and local-orbital line numbers
-    output = grep("local-orbital functions", file_name, line_number='').splitlines()
-    start_indices = [int(line.split(':')[0]) for line in output]
-
-    # First species index not required
-    output = grep("Species", file_name, line_number='').splitlines()
-    # -2 moves the end index to the last lo of the prior species
-    end_indices = [int(line.split(':')[0]) - 2 for line in output[1:]]
-    # Add up to end of file
-    end_indices.append(len(file))
-
-    # Parse file
     linear_energies_atoms = {}
+    energy_parameters = None
+    in_lo_block = False
+
+    with open(file_name, "r") as fid:
+        for line in fid:
+            if line.startswith('Species'):
+                # Entries are ordered by l-channel within an atomic block
+                energy_parameters = {}
+                linear_energies_atoms[_atom_label_from_species_line(line)] = energy_parameters
+                in_lo_block = False
+
+            elif 'local-orbital functions' in line:
+                in_lo_block = True
+
+            elif 'APW functions' in line:
+                in_lo_block = False
+
+            elif in_lo_block:
+                # Lines of the form 'l.o. =  1, l =  0, order =  1 :   -1.390000000'
+                data = line.split()
+                if not data:
+                    continue
+                l_value = int(data[5].replace(",", ""))
+                energy_parameters.setdefault(l_value, []).append(float(data[-1]))
+
+    for atom_label, energy_parameters in linear_energies_atoms.items():
+        linear_energies_atoms[atom_label] = {l_value: np.array(energies)
+                                             for l_value, energies in energy_parameters.items()}
 
-    for iatom in range(0, n_atoms):
-        atom_label = atom_labels[iatom]
-        start = start_indices[iatom]
-        stop = end_indices[iatom]
-
-        linear_energies = {}
-        energy_parameter = []
-        prior_l_value = 0
+    return linear_energies_atoms
 
-        for ilo in range(start, stop):
-            line = file[ilo].split()
-            l_value = int(line[5].replace(",", ""))
 
-            if l_value != prior_l_value:
-                linear_energies[prior_l_value] = energy_parameter
-                prior_l_value = l_value
-                energy_parameter = []
+def parse_lo_linear_energies_directories(directories: List[str], file_name='LINENGY.OUT',
+                                         n_processes=1) -> List[dict]:
+    """
+    Parse LINENGY.OUT in many run directories
 
-            energy_parameter.append(float(line[-1]))
+    :param List[str] directories: Run directories
+    :param str file_name: file name
+    :param n_processes: Number of processes. None uses all available cores, 1 runs serially
+    :return: List of linear energies, as returned by parse_lo_linear_energies, ordered as directories
+    """
+    file_names = [file_name] * len(directories)
 
-        # Add last l-channel of the atomic block
-        linear_energies[prior_l_value] = energy_parameter
-        linear_energies_atoms[atom_label] = linear_energies
+    if n_processes == 1 or len(directories) <= 1:
+        return [parse_lo_linear_energies(directory, file_name) for directory in directories]
 
-    return linear_energies_atoms
+    with ProcessPoolExecutor(max_workers=n_processes) as executor:
+        return list(executor.map(parse_lo_linear_energies, directories, file_names))
 
     # NOTE. This is not required as dictionary will overwrite elements with the same key
     # if filter_duplicate_species:
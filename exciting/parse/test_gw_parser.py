@@ -0,0 +1,27 @@
+import numpy as np
+
+from parse_gw import parse_gw_evalqp, evalqp_keys
+
+
+def test_parse_gw_evalqp():
+    """
+    Test parsing EVALQP.DAT into arrays.
+
+    RTF means if its structure changes, this will break.
+    """
+    # Path assumes run from project root
+    qp_data = parse_gw_evalqp('parse/example_data')
+
+    n_k_points = 3
+    n_states = 600
+    assert qp_data['k_points'].shape == (n_k_points, 3), "k-points stored row-wise"
+    assert np.allclose(qp_data['k_points'][0], 0.), "Gamma is the first k-point"
+    assert np.isclose(np.sum(qp_data['weights']), 1.), "k-point weights sum to 1"
+
+    results = qp_data['results']
+    assert results.shape == (n_k_points, n_states), "One entry per k-point and state"
+    assert list(results.dtype.names) == evalqp_keys, "One field per EVALQP.DAT column"
+
+    # Final state of the last k-point
+    assert np.isclose(results['E_KS'][-1, -1], 43.53307)
+    assert np.isclose(results['Znk'][-1, -1], 0.99947)
@@ -0,0 +1,37 @@
+import os
+
+from exciting_utils.lazy_import import cold_import_times
+
+# Root of the exciting scripts, such that parse, process, etc are importable
+exciting_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported by short parse tasks
+core_parsers = ['parse.parse_gw',
+                'parse.parse_linengy',
+                'parse.lorecommendations_parser',
+                'parse.parse_basis_xml',
+                'parse.set_gw_input',
+                'process.process_gw',
+                'process.optimised_basis',
+                'gw_benchmark_outputs.harvest']
+
+# Dependencies that should only be imported on first use
+heavy_modules = ['matplotlib', 'h5py', 'excitingtools', 'ase', 'pymatgen', 'spglib', 'scipy']
+
+# Cold-start budget for importing all core parsers, including numpy, in ms.
+# Importing numpy alone takes ~0.1 s, and matplotlib alone takes several times the remainder
+import_budget = 500.
+
+
+def test_core_parsers_import_time():
+    """
+    Cold-start import of the core parsers, measured with python -X importtime.
+    """
+    times = cold_import_times(core_parsers, python_path=[exciting_root, os.path.join(exciting_root, 'parse')])
+
+    loaded = [name for name in heavy_modules if name in times]
+    assert not loaded, "Heavy modules should be imported on first use, not by the parsers: " + ', '.join(loaded)
+
+    total = 1.e-3 * sum(self_time for self_time, _ in times.values())
+    assert total < import_budget, \
+        "Cold-start import of the core parsers, " + str(round(total)) + " ms, exceeds the budget"
@@ -1,7 +1,11 @@
+import pathlib
+import shutil
+
+import numpy as np
 import pytest
 
 from lorecommendations_parser import parse_lorecommendations
-from parse_linengy import parse_lo_linear_energies
+from parse_linengy import parse_lo_linear_energies, parse_lo_linear_energies_directories
 
 def test_parse_lorecommendations():
     """
@@ -35,32 +39,99 @@ def test_parse_lo_linear_energies():
 
     assert len(linear_energies_species) == 2, "Two species in LINENGY.OUT"
     species = [key for key in linear_energies_species.keys()]
-    assert 'Zr' in species, "Expect Zr in species list"
-    assert 'O' in species, "Expect Zr O species list"
+    assert species == ['zr', 'o'], "Expect lowercase zr and o, in file order"
 
-    linear_energies_Zr = linear_energies_species['Zr']
-    linear_energies_O = linear_energies_species['O']
+    linear_energies_Zr = linear_energies_species['zr']
+    linear_energies_O = linear_energies_species['o']
 
     # Reference values found by inspecting the parse/example_data/LINENGY.OUT
     l_channels = [l_channel for l_channel in linear_energies_Zr.keys()]
     assert len(linear_energies_Zr) == 5, "5 l-channels for Zr"
     assert max(l_channels) == 4, "l_max = 4 for Zr"
 
-    assert linear_energies_Zr == {0: [-1.39, -1.39, -1.39, -1.39],
-                                  1: [-0.51, -0.51, -0.51, -0.51],
-                                  2: [0.33, 0.33, 0.33, 0.33],
-                                  3: [1.0, 1.0, 1.0, 1.0],
-                                  4: [1.0, 1.0, 1.0, 1.0]
-                                  }
+    ref_Zr = {0: [-1.39, -1.39, -1.39, -1.39],
+              1: [-0.51, -0.51, -0.51, -0.51],
+              2: [0.33, 0.33, 0.33, 0.33],
+              3: [1.0, 1.0, 1.0, 1.0],
+              4: [1.0, 1.0, 1.0, 1.0]
+              }
+    for l_value, energies in ref_Zr.items():
+        assert isinstance(linear_energies_Zr[l_value], np.ndarray)
+        assert np.allclose(linear_energies_Zr[l_value], energies), "Zr: LO energies of l = " + str(l_value)
 
     l_channels = [l_channel for l_channel in linear_energies_O.keys()]
     assert len(linear_energies_O) == 4, "4 l-channels for O"
     assert max(l_channels) == 3, "l_max = 3 for O"
 
-    assert linear_energies_O == {0: [-0.04125, -0.04125, -0.04125, -0.04125],
-                                 1: [0.1, 0.1, 0.1, 0.1],
-                                 2: [1.0, 1.0, 1.0, 1.0],
-                                 3: [1.0, 1.0, 1.0, 1.0]
-                                 }
+    ref_O = {0: [-0.04125, -0.04125, -0.04125, -0.04125],
+             1: [0.1, 0.1, 0.1, 0.1],
+             2: [1.0, 1.0, 1.0, 1.0],
+             3: [1.0, 1.0, 1.0, 1.0]
+             }
+    for l_value, energies in ref_O.items():
+        assert np.allclose(linear_energies_O[l_value], energies), "O: LO energies of l = " + str(l_value)
 
     return
+
+
+def test_parse_lo_linear_energies_blocks(tmp_path):
+    """
+    Only local-orbital blocks are parsed, whatever the order of blocks within a species
+    """
+    (tmp_path / 'LINENGY.OUT').write_text(
+        "Species :    1 (Ti), atom :    1\n"
+        " local-orbital functions :\n"
+        "  l.o. =  1, l =  0, order =  1 :   -2.000000000\n"
+        "  l.o. =  2, l =  1, order =  1 :   -1.000000000\n"
+        "\n"
+        " APW functions :\n"
+        "  l =  0, order =  1 :   0.1500000000\n"
+        "  l =  5, order =  1 :   0.1500000000\n"
+        "Species :    2 (Se), atom :    1\n"
+        " APW functions :\n"
+        "  l =  0, order =  1 :   0.1500000000\n"
+        " local-orbital functions :\n"
+        "  l.o. =  1, l =  2, order =  1 :   0.5000000000E-01\n"
+        "  l.o. =  1, l =  2, order =  2 :   0.5000000000E-01\n"
+        "\n"
+        "Species :    2 (Se), atom :    2\n"
+        " APW functions :\n"
+        "  l =  0, order =  1 :   0.1500000000\n"
+        " local-orbital functions :\n"
+        "  l.o. =  1, l =  2, order =  1 :   0.5000000000E-01\n"
+        "  l.o. =  1, l =  2, order =  2 :   0.5000000000E-01\n"
+    )
+    linear_energies = parse_lo_linear_energies(str(tmp_path))
+
+    assert list(linear_energies.keys()) == ['ti', 'se'], "One entry per species"
+    assert list(linear_energies['ti'].keys()) == [0, 1], "APW functions are not included"
+    assert np.allclose(linear_energies['ti'][0], [-2.0])
+    assert np.allclose(linear_energies['ti'][1], [-1.0])
+    assert list(linear_energies['se'].keys()) == [2], "Repeated atoms of a species do not accumulate"
+    assert np.allclose(linear_energies['se'][2], [0.05, 0.05])
+
+
+@pytest.mark.parametrize('n_processes', [1, 2])
+def test_parse_lo_linear_energies_directories(tmp_path, n_processes):
+    directories = []
+    for i in range(0, 3):
+        directory = tmp_path / ('run_' + str(i))
+        shutil.copytree('parse/example_data', directory)
+        directories.append(str(directory))
+    # Distinguish the last directory
+    linengy = pathlib.Path(directories[-1], 'LINENGY.OUT')
+    linengy.write_text(linengy.read_text().replace('-1.390000000', '-2.500000000'))
+
+    results = parse_lo_linear_energies_directories(directories, n_processes=n_processes)
+    serial_results = [parse_lo_linear_energies(directory) for directory in directories]
+
+    assert len(results) == len(directories), "One result per directory"
+    for result, serial_result in zip(results, serial_results):
+        assert list(result.keys()) == list(serial_result.keys())
+        for species in result:
+            assert list(result[species].keys()) == list(serial_result[species].keys())
+            for l_value in result[species]:
+                assert np.array_equal(result[species][l_value], serial_result[species][l_value])
+
+    assert np.allclose(results[0]['zr'][0], -1.39)
+    assert np.allclose(results[-1]['zr'][0], -2.5), "Results are ordered as directories"
@@ -5,7 +5,6 @@ See create_basis.py in zr_lmax6_lmax5 for more functions to adapt
 """
 import numpy as np
 from typing import List, Dict, Optional
-from copy import deepcopy
 import re
 
 
@@ -68,7 +67,7 @@ class DefaultLOs():
         """
         self.nodes = {}
         for l_value, energies in self.linear_energies.items():
-            assert type(energies) == list
+            assert isinstance(energies, (list, np.ndarray))
             self.nodes[l_value] = len(set(energies)) - 1
         return self.nodes
 
@@ -101,6 +100,8 @@ def filter_lo_functions(lo_recommendations: List[np.ndarray],
     already in the default (ground state) basis and/or exceed the energy cutoff
     for the optimised lo basis.
 
+    Node indices for all l-channels are found in one call to lo_node_ranges.
+
     :param: lo_recommendations lorecommendations for all l-channels of a given species.
                                Elements indexed by l-value: 0 to 6.
                                (l_max = 6 is hard-coded in exciting's lorecommendations).
@@ -126,28 +127,139 @@ def filter_lo_functions(lo_recommendations: List[np.ndarray],
     assert len(lo_recommendations[0]) == 21, "Expect 21 entries per l-channel lorecommendations, " \
                                              "as it is hard-coded in exciting"
 
+    lo_recommendations = np.asarray(lo_recommendations, dtype=np.float64)
+
     # Don't evaluate lo recommendations for l-channels that are not in the default basis
-    n_default_l_channels = len(default_los.linear_energies)
+    n_l_channels = len(default_los.linear_energies) if default_los is not None else len(lo_recommendations)
+    lo_recommendations = lo_recommendations[:n_l_channels]
 
-    optimised_los = []
-    for l_value, lo_energies in enumerate(lo_recommendations[:n_default_l_channels]):
+    if default_los is not None:
+        max_energies, max_nodes = default_lo_arrays(default_los, n_l_channels)
+        first_nodes = default_first_nodes(lo_recommendations, max_energies, max_nodes, default_los.energy_tol)
+    else:
+        first_nodes = np.zeros(shape=n_l_channels, dtype=int)
 
-        optimised_los_lchannel = LOEnergies(l_value, lo_energies)
+    if optimised_lo_cutoff is not None:
+        energy_cutoffs = np.array([optimised_lo_cutoff[l_value] for l_value in range(0, n_l_channels)])
+        last_nodes = high_energy_last_nodes(lo_recommendations, energy_cutoffs)
+    else:
+        last_nodes = np.full(shape=n_l_channels, fill_value=lo_recommendations.shape[-1] - 1)
 
-        if default_los is not None:
-            optimised_los_lchannel = filter_default_functions(optimised_los_lchannel,
-                                                             max(default_los.linear_energies[l_value]),
-                                                             default_los.nodes[l_value],
-                                                             default_los.energy_tol
-                                                              )
-        if optimised_lo_cutoff is not None:
-            optimised_los_lchannel = filter_high_energy_optimised_functions(optimised_los_lchannel,
-                                                                           optimised_lo_cutoff[l_value])
+    return [LOEnergies(l_value, lo_recommendations[l_value], int(first_nodes[l_value]), int(last_nodes[l_value]))
+            for l_value in range(0, n_l_channels)]
 
-        optimised_los.append(deepcopy(optimised_los_lchannel))
-        del optimised_los_lchannel
 
-    return optimised_los
+def default_lo_arrays(default_los: DefaultLOs, n_l_channels: int) -> tuple:
+    """
+    Highest linear energy and max node of each l-channel of the default basis, as arrays.
+
+    :param default_los: Default LO basis of a species
+    :param n_l_channels: Size of the returned arrays
+    :return: max_energies, max_nodes, each of shape (n_l_channels).
+    l-channels absent from the default basis have max_energy = NaN and max_node = -1,
+    such that no lo recommendations are excluded from them.
+    """
+    max_energies = np.full(shape=n_l_channels, fill_value=np.nan)
+    max_nodes = np.full(shape=n_l_channels, fill_value=-1, dtype=int)
+    for l_value, energies in default_los.linear_energies.items():
+        if l_value < n_l_channels:
+            max_energies[l_value] = np.max(energies)
+            max_nodes[l_value] = default_los.nodes[l_value]
+    return max_energies, max_nodes
+
+
+def default_first_nodes(lo_recommendations: np.ndarray,
+                        default_max_energies: np.ndarray,
+                        default_max_nodes: np.ndarray,
+                        energy_tolerance) -> np.ndarray:
+    """
+    Vectorised equivalent of filter_default_functions, for any number of species and l-channels.
+    See filter_default_functions for a description of the criteria.
+
+    :param lo_recommendations: Energy parameters, shape (..., n_l_channels, n_nodes)
+    :param default_max_energies: Highest linear energy per l-channel in the default basis, shape (..., n_l_channels)
+    :param default_max_nodes: Max node per l-channel in the default basis, shape (..., n_l_channels)
+    :param energy_tolerance: Scalar, or per species, broadcastable against (..., n_l_channels)
+    :return: first_nodes, shape (..., n_l_channels)
+    """
+    energy_tolerance = np.asarray(energy_tolerance, dtype=np.float64)
+    assert np.all(energy_tolerance >= 0.), "energy tolerance must >= 0 Ha"
+
+    # First criterion: Match the highest default energy, and exclude it and all lower functions
+    difference = np.abs(lo_recommendations - default_max_energies[..., np.newaxis])
+    matches = np.min(difference, axis=-1) <= energy_tolerance
+    i_match = np.argmin(np.nan_to_num(difference, nan=np.inf), axis=-1)
+
+    # Second criterion: Exclude functions with nodes <= max_node of the default basis
+    first_nodes = np.where(matches, i_match + 1, default_max_nodes + 1)
+
+    n_nodes = lo_recommendations.shape[-1]
+    first_energies = np.take_along_axis(lo_recommendations,
+                                        np.minimum(first_nodes, n_nodes - 1)[..., np.newaxis], axis=-1)[..., 0]
+    invalid = ~matches & (first_energies <= default_max_energies + energy_tolerance)
+    if np.any(invalid):
+        print("First recommended energy parameter should exceed the energies of all default los")
+        print("First optimised lo energies:", first_energies[invalid])
+        print("Highest default lo energies (Ha):", default_max_energies[invalid])
+        quit()
+
+    return first_nodes
+
+
+def high_energy_last_nodes(lo_recommendations: np.ndarray, energy_cutoffs: np.ndarray) -> np.ndarray:
+    """
+    Vectorised equivalent of filter_high_energy_optimised_functions, for any number of
+    cut-offs, species and l-channels.
+
+    :param lo_recommendations: Energy parameters, shape (..., n_l_channels, n_nodes)
+    :param energy_cutoffs: Cut-offs, broadcastable against (..., n_l_channels).
+    For example, shape (n_cutoffs, n_species, n_l_channels) for a grid of cut-offs
+    :return: last_nodes, with the broadcast shape of energy_cutoffs and lo_recommendations[..., 0]
+    """
+    energy_cutoffs = np.asarray(energy_cutoffs, dtype=np.float64)
+    return np.count_nonzero(lo_recommendations < energy_cutoffs[..., np.newaxis], axis=-1) - 1
+
+
+def lo_node_ranges(lo_recommendations: np.ndarray,
+                   default_max_energies: np.ndarray,
+                   default_max_nodes: np.ndarray,
+                   energy_tolerance,
+                   energy_cutoffs: np.ndarray) -> tuple:
+    """
+    First and last node indices of the optimised LOs, for all species, l-channels and energy cut-offs
+    in one call.
+
+    :param lo_recommendations: shape (n_species, n_l_channels, n_nodes), as returned by parse_lorecommendations_array
+    :param default_max_energies: shape (n_species, n_l_channels)
+    :param default_max_nodes: shape (n_species, n_l_channels)
+    :param energy_tolerance: Scalar, or shape (n_species, 1)
+    :param energy_cutoffs: shape (n_cutoffs, n_species, n_l_channels), as returned by energy_cutoffs_array
+    :return: first_nodes of shape (n_species, n_l_channels) and last_nodes of shape (n_cutoffs, n_species, n_l_channels)
+    """
+    first_nodes = default_first_nodes(lo_recommendations, default_max_energies, default_max_nodes, energy_tolerance)
+    last_nodes = high_energy_last_nodes(lo_recommendations, energy_cutoffs)
+    return first_nodes, last_nodes
+
+
+def energy_cutoffs_array(energy_cutoffs: dict, species: list, n_l_channels: int) -> np.ndarray:
+    """
+    Array equivalent of restructure_energy_cutoffs
+
+    :param energy_cutoffs: For a given [species][l-value], a list of LO energy cut-offs.
+    Each l-channel must have the same number of cut-offs
+    :param species: Species, defining the order of the second axis
+    :param n_l_channels: Size of the last axis
+    :return: cut-offs of shape (n_cutoffs, n_species, n_l_channels). l-channels without cut-offs
+    are set to infinity, such that no recommendations are excluded
+    """
+    n_cutoffs = {len(energies) for l_channels in energy_cutoffs.values() for energies in l_channels.values()}
+    assert len(n_cutoffs) == 1, "Number of energy cutoffs not the same for all (species, l-channels)"
+
+    cutoffs = np.full(shape=(n_cutoffs.pop(), len(species), n_l_channels), fill_value=np.inf)
+    for i_species, x in enumerate(species):
+        for l_value, energies in energy_cutoffs[x].items():
+            cutoffs[:, i_species, l_value] = energies
+    return cutoffs
 
 
 def filter_default_functions(optimised_los:LOEnergies,
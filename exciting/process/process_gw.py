@@ -4,6 +4,7 @@
 """
 from typing import List
 import sys
+import numpy as np
 
 
 # For a given basis i.e. (l-max, l-max) energy cutoff == basis functions
@@ -19,18 +20,19 @@ def process_gw_gamma_point(gw_data: dict, qp_data: dict) -> dict:
     if (not gw_data) or (not qp_data):
         return {}
 
-    i_VBM = gw_data['i_VBM']
-    i_CBm = gw_data['i_CBm']
+    # Convert fortran state indices to array indices
+    i_VBM = gw_data['i_VBM'] - 1
+    i_CBm = gw_data['i_CBm'] - 1
 
-    assert qp_data[0]['k_point'] == [0.0, 0.0, 0.0], "Gamma_point always first index in EVALQP.DAT"
-    qp_gamma = qp_data[0]['results']
+    assert np.allclose(qp_data['k_points'][0], 0.), "Gamma_point always first index in EVALQP.DAT"
+    qp_gamma = qp_data['results'][0]
 
     result = {}
-    result['E_ks'] = qp_gamma[i_CBm]['E_KS'] - qp_gamma[i_VBM]['E_KS']
-    result['E_qp'] = qp_gamma[i_CBm]['E_GW'] - qp_gamma[i_VBM]['E_GW']
+    result['E_ks'] = qp_gamma['E_KS'][i_CBm] - qp_gamma['E_KS'][i_VBM]
+    result['E_qp'] = qp_gamma['E_GW'][i_CBm] - qp_gamma['E_GW'][i_VBM]
 
-    result['re_sigma_VBM'] = qp_gamma[i_VBM]['Re_sigma_c']
-    result['re_sigma_CBm'] = qp_gamma[i_CBm]['Re_sigma_c']
+    result['re_sigma_VBM'] = qp_gamma['Re_sigma_c'][i_VBM]
+    result['re_sigma_CBm'] = qp_gamma['Re_sigma_c'][i_CBm]
 
     return result
 
@@ -43,8 +45,7 @@ def process_gw_gap(gw_data: dict, qp_data: dict, kpoint_v: List[float], kpoint_c
     conduction band at kpoint_c.
 
     :param dict gw_data:
-    :param dict qp_data: Quasi-particle data of the form
-                    qp_data[ik] ={'k_point': k_point, 'results': results}
+    :param dict qp_data: Quasi-particle data, as returned by parse_gw_evalqp
     :param List[float] kpoint_v: User-defined valence band k-point
     :param List[float] kpoint_c: User-defined conduction band k-point
     :return:
@@ -56,16 +57,16 @@ def process_gw_gap(gw_data: dict, qp_data: dict, kpoint_v: List[float], kpoint_c
         return {}
 
     # Index of highest valence band
-    i_VBM = gw_data['i_VBM']
+    i_VBM = gw_data['i_VBM'] - 1
 
     # Index of lowest conduction band
-    i_CBm = gw_data['i_CBm']
+    i_CBm = gw_data['i_CBm'] - 1
 
     # Get energy at specific k-point
     def extract_specific_kpoint(qp_data: dict, kpoint: List[float]):
-        for k in qp_data.values():
-            if k['k_point'] == kpoint:
-                return k['results']
+        ik = np.where(np.all(np.isclose(qp_data['k_points'], kpoint), axis=1))[0]
+        if ik.size > 0:
+            return qp_data['results'][ik[0]]
         msg = 'User-specified k-point, ' + ",".join(str(k) for k in kpoint) + \
               'was not found in qp_data parsed from EVALQP.DAT'
         sys.exit(msg)
@@ -73,9 +74,9 @@ def process_gw_gap(gw_data: dict, qp_data: dict, kpoint_v: List[float], kpoint_c
     data_valance = extract_specific_kpoint(qp_data, kpoint_v)
     data_conduction = extract_specific_kpoint(qp_data, kpoint_c)
 
-    result = {'E_ks': data_conduction[i_CBm]['E_KS'] - data_valance[i_VBM]['E_KS'],
-              'E_qp': data_conduction[i_CBm]['E_GW'] - data_valance[i_VBM]['E_GW'],
-              're_sigma_VBM': data_valance[i_VBM]['Re_sigma_c'],
-              're_sigma_CBm': data_conduction[i_CBm]['Re_sigma_c']}
+    result = {'E_ks': data_conduction['E_KS'][i_CBm] - data_valance['E_KS'][i_VBM],
+              'E_qp': data_conduction['E_GW'][i_CBm] - data_valance['E_GW'][i_VBM],
+              're_sigma_VBM': data_valance['Re_sigma_c'][i_VBM],
+              're_sigma_CBm': data_conduction['Re_sigma_c'][i_CBm]}
 
     return result
@@ -2,7 +2,8 @@ import numpy as np
 from typing import Optional
 
 from optimised_basis import LOEnergies, filter_default_functions, filter_high_energy_optimised_functions, \
-    DefaultLOs, filter_lo_functions
+    DefaultLOs, filter_lo_functions, default_lo_arrays, energy_cutoffs_array, lo_node_ranges
+from lorecommendations_parser import parse_lorecommendations_array
 
 
 def test_filter_low_node_function_l0():
@@ -234,6 +235,46 @@ def test_filter_low_node_function_l4():
 
     return
 
+def test_lo_node_ranges():
+    """
+    Node indices for all species, l-channels and cut-offs, in one call, should agree
+    with those of filter_default_functions and filter_high_energy_optimised_functions
+    per l-channel.
+    Path assumes run from project root
+    """
+    lorecommendations = parse_lorecommendations_array('parse/example_data/lorecommendations.dat')
+    n_species, n_l_channels, n_nodes = lorecommendations.shape
+    assert (n_species, n_l_channels, n_nodes) == (2, 7, 21)
+
+    linear_energies = {'zr': {0: [-1.39], 1: [-0.51], 2: [0.33], 3: [1.0], 4: [1.0]},
+                       'o': {0: [-0.04125], 1: [0.1], 2: [1.0], 3: [1.0]}}
+    energy_cutoffs = {'zr': {l: [60., 120.] for l in range(0, 5)},
+                      'o': {l: [60., 120.] for l in range(0, 4)}}
+    species = ['zr', 'o']
+
+    default_los = {x: DefaultLOs(linear_energies[x], energy_tol=0.1) for x in species}
+    max_energies, max_nodes = zip(*[default_lo_arrays(default_los[x], n_l_channels) for x in species])
+    cutoffs = energy_cutoffs_array(energy_cutoffs, species, n_l_channels)
+    first_nodes, last_nodes = lo_node_ranges(lorecommendations, np.array(max_energies), np.array(max_nodes),
+                                             0.1, cutoffs)
+    assert first_nodes.shape == (n_species, n_l_channels)
+    assert last_nodes.shape == (2, n_species, n_l_channels)
+
+    for i, x in enumerate(species):
+        for l_value, energies in linear_energies[x].items():
+            optimised_basis = filter_default_functions(LOEnergies(l_value, lorecommendations[i, l_value]),
+                                                       max(energies), default_los[x].nodes[l_value], 0.1)
+            assert first_nodes[i, l_value] == optimised_basis.first_node
+            for ic in range(0, 2):
+                optimised_basis = filter_high_energy_optimised_functions(
+                    LOEnergies(l_value, lorecommendations[i, l_value]), energy_cutoffs[x][l_value][ic])
+                assert last_nodes[ic, i, l_value] == optimised_basis.last_node
+
+    # l-channels absent from the default basis, or without a cut-off, are unfiltered
+    assert first_nodes[1, 4] == 0
+    assert last_nodes[0, 1, 4] == n_nodes - 1
+
+
 # Need some way to progagate errors
 # def test_filter_low_node_functions_l5():
 #     """
@@ -7,9 +7,10 @@ import spglib
 from modules.ase.spglib import ase_to_spglib
 from modules.spglib.io import show_cell as spg_show_cell, write as spg_write
 
-from modules.parameters.elements import an_to_symbol
+from modules.parameters.elements import atomic_numbers_to_symbols
 from modules.electronic_structure.structure import atoms
 from modules.electronic_structure.structure import supercell
+from modules.electronic_structure.structure import neighbours
 from modules.fileio.write import xyz
 
 
@@ -63,7 +64,7 @@ def get_primitive_unit_cell(directories: Directories, visualise=False):
         positions_ang.append(np.matmul(lattice, position))
 
     # Need unit cell in my molecule format
-    species = [an_to_symbol[an] for an in numbers]
+    species = atomic_numbers_to_symbols(numbers).tolist()
     unit_cell = atoms.Atoms(species=species, positions=positions_ang)
 
     return unit_cell, lattice_vectors
@@ -120,26 +121,15 @@ def find_atoms_neighbouring_central_cell(unit_cell: atoms.Atoms, translations: l
     assert len(super_cell) == len(translations) * n_atoms_prim
 
     positions = [atom.position for atom in super_cell]
-    d_supercell = spatial.distance_matrix(positions, positions)
-    assert d_supercell.shape[0] == len(super_cell), "d_supercell.shape[0] != len(super_cell)"
-    assert d_supercell.shape[1] == d_supercell.shape[0], "distance matrix is not square"
 
     # For atoms (indexed by ia) in central cell,
     # list neighbours inside and outside of central cell
-    coordinating_atom_indices = []
-    for ia in range(0, n_atoms_prim):
-        # This should only check for neighbours outside of the central cell
-        # but doesn't give the correct answer and I can't see why
-        # indices = np.where((d_supercell[ia, n_atoms_prim:] > 0.) &
-        #                    (d_supercell[ia, n_atoms_prim:] <= upper_bound_length))[0]
-        indices = np.where((d_supercell[ia, :] > 0.) &
-                           (d_supercell[ia, :] <= upper_bound_length))[0]
-        coordinating_atom_indices.extend(indices)
+    neighbour_list = neighbours.neighbour_list(positions, upper_bound_length,
+                                               centres=np.arange(0, n_atoms_prim))
 
     # Remove dups
-    coordinating_atom_indices = list(set(coordinating_atom_indices))
+    coordinating_atom_indices = np.unique(neighbour_list.indices)
     # Remove indices associated with atoms in central cell
-    coordinating_atom_indices = np.asarray(coordinating_atom_indices)
     coordinating_atom_indices = coordinating_atom_indices[coordinating_atom_indices >= n_atoms_prim]
 
     # Store coordinating atoms
@@ -197,11 +187,7 @@ def find_neighbour_cell_oxygens(unit_cell: atoms.Atoms, translations: list, dist
     assert len(super_cell) == len(translations) * n_atoms
     cells_are_the_same(unit_cell, super_cell[0:n_atoms])
 
-    # Distance matrix for supercell
     positions = [atom.position for atom in super_cell]
-    d_supercell = spatial.distance_matrix(positions, positions)
-    assert d_supercell.shape[0] == len(super_cell), "d_supercell.shape[0] != len(super_cell)"
-    assert d_supercell.shape[1] == d_supercell.shape[0], "distance matrix is not square"
 
     # Find silicon indices in central cell
     silicon_indices = []
@@ -209,6 +195,9 @@ def find_neighbour_cell_oxygens(unit_cell: atoms.Atoms, translations: list, dist
         if super_cell[ia].species.lower() == 'si':
             silicon_indices.append(ia)
 
+    # Neighbours of central cell silicons only
+    neighbour_list = neighbours.neighbour_list(positions, distance_cutoff, centres=silicon_indices)
+
     def all_species_equal_to(iSi, species, label: str):
         species_lowercase = [i.lower() for i in species]
         if species_lowercase.count(label.lower()) != len(species):
@@ -220,9 +209,8 @@ def find_neighbour_cell_oxygens(unit_cell: atoms.Atoms, translations: list, dist
     # Find all within a distance_cutoff oxygen
     indices = []
     coordinating_atom_indices = []
-    for iSi in silicon_indices:
-        indices = np.where((d_supercell[iSi, :] > 0.) &
-                           (d_supercell[iSi, :] <= distance_cutoff))[0]
+    for ic, iSi in enumerate(silicon_indices):
+        indices = neighbour_list.neighbours(ic)
         assert len(indices) == 4, "Expect 4 indices to be found for each Si to be fully coordinated"
         all_species_equal_to(iSi, [super_cell[i].species for i in indices], 'o')
         coordinating_atom_indices.extend(indices)
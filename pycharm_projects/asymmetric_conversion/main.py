@@ -15,6 +15,8 @@ from scipy import spatial
 import spglib
 
 from modules.electronic_structure.structure import bravais
+from modules.spglib import symmetry
+from modules.spglib.cell import asymmetric_cell_atom_indices, group_reducible_atomic_indices, create_spg_molecule
 
 
 # -------------------------------------------
@@ -74,36 +76,6 @@ def show_cell(lattice, positions, numbers):
 # -----------------------------
 # My functions
 # -----------------------------
-def asymmetric_cell_atom_indices(dataset):
-    # atomic indices in supercell
-    atom_indices = []
-    for x in dataset['equivalent_atoms']:
-        atom_indices.append(x)
-
-    # Reduce to unique indices
-    atom_indices = list(set(atom_indices))
-    atom_indices.sort()
-    return atom_indices
-
-
-
-def group_reducible_atomic_indices(dataset):
-    sets_of_reducibles = []
-    one_set = []
-    ref_atom = dataset['equivalent_atoms'][0]
-
-    for reducible_atom, i in enumerate(dataset['equivalent_atoms']):
-
-        if (i != ref_atom):
-            sets_of_reducibles.append(one_set)
-            one_set = []
-            ref_atom = reducible_atom
-
-        one_set.append(reducible_atom)
-
-    return sets_of_reducibles
-
-
 def nearest_neighbour_asymmetric_cell_atom_indices(dataset, molecule):
     sets_of_reducibles = group_reducible_atomic_indices(dataset)
     irreducible_atoms = [sets_of_reducibles[0][0]]
@@ -188,24 +160,6 @@ def print_spg_symmetry_info(dataset, wyckoff=False, equivalent_atoms=False):
     return
 
 
-# Given an spg_molcule and set of atomic indices, return a new spg module
-def create_spg_molecule(input_molecule, indices):
-    lattice        = input_molecule[0]
-    old_positions      = input_molecule[1]
-    old_atomic_numbers = input_molecule[2]
-    positions = []
-    atomic_numbers = []
-
-    origin = [0,0,0]
-    #origin = np.asarray(old_positions[0])
-
-    for iatom in indices:
-        positions.append(tuple(old_positions[iatom] - origin))
-        atomic_numbers.append(old_atomic_numbers[iatom])
-
-    return (lattice, positions, atomic_numbers)
-
-
 def convert_to_boron_oxide(spg_asymmetric_cell, dataset, lattice_options):
 
     # My lattice returned column-wise
@@ -388,7 +342,7 @@ else:
     spg_molecule = spg_input
 
 # Get and print symmetry data
-dataset = spglib.get_symmetry_dataset(spg_molecule)
+dataset = symmetry.get_symmetry_data(spg_molecule)
 print_spg_symmetry_info(dataset, equivalent_atoms=False, wyckoff=False)
 
 # Reduce cell/primitive cell to asymmetric cell of irreducible atomic positions
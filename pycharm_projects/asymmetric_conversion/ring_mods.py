@@ -9,7 +9,7 @@ from statistics import mean
 
 # My modules
 from modules.fileio import read, write
-from modules.electronic_structure.structure import atoms
+from modules.electronic_structure.structure import atoms, neighbours
 from modules.maths import geometry
 
 import cell_operations
@@ -23,16 +23,7 @@ import cell_operations
 bond_length_bo = 1.7
 
 def neighbour_list(positions, cutoff, include_self=False)->list:
-    n_atoms = len(positions)
-    d = spatial.distance_matrix(positions, positions)
-    neighbours = []
-    if not include_self:
-        for i in range(0, n_atoms):
-            neighbours.append(np.where((d[i, :] > 0.) & (d[i, :] <= cutoff ))[0])
-    elif include_self:
-        for i in range(0, n_atoms):
-            neighbours.append(np.where((d[i, :] >= 0.) & (d[i, :] <= cutoff))[0])
-    return neighbours
+    return neighbours.neighbour_list(positions, cutoff, include_self=include_self).to_lists()
 
 
 def find_tetrahedral_units(species, nn_list):
@@ -6,11 +6,12 @@ import spglib
 from modules.electronic_structure.structure import bravais
 from modules.electronic_structure.structure import lattice as lt
 from modules.spglib import io as spglib_io
+from modules.spglib import symmetry
 
 def find_point_group(cell, print_out = False):
-    dataset = spglib.get_symmetry_dataset(cell, symprec=1e-5, angle_tolerance=-1.0)
+    dataset = symmetry.get_symmetry_data(cell, symprec=1e-5, angle_tolerance=-1.0)
     if print_out: spglib_io.show_spg_symmetry_info(dataset)
-    return dataset['pointgroup']
+    return dataset.pointgroup
 
 def show_lattice(lattice):
     print("Basis vectors:")
@@ -17,25 +17,6 @@ from modules.fileio import write
 from reference_systems import *
 
 
-def lattice_sum(lattice, n, cutoff):
-    """
-    Sum over translation vectors, using a radial criterion
-    :param lattice:
-    :param n:
-    :param cutoff:
-    :return:
-    """
-    cutoff_squared = cutoff * cutoff
-    translations = []
-    for k in range(-n[2], n[2]):
-        for j in range(-n[1], n[1]):
-            for i in range(-n[0], n[0]):
-                r = np.matmul(lattice, np.array([i, j, k]))
-                if np.dot(r, r) <= cutoff_squared:
-                    translations.append(r)
-    return translations
-
-
 def output_cell_from_cubic_criterion(system, cutoff):
     """
     Works for simple cubic cells, but
@@ -51,7 +32,7 @@ def output_cell_from_cubic_criterion(system, cutoff):
     max_integers = lattice_module.simple_cubic_cell_translation_integers(lattice, cutoff)
     print("Cubic criterion for " + name, "Lattice integers:", max_integers)
 
-    translations = lattice_sum(lattice, max_integers, cutoff)
+    translations = lattice_module.lattice_sum(lattice, max_integers, cutoff)
     super_cell = supercell.build_supercell(unit_cell, translations)
     write.xyz(name + "_cubic_criterion" , super_cell)
     return
@@ -68,7 +49,7 @@ def output_cell_from_general_criterion(system, cutoff):
     max_integers = lattice_module.translation_integers_for_radial_cutoff(lattice, cutoff)
     print("General criterion for " + name, "Lattice integers:", max_integers)
 
-    translations = lattice_sum(lattice, max_integers, cutoff)
+    translations = lattice_module.lattice_sum(lattice, max_integers, cutoff)
     super_cell = supercell.build_supercell(unit_cell, translations)
     write.xyz(name + "_general_criterion" , super_cell)
     return
@@ -11,16 +11,13 @@ from modules.electronic_structure.structure import lattice
 from modules.electronic_structure.structure import bravais
 from modules.electronic_structure.structure import atoms
 from modules.electronic_structure.structure import supercell
+from modules.electronic_structure.structure import neighbours
 from modules.fileio import write
 
 
 def get_positions(unit_cell):
-    n_atoms = len(unit_cell)
-    # Require this shape for default distance matrix function input
-    positions = np.empty(shape=(n_atoms, 3))
-    for i, atom in enumerate(unit_cell):
-        positions[i, :] = atom.position[:]
-    return positions
+    # Require shape (n_atoms, 3) for default distance matrix function input
+    return atoms.as_structure(unit_cell).positions
 
 
 def get_neighbour_details(system: System):
@@ -49,16 +46,8 @@ def get_neighbour_details(system: System):
 
 def get_surface_atoms(super_cell, radius, n_neighbours_bulk):
     positions = get_positions(super_cell)
-    d_matrix = spatial.distance_matrix(positions, positions)
-
-    surface_atom_indices = []
-    for ia in range(0, d_matrix.shape[0]):
-        indices = np.where((d_matrix[ia, :] > 0.) &
-                           (d_matrix[ia, :] <= radius))[0]
-        if len(indices) < n_neighbours_bulk:
-            surface_atom_indices.append(ia)
-
-    return surface_atom_indices
+    neighbour_list = neighbours.neighbour_list(positions, radius)
+    return neighbours.surface_atoms(neighbour_list, n_neighbours_bulk).tolist()
 
 
 def get_radial_distance_mean_and_sd(full_cell, surface_atom_indices):
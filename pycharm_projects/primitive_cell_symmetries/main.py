@@ -5,11 +5,11 @@
 # -----------------------------------------------------------------------
 
 import numpy as np
-import spglib
 
 from modules.electronic_structure.structure import bravais
 from modules.electronic_structure.structure import lattice
 from modules.spglib import io as spglib_io
+from modules.spglib import symmetry
 
 def sglib_data_types(columnwise_lattice):
     lattice = np.transpose(columnwise_lattice)
@@ -23,9 +23,9 @@ def sglib_data_types(columnwise_lattice):
 
 def find_point_group(lattice, print_out = False):
     cell = sglib_data_types(lattice)
-    dataset = spglib.get_symmetry_dataset(cell, symprec=1e-5, angle_tolerance=-1.0)
+    dataset = symmetry.get_symmetry_data(cell, symprec=1e-5, angle_tolerance=-1.0)
     if print_out: spglib_io.show_spg_symmetry_info(dataset)
-    return dataset['pointgroup']
+    return dataset.pointgroup
 
 # Not the smartest implementation
 def check_all_equal(lst: list, string: str):
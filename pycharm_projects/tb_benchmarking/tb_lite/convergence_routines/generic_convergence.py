@@ -2,7 +2,9 @@
 w.r.t. some input value.
 """
 import abc
+import copy
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, List, Callable, Optional, Tuple
 from pathlib import Path
 
@@ -49,6 +51,28 @@ class CalculationIO(abc.ABC):
         """
         ...
 
+    def kill(self) -> None:
+        """ Stop a run in progress, called from another thread than the one running it.
+
+        The interrupted run should return promptly, with a failed result, and runs that have
+        not started should not start. By default runs cannot be interrupted, and this does nothing.
+        """
+        pass
+
+    def copy_to(self, directory: path_type) -> 'CalculationIO':
+        """ Copy the calculation, with a new working directory.
+
+        The directory is created if it does not exist. Sub-classes holding other
+        directory-dependent state (for example, a runner) should extend this.
+
+        :param directory: Working directory of the copy.
+        :return Copy of the calculation.
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        new_calculation = copy.deepcopy(self)
+        new_calculation.directory = directory
+        return new_calculation
+
 
 class ConvergenceCriteria(abc.ABC):
     """Abstract base class for performing a set of convergence calculations.
@@ -189,3 +213,82 @@ def converge(calculation: CalculationIO,
             return results
 
     return results
+
+
+def converge_concurrent(calculation: CalculationIO,
+                        convergence: ConvergenceCriteria,
+                        set_value_in_input: Callable[[any, CalculationIO], Union[any, None]],
+                        n_speculative: int,
+                        sub_directory_prefix='step_') -> List[tuple]:
+    """ Converge a calculation output with respect to an input parameter, running
+    calculations for the next n_speculative input values concurrently.
+
+    Each input value is run in its own sub-directory of calculation.directory, using
+    a copy of the calculation returned by `calculation.copy_to`. Convergence is evaluated
+    in input order, as results become available, and returned results are identical to
+    those of `converge`.
+
+    Once convergence or early exit is detected (or an exception is raised), runs that have
+    not started are cancelled, and runs in progress are stopped with `CalculationIO.kill`.
+    Their results are discarded. Runs of calculations that cannot be killed are waited for.
+    No run continues past the return of this function, so step directories are not written
+    to after it returns.
+
+    Calculations are expected to run external binaries, so are launched from a pool of threads.
+
+    :param calculation: Calculation instance.
+    :param convergence: Convergence parameters and criteria.
+    :param set_value_in_input: Function that sets a value in the input
+    defined by the calculation.
+    :param n_speculative: Maximum number of calculations to run concurrently.
+    :param sub_directory_prefix: Prefix of the sub-directory for each input value,
+    which is suffixed with the value's index.
+
+    :return: List of results. Each result is a tuple(input value, output)
+    """
+    if n_speculative < 1:
+        raise ValueError('n_speculative must be > 0')
+
+    values = convergence.input
+
+    def run_step(i: int, step_calculation: CalculationIO) -> Union[dict, SubprocessRunResults]:
+        step_calculation.write_inputs()
+        return convergence_step(values[i], step_calculation, set_value_in_input)
+
+    executor = ThreadPoolExecutor(max_workers=n_speculative)
+    futures = {}
+    # Calculations are copied before submission, such that every submitted run can be killed
+    step_calculations = {}
+    n_submitted = 0
+    results = []
+
+    try:
+        for i in range(0, len(values)):
+            # Keep up to n_speculative calculations in flight, ahead of the one being evaluated
+            while n_submitted < min(len(values), i + n_speculative):
+                step_directory = Path(calculation.directory) / f'{sub_directory_prefix}{n_submitted}'
+                step_calculation = calculation.copy_to(step_directory)
+                step_calculations[n_submitted] = step_calculation
+                futures[n_submitted] = executor.submit(run_step, n_submitted, step_calculation)
+                n_submitted += 1
+
+            result = futures.pop(i).result()
+            del step_calculations[i]
+
+            if i == 0:
+                results.append((values[0], result, False, False))
+                if isinstance(result, SubprocessRunResults):
+                    break
+                continue
+
+            converged, early_exit = convergence.evaluate(result, results[-1][1])
+            results.append((values[i], result, converged, early_exit))
+            if converged or early_exit:
+                break
+    finally:
+        # Cancel runs that have not started, kill those in progress, and wait for their threads to return
+        for step_calculation in step_calculations.values():
+            step_calculation.kill()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return results
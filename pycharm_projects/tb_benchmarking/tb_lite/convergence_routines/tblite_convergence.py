@@ -11,7 +11,7 @@ import ase.atoms
 
 # Abstract classes and routine for convergence
 from tb_lite.convergence_routines.generic_convergence import CalculationIO, path_type, \
-    ConvergenceCriteria, converge
+    ConvergenceCriteria, converge, converge_concurrent
 from tb_lite.src.runner import BinaryRunner, SubprocessRunResults
 
 # TB Lite - specific
@@ -50,6 +50,13 @@ class TbliteCalculation(CalculationIO):
         if not isinstance(atoms, ase.atoms.Atoms):
             raise ValueError('Require atoms to be of type  ase.atoms.Atoms')
 
+    def copy_to(self, directory: path_type) -> 'TbliteCalculation':
+        """ Copy the calculation, with the runner also using the new working directory.
+        """
+        new_calculation = super().copy_to(directory)
+        new_calculation.runner.directory = directory
+        return new_calculation
+
     def write_dftb_hsd(self) -> None:
         """ Write dftb_hsd.in
 
@@ -86,6 +93,11 @@ class TbliteCalculation(CalculationIO):
         """
         return self.runner.run()
 
+    def kill(self) -> None:
+        """ Kill the run in progress, and prevent further runs of this calculation.
+        """
+        self.runner.kill()
+
     def parse_output(self) -> Union[dict, FileNotFoundError]:
         """ Parse energies from DFTB+'s "detailed.out" in eV.
 
@@ -155,3 +167,6 @@ def set_kgrid_in_tblite(k_grid: Union[int, List[int]], calculation: TbliteCalcul
 # k_grids = [[4, 4, 4], [6, 6, 6], [8, 8, 8]]
 # convergence = TBliteConvergence(k_grids, {'Total energy': 1.e-5})
 # converge(calculation, convergence, set_kgrid_in_tblite)
+#
+# or, running up to 4 k-grids at a time, each in a sub-directory of directory:
+# converge_concurrent(calculation, convergence, set_kgrid_in_tblite, n_speculative=4)
@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pytest
+
+from tb_lite.convergence_routines import generic_convergence
+from tb_lite.convergence_routines.generic_convergence import CalculationIO, ConvergenceCriteria, converge, \
+    converge_concurrent
+from tb_lite.src.runner import BinaryRunner
+from tb_lite.src.test_runner import is_running
+
+
+class FakeCalculation(CalculationIO):
+    def write_inputs(self):
+        pass
+
+    def run(self):
+        pass
+
+    def parse_output(self):
+        pass
+
+
+class EnergyConvergence(ConvergenceCriteria):
+    @ConvergenceCriteria.check_target
+    def evaluate(self, current: dict, prior: dict):
+        converged = abs(current['energy'] - prior['energy']) < self.criteria['energy']
+        return converged, False
+
+
+class FakeSteps:
+    """
+    Stand-in for convergence_step, recording when each step starts and ends.
+    Energies converge as 1/value, and later steps take longer than earlier ones,
+    such that speculative steps are still running when convergence is detected.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = {}
+        self.finished = {}
+
+    def __call__(self, value, calculation, set_value_in_input):
+        with self.lock:
+            self.started[value] = time.perf_counter()
+        time.sleep(0.01 * value)
+        with self.lock:
+            self.finished[value] = time.perf_counter()
+        return {'energy': 1. / value}
+
+
+@pytest.mark.parametrize('n_speculative', [1, 3])
+def test_converge_concurrent(tmp_path, monkeypatch, n_speculative):
+    values = list(range(1, 11))
+    # Differences in energy are 0.5, 0.167, 0.083, 0.05, ... so converges at value 5
+    convergence = EnergyConvergence(values, {'energy': 0.06})
+
+    monkeypatch.setattr(generic_convergence, 'convergence_step', FakeSteps())
+    serial_results = converge(FakeCalculation('serial', tmp_path), convergence, None)
+
+    steps = FakeSteps()
+    monkeypatch.setattr(generic_convergence, 'convergence_step', steps)
+    results = converge_concurrent(FakeCalculation('concurrent', tmp_path), convergence, None, n_speculative)
+    returned = time.perf_counter()
+
+    assert results == serial_results
+    assert results[-1][0] == 5 and results[-1][2], "Converged at value 5"
+
+    # Only speculative steps beyond convergence were started, and none run past the return
+    assert max(steps.started) <= 5 + n_speculative - 1
+    assert set(steps.finished) == set(steps.started)
+    assert all(end <= returned for end in steps.finished.values())
+    assert (tmp_path / 'step_0').is_dir()
+
+
+class ShellCalculation(CalculationIO):
+    """
+    Calculation running a shell script. Steps up to value 5 are quick,
+    and later steps run until killed
+    """
+    def __init__(self, name, directory):
+        super().__init__(name, directory)
+        self.runner = BinaryRunner('/bin/sh', ['./'], 1, 60, directory)
+        self.value = None
+
+    def write_inputs(self):
+        pass
+
+    def run(self):
+        duration = 0.05 * self.value if self.value <= 5 else 30
+        self.runner.args = ['-c', f'sleep {duration} & echo $! > child; wait; echo done > finished']
+        return self.runner.run()
+
+    def parse_output(self):
+        return {'energy': 1. / self.value}
+
+    def kill(self):
+        self.runner.kill()
+
+    def copy_to(self, directory):
+        new_calculation = super().copy_to(directory)
+        new_calculation.runner.directory = directory
+        return new_calculation
+
+
+def set_value(value, calculation: ShellCalculation):
+    calculation.value = value
+
+
+def test_converge_concurrent_kills_speculative_steps(tmp_path):
+    values = list(range(1, 11))
+    n_speculative = 3
+    convergence = EnergyConvergence(values, {'energy': 0.06})
+
+    start = time.perf_counter()
+    results = converge_concurrent(ShellCalculation('concurrent', tmp_path), convergence, set_value, n_speculative)
+
+    assert time.perf_counter() - start < 10, "Speculative steps are not waited for"
+    assert [result[0] for result in results] == [1, 2, 3, 4, 5]
+    assert results[-1][2], "Converged at value 5"
+
+    for i in range(0, 5):
+        assert (tmp_path / f'step_{i}' / 'finished').is_file()
+
+    # Steps beyond convergence were killed, along with their children
+    for i in range(5, 5 + n_speculative - 1):
+        step_directory = tmp_path / f'step_{i}'
+        assert not (step_directory / 'finished').is_file()
+        if (step_directory / 'child').is_file() and (step_directory / 'child').read_text():
+            assert not is_running(step_directory / 'child')
+    assert not (tmp_path / f'step_{5 + n_speculative - 1}').exists(), "Only n_speculative steps are submitted"
@@ -1,7 +1,6 @@
 """
 Generate consistent band paths
 """
-import ase
 import numpy as np
 
 
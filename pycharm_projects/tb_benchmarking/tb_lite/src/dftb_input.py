@@ -2,7 +2,10 @@
 Generate DFTB+/TB lite input files
 """
 import numpy as np
-import ase
+
+from modules.lazy_import import lazy_import
+
+ase_cell = lazy_import('ase.cell')
 
 
 class DftbInput:
@@ -189,7 +192,7 @@ def generate_band_structure_input(lattice_vectors, method: str) -> str:
     :return: Input file string
     """
     assert method in ['GFN1-xTB', 'GFN2-xTB'], "Method is not valid"
-    cell = ase.atoms.Cell(lattice_vectors)
+    cell = ase_cell.Cell(lattice_vectors)
     band_path = cell.bandpath()
     h_bands = BandStructureHamiltonian(band_path.kpts, method=method)
     return DftbInput(hamiltonian=h_bands).generate_dftb_hsd()
@@ -11,8 +11,10 @@ import io
 from pathlib import PurePath, Path
 from typing import Union
 
-import ase
-from pymatgen.io.cif import CifParser
+from modules.lazy_import import lazy_import
+
+ase_atoms = lazy_import('ase.atoms')
+pymatgen_cif = lazy_import('pymatgen.io.cif')
 
 
 # def io_robustness(mode: str, func: Callable):
@@ -277,15 +279,15 @@ def parse_dftb_bands(directory) -> np.ndarray:
     return bands
 
 
-def cif_to_ase_atoms(file: str) -> ase.atoms.Atoms:
+def cif_to_ase_atoms(file: str) -> 'ase.atoms.Atoms':
     """Convert CIF to ASE Atoms.
 
     ASE's read_cif() doesn't seem robust, or I'm using it wrong, so use pymatgen instead.
     :param file:
     :return:
     """
-    structure = CifParser(file).get_structures()[0]
-    atoms = ase.atoms.Atoms(numbers=structure.atomic_numbers,
+    structure = pymatgen_cif.CifParser(file).get_structures()[0]
+    atoms = ase_atoms.Atoms(numbers=structure.atomic_numbers,
                             cell=structure.lattice.matrix,
                             scaled_positions=structure.frac_coords,
                             pbc=True)
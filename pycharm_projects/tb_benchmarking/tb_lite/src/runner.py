@@ -1,11 +1,14 @@
 """
-Binary runner and results class
+Binary runners and results class
 """
 from typing import List, Optional, Union
 from pathlib import Path
+import asyncio
 import os
+import signal
 import subprocess
 import shutil
+import threading
 
 
 class SubprocessRunResults:
@@ -20,9 +23,15 @@ class SubprocessRunResults:
         self.success = return_code == 0
 
 
+# Serialises starting and killing the processes of BinaryRunner instances
+_process_lock = threading.Lock()
+
+
 class BinaryRunner:
     """
-    Compose a run command, and run a binary
+    Compose a run command, and run a binary.
+
+    A run can be stopped from another thread with kill.
     """
     path_type = Union[str, Path]
 
@@ -66,11 +75,13 @@ class BinaryRunner:
         if not isinstance(run_cmd, list):
             raise ValueError("Run commands expected in a list. For example ['mpirun', '-np', '2']")
 
+        self.mpi_processes = 1
         try:
             i = run_cmd.index('-np')
             mpi_processes = eval(run_cmd[i + 1])
             assert type(mpi_processes) == int, "Number of MPI processes should be an int"
             assert mpi_processes > 0, "Number of MPI processes must be > 0"
+            self.mpi_processes = mpi_processes
         except ValueError:
             # .index will return ValueError if 'np' not found (serial and omp calculations)
             pass
@@ -79,6 +90,10 @@ class BinaryRunner:
 
         assert time_out > 0, "time_out must be a positive integer"
 
+        # Process of the run in progress, and whether the runner has been killed
+        self._process = None
+        self._killed = False
+
     def _compose_execution_list(self) -> list:
         """Generate a complete list of strings to pass to subprocess.run, to execute the calculation.
 
@@ -92,6 +107,11 @@ class BinaryRunner:
         else:
             return self.run_cmd + [self.binary] + self.args
 
+    def environment(self) -> dict:
+        """Environment in which to run the binary: A copy of the current environment, with OMP_NUM_THREADS set.
+        """
+        return {**os.environ, "OMP_NUM_THREADS": str(self.omp_num_threads)}
+
     def run(self, directory: Optional[path_type] = None, execution_list: Optional[list] = None) -> SubprocessRunResults:
         """Run a binary.
 
@@ -108,16 +128,239 @@ class BinaryRunner:
         if execution_list is None:
             execution_list = self._compose_execution_list()
 
-        my_env = {**os.environ, "OMP_NUM_THREADS": str(self.omp_num_threads)}
+        my_env = self.environment()
+
+        # Start a new session, such that the binary and its children (for example, MPI ranks) can be killed together
+        with _process_lock:
+            if self._killed:
+                return SubprocessRunResults(None, None, -signal.SIGKILL)
+            self._process = subprocess.Popen(execution_list,
+                                             env=my_env,
+                                             stdout=subprocess.PIPE,
+                                             stderr=subprocess.PIPE,
+                                             cwd=directory,
+                                             start_new_session=True)
+        process = self._process
 
         try:
-            result = subprocess.run(execution_list,
-                                    env=my_env,
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.PIPE,
-                                    timeout=self.time_out,
-                                    cwd=directory)
-            return SubprocessRunResults(result.stdout, result.stderr, result.returncode)
+            stdout, stderr = process.communicate(timeout=self.time_out)
+            return SubprocessRunResults(stdout, stderr, process.returncode)
         except subprocess.TimeoutExpired:
+            self._kill_process_group(process)
+            process.communicate()
             print('Job timed out')
             return SubprocessRunResults(None, None, -1)
+        except BaseException:
+            self._kill_process_group(process)
+            process.wait()
+            raise
+        finally:
+            with _process_lock:
+                self._process = None
+
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def kill(self) -> None:
+        """Kill the run in progress, and any child processes, from another thread.
+
+        A run that has not started yet is not started, and later runs return immediately.
+        The killed run returns a result with a negative return code.
+        """
+        with _process_lock:
+            self._killed = True
+            if self._process is not None:
+                self._kill_process_group(self._process)
+
+
+class _CorePool:
+    """
+    Set of free cores, which concurrent jobs acquire and release
+    """
+
+    def __init__(self, cores: List[int]):
+        self.free = list(cores)
+        self.n_cores = len(cores)
+        self.condition = asyncio.Condition()
+
+    async def acquire(self, n: int) -> List[int]:
+        # A job requesting more cores than exist is given all of them, rather than waiting forever
+        n = min(n, self.n_cores)
+        async with self.condition:
+            await self.condition.wait_for(lambda: len(self.free) >= n)
+            cores, self.free = self.free[:n], self.free[n:]
+            return cores
+
+    async def release(self, cores: List[int]):
+        async with self.condition:
+            self.free += cores
+            self.condition.notify_all()
+
+
+class AsyncBinaryRunner:
+    """
+    Run many binaries concurrently, each defined by a BinaryRunner.
+
+    Each job is allocated omp_num_threads * mpi_processes cores from the available cores,
+    and waits until enough are free. If pin_cores, the job is restricted to its allocated
+    cores (Linux only), such that concurrent OMP jobs do not oversubscribe the node.
+    stdout and stderr are read as they are produced, so partial output is retained for
+    jobs that time out. Jobs that time out are killed, along with any child processes.
+
+    Example:
+      runners = [BinaryRunner('dftb+', ['./'], 4, 600, directory) for directory in directories]
+      results = AsyncBinaryRunner().run(runners)
+    """
+
+    def __init__(self,
+                 cores: Optional[List[int]] = None,
+                 max_concurrent: Optional[int] = None,
+                 pin_cores=True
+                 ) -> None:
+        """
+        :param Optional[List[int]] cores: Cores on which to run jobs. Defaults to all cores available to this process
+        :param Optional[int] max_concurrent: Optional maximum number of jobs to run at once.
+        :param bool pin_cores: Pin each job to its allocated cores
+        """
+        if cores is None:
+            if hasattr(os, 'sched_getaffinity'):
+                cores = sorted(os.sched_getaffinity(0))
+            else:
+                cores = list(range(0, os.cpu_count()))
+        self.cores = list(cores)
+        self.max_concurrent = max_concurrent
+        self.pin_cores = pin_cores and hasattr(os, 'sched_setaffinity')
+
+        assert len(self.cores) > 0, "Require at least one core"
+        if self.pin_cores:
+            assert set(self.cores).issubset(os.sched_getaffinity(0)), \
+                "Cores to pin jobs to must be available to this process"
+        if max_concurrent is not None:
+            assert max_concurrent > 0, "max_concurrent must be > 0"
+
+    async def _execute(self, runner: BinaryRunner, directory: BinaryRunner.path_type, env: dict, cores: List[int]) \
+            -> SubprocessRunResults:
+        """Run a single job on the allocated cores.
+        """
+        preexec_fn = (lambda: os.sched_setaffinity(0, cores)) if self.pin_cores else None
+
+        # Start a new session, such that the job and its children (for example, MPI ranks) can be killed together
+        spawn = asyncio.ensure_future(asyncio.create_subprocess_exec(*runner._compose_execution_list(),
+                                                                     env=env,
+                                                                     stdout=asyncio.subprocess.PIPE,
+                                                                     stderr=asyncio.subprocess.PIPE,
+                                                                     cwd=directory,
+                                                                     preexec_fn=preexec_fn,
+                                                                     start_new_session=True))
+        try:
+            # Cancelling process creation part-way can hang asyncio, if the process's children
+            # keep its pipes open. Instead, let creation complete, then kill the process
+            process = await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            await asyncio.wait([spawn])
+            if spawn.exception() is None:
+                process = spawn.result()
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+            raise
+
+        stdout, stderr = bytearray(), bytearray()
+
+        async def read_stream(stream, buffer: bytearray):
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+
+        def kill():
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        job = asyncio.gather(read_stream(process.stdout, stdout),
+                             read_stream(process.stderr, stderr),
+                             process.wait())
+        try:
+            await asyncio.wait_for(job, timeout=runner.time_out)
+            return SubprocessRunResults(bytes(stdout), bytes(stderr), process.returncode)
+        except asyncio.TimeoutError:
+            kill()
+            await process.wait()
+            print('Job timed out')
+            return SubprocessRunResults(bytes(stdout), bytes(stderr), -1)
+        except asyncio.CancelledError:
+            kill()
+            await process.wait()
+            raise
+        finally:
+            # Retrieve the outcome of the (possibly cancelled) job, such that it is not reported as unhandled
+            await asyncio.gather(job, return_exceptions=True)
+
+    async def _run_job(self, pool: _CorePool, semaphore: asyncio.Semaphore, runner: BinaryRunner,
+                       directory: Optional[BinaryRunner.path_type], env: Optional[dict]) -> SubprocessRunResults:
+        """Wait for free cores, then run a job.
+        """
+        if directory is None:
+            directory = runner.directory
+
+        if not Path(directory).is_dir():
+            raise OSError(f"Run directory does not exist: {directory}")
+
+        job_env = runner.environment()
+        if env is not None:
+            job_env.update(env)
+
+        async with semaphore:
+            cores = await pool.acquire(runner.omp_num_threads * runner.mpi_processes)
+            try:
+                return await self._execute(runner, directory, job_env, cores)
+            finally:
+                await pool.release(cores)
+
+    async def run_all(self,
+                      runners: List[BinaryRunner],
+                      directories: Optional[List[BinaryRunner.path_type]] = None,
+                      envs: Optional[List[dict]] = None) -> List[SubprocessRunResults]:
+        """Run all jobs concurrently, subject to the available cores.
+
+        :param List[BinaryRunner] runners: Job definitions.
+        :param Optional[List] directories: Optional run directory per job. Defaults to each runner's directory.
+        :param Optional[List[dict]] envs: Optional environment variables per job, added to the runner's environment.
+        :return: Results, ordered as runners. If any job raises, the first exception is raised
+        once all jobs have finished.
+        """
+        n_jobs = len(runners)
+        directories = [None] * n_jobs if directories is None else directories
+        envs = [None] * n_jobs if envs is None else envs
+        assert len(directories) == n_jobs, "Require one directory per runner"
+        assert len(envs) == n_jobs, "Require one environment per runner"
+
+        pool = _CorePool(self.cores)
+        semaphore = asyncio.Semaphore(n_jobs if self.max_concurrent is None else self.max_concurrent)
+        jobs = [self._run_job(pool, semaphore, runner, directory, env)
+                for runner, directory, env in zip(runners, directories, envs)]
+
+        # Let all jobs finish before raising any exception
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return results
+
+    def run(self,
+            runners: List[BinaryRunner],
+            directories: Optional[List[BinaryRunner.path_type]] = None,
+            envs: Optional[List[dict]] = None) -> List[SubprocessRunResults]:
+        """Blocking wrapper for run_all. See run_all for arguments.
+        """
+        return asyncio.run(self.run_all(runners, directories, envs))
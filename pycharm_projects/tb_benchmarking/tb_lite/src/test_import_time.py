@@ -0,0 +1,34 @@
+import os
+
+from modules.lazy_import import cold_import_times
+
+# Root of tb_benchmarking, such that tb_lite is importable
+tb_benchmarking_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules imported by short parse and run tasks
+core_modules = ['tb_lite.src.parsers',
+                'tb_lite.src.dftb_input',
+                'tb_lite.src.runner',
+                'tb_lite.src.bath_path',
+                'tb_lite.src.utils']
+
+# Dependencies that should only be imported on first use
+heavy_modules = ['ase', 'pymatgen', 'scipy', 'matplotlib', 'excitingtools', 'spglib']
+
+# Cold-start budget for importing all core modules, including numpy, in ms.
+# Importing numpy alone takes ~0.1 s, and ase alone takes several times the remainder
+import_budget = 500.
+
+
+def test_core_modules_import_time():
+    """
+    Cold-start import of tb_lite.src, measured with python -X importtime.
+    """
+    times = cold_import_times(core_modules, python_path=[tb_benchmarking_root])
+
+    loaded = [name for name in heavy_modules if name in times]
+    assert not loaded, "Heavy modules should be imported on first use, not by tb_lite.src: " + ', '.join(loaded)
+
+    total = 1.e-3 * sum(self_time for self_time, _ in times.values())
+    assert total < import_budget, \
+        "Cold-start import of tb_lite.src, " + str(round(total)) + " ms, exceeds the budget"
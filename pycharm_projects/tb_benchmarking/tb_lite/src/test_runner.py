@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tb_lite.src.runner import BinaryRunner, AsyncBinaryRunner
+
+
+def shell_runner(directory, script: str, omp_num_threads=1, time_out=60) -> BinaryRunner:
+    return BinaryRunner('/bin/sh', ['./'], omp_num_threads, time_out, directory, args=['-c', script])
+
+
+def is_running(pid_file) -> bool:
+    """
+    Whether the process with the PID in pid_file is running. Killed children of a killed job
+    are reparented, and may remain as zombies until reaped, so the process state is checked
+    """
+    try:
+        with open(f'/proc/{int(pid_file.read_text())}/stat') as fid:
+            state = fid.read().rsplit(')', 1)[1].split()[0]
+    except FileNotFoundError:
+        return False
+    return state not in ['Z', 'X']
+
+
+def max_concurrent_jobs(log_file) -> int:
+    """
+    Max number of jobs running at once, from a log of job starts (s) and ends (e)
+    """
+    n_running, max_running = 0, 0
+    for event in log_file.read_text().split():
+        n_running += 1 if event == 's' else -1
+        max_running = max(max_running, n_running)
+    return max_running
+
+
+def test_results_are_ordered_as_runners(tmp_path):
+    # Later jobs finish first
+    runners = [shell_runner(tmp_path, f'sleep {0.1 * (3 - i)}; echo {i}') for i in range(0, 3)]
+    results = AsyncBinaryRunner(cores=[0, 1, 2], pin_cores=False).run(runners)
+
+    assert [result.stdout for result in results] == [b'0\n', b'1\n', b'2\n']
+    assert all(result.success for result in results)
+
+
+def test_timed_out_job_is_killed_with_its_children(tmp_path):
+    # The child sleep holds stdout open, so is only stopped by killing the process group
+    runner = shell_runner(tmp_path, 'echo partial; sleep 30 & echo $! > child; wait', time_out=1)
+
+    start = time.perf_counter()
+    result = AsyncBinaryRunner(cores=[0], pin_cores=False).run([runner])[0]
+
+    assert time.perf_counter() - start < 10
+    assert result.return_code == -1
+    assert result.stdout == b'partial\n', "Partial output is retained"
+    assert not is_running(tmp_path / 'child')
+
+
+@pytest.mark.parametrize('delay', [0., 0.001, 0.005, 0.2])
+def test_cancelled_job_is_killed(tmp_path, delay):
+    runner = shell_runner(tmp_path, 'sleep 30 & echo $! > child; wait')
+
+    async def run_then_cancel():
+        job = asyncio.ensure_future(AsyncBinaryRunner(cores=[0], pin_cores=False).run_all([runner]))
+        # Cancel before, part-way through, or after creating the process
+        await asyncio.sleep(delay)
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(job, timeout=10)
+
+    asyncio.run(run_then_cancel())
+    if (tmp_path / 'child').is_file() and (tmp_path / 'child').read_text():
+        assert not is_running(tmp_path / 'child')
+
+
+def test_jobs_are_limited_by_free_cores(tmp_path):
+    log_file = tmp_path / 'log'
+    job = 'echo s >> log; sleep 0.2; echo e >> log'
+
+    # Two cores, so at most two single-thread jobs at once
+    runners = [shell_runner(tmp_path, job) for _ in range(0, 4)]
+    results = AsyncBinaryRunner(cores=[0, 1], pin_cores=False).run(runners)
+    assert all(result.success for result in results)
+    assert max_concurrent_jobs(log_file) == 2
+
+    # Jobs needing both cores run one at a time
+    log_file.unlink()
+    runners = [shell_runner(tmp_path, job, omp_num_threads=2) for _ in range(0, 3)]
+    AsyncBinaryRunner(cores=[0, 1], pin_cores=False).run(runners)
+    assert max_concurrent_jobs(log_file) == 1
+
+    # max_concurrent further limits the number of jobs
+    log_file.unlink()
+    runners = [shell_runner(tmp_path, job) for _ in range(0, 3)]
+    AsyncBinaryRunner(cores=[0, 1], max_concurrent=1, pin_cores=False).run(runners)
+    assert max_concurrent_jobs(log_file) == 1
+
+
+def test_binary_runner_kill(tmp_path):
+    runner = shell_runner(tmp_path, 'sleep 30 & echo $! > child; wait')
+
+    # Kill the run from another thread, once it has started its child
+    def kill_when_started():
+        while not ((tmp_path / 'child').is_file() and (tmp_path / 'child').read_text()):
+            time.sleep(0.01)
+        runner.kill()
+
+    killer = threading.Thread(target=kill_when_started)
+    killer.start()
+    start = time.perf_counter()
+    result = runner.run()
+    killer.join()
+
+    assert time.perf_counter() - start < 10
+    assert not result.success
+    assert not is_running(tmp_path / 'child')
+
+    # A killed runner does not start further runs
+    runner.args = ['-c', 'echo run > ran']
+    assert not runner.run().success
+    assert not (tmp_path / 'ran').is_file()
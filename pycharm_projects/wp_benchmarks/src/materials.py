@@ -4,7 +4,9 @@ WP2 Benchmarks, written in Python data structures
 from dataclasses import dataclass
 import numpy as np
 
-from pymatgen.io.cif import CifParser
+from modules.lazy_import import lazy_import
+
+pymatgen_cif = lazy_import('pymatgen.io.cif')
 
 # Constants
 bohr_to_angstrom = 0.529177210903
@@ -21,7 +23,7 @@ def cif_to_pymatgen(file: str, get_primitive: bool):
 
     :param file: file name
     """
-    structure = CifParser(file).get_structures()[0]
+    structure = pymatgen_cif.CifParser(file).get_structures()[0]
 
     # TODO(Alex) Does not appear to give the primitive lattice vectors
     if get_primitive:
@@ -1,11 +1,16 @@
 import numpy as np
-from typing import List
+from typing import List, Tuple
 
-from ase.neighborlist import mic
-# from ase.geometry import complete_cell, find_mic, wrap_positions
+from modules.electronic_structure.structure.cell_reduction import niggli_reduce
+from modules.electronic_structure.structure.lattice import translation_integers_for_radial_cutoff, \
+    translation_integer_grid
+from modules.lazy_import import lazy_import
+from modules.parameters import elements
 
 from src.materials import MoS2WS2Bilayer, ZnOWurzite, ZrO2Primitive, SiliconPrimitive, TiO2Rutile
 
+spatial = lazy_import('scipy.spatial')
+
 
 def fixed_precision_rgkmax(atomic_number: int) -> float:
     """ Get an rgkmax value, given an atomic number
@@ -14,22 +19,12 @@ def fixed_precision_rgkmax(atomic_number: int) -> float:
     Found empirically by Sven working on the Delta-DFT project.
     TODO(Alex) Document what precision in total energy, these rgkmax resulted in
 
+    Tabulated from H to Rn in modules.parameters.elements. Lanthanides and At have no value (nan).
+
     :param atomic_number: Atomic number
     :return: rgkmax value
     """
-    fixed_rgkmax = np.array([
-        5.835430, 8.226318, 8.450962, 8.307929,
-        8.965808, 9.376204, 9.553568, 10.239864, 10.790975, 10.444355, 10.636286, 10.579793,
-        10.214125, 10.605334, 10.356352, 9.932381, 10.218153, 10.466519, 10.877475, 10.774763,
-        11.580691, 11.800971, 11.919804, 12.261896, 12.424606, 12.571031, 12.693836, 12.781331,
-        12.619806, 12.749802, 12.681350, 12.802838, 12.785680, 12.898916, 12.400000, 10.596757,
-        11.346060, 10.857573, 11.324413, 11.664200, 11.859519, 11.892673, 12.308470, 12.551024,
-        12.740728, 12.879424, 13.027090, 13.080576, 13.230621, 13.450665, 13.495632, 13.261039,
-        13.432654, 11.329591, 13.343047, 13.011835, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
-        np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, 15.134859, 14.955721,
-        14.607311, 13.930505, 13.645267, 13.629439, 13.450805, 13.069046, 13.226699, 13.261342,
-        13.365992, 13.557571, 13.565048, 13.579543, np.nan, 12.273924])
-    return fixed_rgkmax[atomic_number + 1]
+    return elements.fixed_precision_rgkmax[atomic_number]
 
 
 def atomic_number_species_with_mt_min(atomic_numbers: List[int]) -> int:
@@ -45,79 +40,71 @@ def atomic_number_species_with_mt_min(atomic_numbers: List[int]) -> int:
     return an_min_mt
 
 
-def find_minimum_bond_lengths(positions: np.ndarray, lattice: np.ndarray, atomic_numbers: List[int]) -> dict:
-    """Find the minimum bond length between the species with (the anticipated) smallest MT radius,
-    and each other species in a periodic cell.
-
-    :return minimum_bond_lengths: Minimum bond length between species X and Y, for all Y, where X
-    is the species with the smallest MT radius.
-    """
-    np_atomic_numbers = np.asarray(atomic_numbers)
-    unique_atomic_numbers = set(atomic_numbers)
-    an_min_mt = atomic_number_species_with_mt_min(atomic_numbers)
-
-    # Get the atomic indices for each species
-    indices = {}
-    for an in unique_atomic_numbers:
-        indices[an] = np.where(np_atomic_numbers == an)[0]
-
-    # Find all pair vectors in the unit cell, between two species (X_min_MT, Y)
-    # and store the shortest corresponding bond_length.
-    minimum_bond_lengths = {}
-    r_x = positions[indices[an_min_mt]]
-    for an in unique_atomic_numbers:
-        r_y = positions[indices[an]]
-        d_vectors = wrapped_displacement_vectors(r_x, r_y, lattice, remove_self_interaction=True)
-        minimum_bond_lengths[an] = minimum_vector_length(d_vectors)
-
-    return minimum_bond_lengths
-
+def minimum_distance_matrix(positions: np.ndarray, lattice: np.ndarray, atomic_numbers: List[int]) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """ Minimum distance between each pair of species in a periodic cell, including periodic images.
 
-def wrapped_displacement_vectors(r_x: np.ndarray,
-                                 r_y: np.ndarray,
-                                 lattice: np.ndarray,
-                                 remove_self_interaction=True) -> np.ndarray:
-    """ Find all displacement vectors between atom/s at position/s r_x
-    and atom/s at position/s r_y, in the minimum image convention.
+    Atoms are wrapped into the Niggli-reduced cell. For each species Y, a k-d tree is built over the
+    periodic images of the Y atoms within a search radius, and queried for the nearest Y neighbour of
+    the atoms of each species X. The search radius starts at the mean interatomic spacing, (V / N)^(1/3),
+    and is doubled while any species pair has no neighbour within it, so the number of images per atom
+    does not grow with the size of the cell.
 
-    wrapped_vectors = [[r0 - r0], [r1 - r0], ... [r_Ny - r_Nx]]
+    Note, an atom's own periodic images are included, such that the minimum distance between
+    species X and X is defined for a cell containing one X atom. The per-pair minimum image search
+    this replaced excluded them.
 
-    :return wrapped_vectors: Displacement vectors between positions r_x and r_y, in the
-     minimum image convention.
+    :param positions: Cartesian positions, shape (n_atoms, 3).
+    :param lattice: Lattice vectors, stored row-wise.
+    :param atomic_numbers: Atomic numbers.
+    :return species, d_min: Unique atomic numbers, and the minimum distance between each
+    pair of them, with shape (n_species, n_species).
     """
-    displacement_vectors = []
-    for i in range(r_x.shape[0]):
-        for j in range(r_y.shape[0]):
-            displacement_vectors.append(r_y[j, :] - r_x[i, :])
+    positions = np.asarray(positions, dtype=float)
+    n_atoms = positions.shape[0]
+    species, species_index = np.unique(atomic_numbers, return_inverse=True)
+    n_species = species.size
+
+    # modules stores lattice vectors column-wise
+    reduced_lattice, _ = niggli_reduce(np.transpose(lattice))
+    fractional = np.linalg.solve(reduced_lattice, positions.T).T
+    wrapped = (fractional - np.floor(fractional)) @ reduced_lattice.T
+    species_positions = [wrapped[species_index == i] for i in range(n_species)]
+
+    d_min = np.full(shape=(n_species, n_species), fill_value=np.inf)
+    cutoff = (abs(np.linalg.det(reduced_lattice)) / n_atoms) ** (1. / 3.)
+
+    while True:
+        n = translation_integers_for_radial_cutoff(reduced_lattice, cutoff)
+        translations = translation_integer_grid(n) @ reduced_lattice.T
+
+        for j in range(n_species):
+            missing = np.where(np.isinf(d_min[:, j]))[0]
+            if missing.size == 0:
+                continue
+            images = (species_positions[j][np.newaxis, :, :] + translations[:, np.newaxis, :]).reshape(-1, 3)
+            tree = spatial.cKDTree(images)
+            for i in missing:
+                # Two nearest images, as an atom is its own nearest image when X = Y
+                distances, _ = tree.query(species_positions[i], k=2, distance_upper_bound=cutoff)
+                d_min[i, j] = d_min[j, i] = np.min(distances[distances > 0.], initial=np.inf)
+
+        if np.all(np.isfinite(d_min)):
+            return species, d_min
+        cutoff *= 2.
 
-    if remove_self_interaction:
-        zeros = (displacement_vectors == np.array([0., 0., 0.])).all(-1)
-        non_zeros = [not x for x in zeros]
-        displacement_vectors = np.asarray(displacement_vectors)
-        displacement_vectors = displacement_vectors[non_zeros, :]
 
-    # Apply minimum image convention to these vectors
-    # TODO(Alex) Check this works as expected
-    wrapped_vectors = mic(displacement_vectors, lattice, pbc=True)
-    return wrapped_vectors
-
-
-def minimum_vector_length(vectors: np.ndarray) -> float:
-    """ Find the minimum magnitude from a set of displacement vectors.
+def find_minimum_bond_lengths(positions: np.ndarray, lattice: np.ndarray, atomic_numbers: List[int]) -> dict:
+    """Find the minimum bond length between the species with (the anticipated) smallest MT radius,
+    and each other species in a periodic cell.
 
-    :param vectors: Array of vectors.
-    :return: minimum vector length.
+    :return minimum_bond_lengths: Minimum bond length between species X and Y, for all Y, where X
+    is the species with the smallest MT radius.
     """
-    if vectors.shape[1] != 3:
-        raise ValueError('Vectors should be stored (n_vectors, 3)')
-
-    n_vectors = vectors.shape[0]
-    norms = np.empty(shape=n_vectors)
-
-    for i in range(n_vectors):
-        norms[i] = np.linalg.norm(vectors[i, :])
-
-    return np.min(norms)
+    an_min_mt = atomic_number_species_with_mt_min(atomic_numbers)
+    species, d_min = minimum_distance_matrix(positions, lattice, atomic_numbers)
+    i_min_mt = np.where(species == an_min_mt)[0][0]
+    return {int(an): d_min[i_min_mt, j] for j, an in enumerate(species)}
 
 
 def optimal_smallest_muffin_tin_radius(an_x, an_y, bond_length):
@@ -144,6 +131,41 @@ def optimal_smallest_muffin_tin_radius(an_x, an_y, bond_length):
     return mt_x
 
 
+def optimal_muffin_tin_radii(positions: np.ndarray, lattice: np.ndarray, atomic_numbers: List[int],
+                             scaling_factor=1.0) -> dict:
+    """Muffin tin radii for all species, with optimal ratios w.r.t. the smallest MT radius.
+
+    See `main` for a description of the method.
+
+    :param positions: Cartesian positions, shape (n_atoms, 3).
+    :param lattice: Lattice vectors, stored row-wise.
+    :param atomic_numbers: Atomic numbers.
+    :param scaling_factor: Scaling applied to all radii.
+    :return: MT radius for each atomic number.
+    """
+    an_mt_min = atomic_number_species_with_mt_min(atomic_numbers)
+    min_bond_lengths = find_minimum_bond_lengths(positions, lattice, atomic_numbers)
+    species = np.array(list(min_bond_lengths.keys()))
+    bond_lengths = np.array(list(min_bond_lengths.values()))
+
+    rgkmax = np.array([fixed_precision_rgkmax(an) for an in species])
+    rgkmax_min = fixed_precision_rgkmax(an_mt_min)
+
+    mt_min = scaling_factor * np.min(bond_lengths / (1. + rgkmax / rgkmax_min))
+    return {int(an): mt_min * rgkmax[i] / rgkmax_min for i, an in enumerate(species)}
+
+
+def batch_optimal_muffin_tin_radii(systems: list, scaling_factor=1.0) -> List[dict]:
+    """Optimal muffin tin radii for many systems.
+
+    :param systems: Systems, each with positions, lattice (row-wise) and atomic_numbers attributes.
+    :param scaling_factor: Scaling applied to all radii.
+    :return: MT radius for each atomic number, per system.
+    """
+    return [optimal_muffin_tin_radii(system.positions, system.lattice, system.atomic_numbers, scaling_factor)
+            for system in systems]
+
+
 def main(system, scaling_factor=1.0):
     """Get Muffin Tin radii with optimal ratios w.r.t. the smallest MT.
 
@@ -2,11 +2,11 @@ import os
 import re
 import numpy as np
 from typing import Tuple, Optional, List
-import ase
 
-from excitingtools.dataclasses.data_structs import BandIndices, PointIndex
-from excitingtools.dataclasses.eigenvalues import EigenValues
-from excitingtools.exciting_obj_parsers.gw_eigenvalues import NitrogenEvalQPColumns, gw_eigenvalue_parser
+from modules.lazy_import import lazy_import
+
+ase_cell = lazy_import('ase.cell')
+gw_eigenvalues = lazy_import('excitingtools.exciting_obj_parsers.gw_eigenvalues')
 
 
 def get_standardised_band_path(lattice_vectors) -> Tuple[np.ndarray, dict]:
@@ -19,8 +19,8 @@ def get_standardised_band_path(lattice_vectors) -> Tuple[np.ndarray, dict]:
     and (most likely) in angstrom.
     :return: Tuple of the band path and high symmetry points {symbol: k_point/s}
     """
-    cell = ase.atoms.Cell(lattice_vectors)
-    band_path: ase.dft.kpoints.BandPath = cell.bandpath()
+    cell = ase_cell.Cell(lattice_vectors)
+    band_path = cell.bandpath()
     return band_path.path, band_path.special_points
 
 
@@ -71,7 +71,7 @@ def exciting_band_path_xml(symbolic_path, high_symmetry_points, steps:Optional[i
     return string
 
 
-def get_gw_bandedge_indices(path: str) -> BandIndices:
+def get_gw_bandedge_indices(path: str) -> 'BandIndices':
     """ Get GW band indices from GW_INFO.OUT, for exciting Nitrogen.
 
     Note, the strings may differ in Oxygen.
@@ -79,6 +79,8 @@ def get_gw_bandedge_indices(path: str) -> BandIndices:
     :param path: Path to file `GW_INFO.OUT`
     :return (vbm, cbm): VBM and CBm indices.
     """
+    from excitingtools.dataclasses.data_structs import BandIndices
+
     file_name = os.path.join(path, "GW_INFO.OUT")
     try:
         with open(file=file_name) as fid:
@@ -96,7 +98,7 @@ def get_gw_bandedge_indices(path: str) -> BandIndices:
     return BandIndices(VBM=vbm, CBm=cbm)
 
 
-def get_gw_bandedge_k_indices(path: str) -> List[PointIndex]:
+def get_gw_bandedge_k_indices(path: str) -> List['PointIndex']:
     """ Parse k-points at band edges.
 
     Valid for Nitrogen.
@@ -108,6 +110,8 @@ def get_gw_bandedge_k_indices(path: str) -> List[PointIndex]:
     :param path:
     :return:
     """
+    from excitingtools.dataclasses.data_structs import PointIndex
+
     file_name = os.path.join(path, "GW_INFO.OUT")
     try:
         with open(file=file_name) as fid:
@@ -164,7 +168,7 @@ def band_gaps(path) -> dict:
     :param path: Path to file.
     :return: Dict of band gaps.
     """
-    eigenvalues: EigenValues = gw_eigenvalue_parser(path, NitrogenEvalQPColumns.E_GW)
+    eigenvalues = gw_eigenvalues.gw_eigenvalue_parser(path, gw_eigenvalues.NitrogenEvalQPColumns.E_GW)
 
     # Indirect (or smallest)
     band_indices = get_gw_bandedge_indices(path)
@@ -116,4 +116,51 @@
 #         percentage_min = 1. / denominator
 #         percentage_x = (fixed_precision_rgkmax(an) / rgkmax_min) / denominator
 #         # print(percentage_min, percentage_x)
-#         print((an_min, an), percentage_min * bond_length)
\ No newline at end of file
+#         print((an_min, an), percentage_min * bond_length)
+
+# Superseded by minimum_distance_matrix, which finds all species pairs from a single neighbour search
+# def wrapped_displacement_vectors(r_x: np.ndarray,
+#                                  r_y: np.ndarray,
+#                                  lattice: np.ndarray,
+#                                  remove_self_interaction=True) -> np.ndarray:
+#     """ Find all displacement vectors between atom/s at position/s r_x
+#     and atom/s at position/s r_y, in the minimum image convention.
+#
+#     wrapped_vectors = [[r0 - r0], [r1 - r0], ... [r_Ny - r_Nx]]
+#
+#     :return wrapped_vectors: Displacement vectors between positions r_x and r_y, in the
+#      minimum image convention.
+#     """
+#     displacement_vectors = []
+#     for i in range(r_x.shape[0]):
+#         for j in range(r_y.shape[0]):
+#             displacement_vectors.append(r_y[j, :] - r_x[i, :])
+#
+#     if remove_self_interaction:
+#         zeros = (displacement_vectors == np.array([0., 0., 0.])).all(-1)
+#         non_zeros = [not x for x in zeros]
+#         displacement_vectors = np.asarray(displacement_vectors)
+#         displacement_vectors = displacement_vectors[non_zeros, :]
+#
+#     # Apply minimum image convention to these vectors
+#     # TODO(Alex) Check this works as expected
+#     wrapped_vectors = mic(displacement_vectors, lattice, pbc=True)
+#     return wrapped_vectors
+#
+#
+# def minimum_vector_length(vectors: np.ndarray) -> float:
+#     """ Find the minimum magnitude from a set of displacement vectors.
+#
+#     :param vectors: Array of vectors.
+#     :return: minimum vector length.
+#     """
+#     if vectors.shape[1] != 3:
+#         raise ValueError('Vectors should be stored (n_vectors, 3)')
+#
+#     n_vectors = vectors.shape[0]
+#     norms = np.empty(shape=n_vectors)
+#
+#     for i in range(n_vectors):
+#         norms[i] = np.linalg.norm(vectors[i, :])
+#
+#     return np.min(norms)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from src.materials import ZrO2Primitive
+from src.optimal_muffin_tins import minimum_distance_matrix, optimal_muffin_tin_radii, \
+    batch_optimal_muffin_tin_radii, fixed_precision_rgkmax
+
+
+def brute_force_distance_matrix(positions, lattice, atomic_numbers, n_max=6) -> np.ndarray:
+    """ Minimum distance between each pair of species, over all periodic images with
+    translation integers in [-n_max, n_max], excluding each atom's distance to itself
+    """
+    ranges = [np.arange(-n_max, n_max + 1)] * 3
+    translations = np.stack(np.meshgrid(*ranges, indexing='ij'), axis=-1).reshape(-1, 3) @ lattice
+    species = np.unique(atomic_numbers)
+    index = {an: i for i, an in enumerate(species)}
+
+    d_min = np.full(shape=(species.size, species.size), fill_value=np.inf)
+    for i, r_i in enumerate(positions):
+        for j, r_j in enumerate(positions):
+            distances = np.linalg.norm(r_j + translations - r_i, axis=1)
+            distances = distances[distances > 1.e-10]
+            ii, jj = index[atomic_numbers[i]], index[atomic_numbers[j]]
+            d_min[ii, jj] = min(d_min[ii, jj], distances.min())
+    return d_min
+
+
+def test_minimum_distance_matrix_of_skewed_cell():
+    rng = np.random.default_rng(7)
+    lattice = np.array([[4.1, 0.0, 0.0],
+                        [3.6, 1.9, 0.0],
+                        [-2.7, 1.1, 3.8]])
+    # Positions outside of the cell are wrapped
+    positions = (rng.random(size=(5, 3)) * 2. - 0.5) @ lattice
+    atomic_numbers = [8, 40, 8, 22, 40]
+
+    species, d_min = minimum_distance_matrix(positions, lattice, atomic_numbers)
+
+    assert species.tolist() == [8, 22, 40]
+    assert np.allclose(d_min, d_min.T)
+    assert np.allclose(d_min, brute_force_distance_matrix(positions, lattice, atomic_numbers))
+
+
+def test_minimum_distance_matrix_of_one_atom_cell():
+    """ The only distance is to the atom's own periodic images, with the length of the
+    shortest lattice vector, which for this cell is a + b
+    """
+    lattice = np.array([[5.0, 0.0, 0.0],
+                        [-4.0, 1.5, 0.0],
+                        [0.3, 0.2, 6.0]])
+    positions = np.array([[1.0, 1.0, 1.0]])
+
+    species, d_min = minimum_distance_matrix(positions, lattice, [14])
+
+    assert species.tolist() == [14]
+    assert d_min.shape == (1, 1)
+    assert np.isclose(d_min[0, 0], np.linalg.norm(lattice[0] + lattice[1]))
+    assert np.allclose(d_min, brute_force_distance_matrix(positions, lattice, [14]))
+
+
+def test_minimum_distance_matrix_of_large_cell():
+    """ Search radius does not grow with the cell, so a species with one atom in a large
+    cell is found, and agrees with a direct search
+    """
+    lattice = 20. * np.identity(3)
+    grid = np.stack(np.meshgrid(*[np.arange(0, 8)] * 3, indexing='ij'), axis=-1).reshape(-1, 3)
+    positions = 2.5 * grid
+    atomic_numbers = [14] * len(positions)
+    atomic_numbers[0] = 6
+
+    species, d_min = minimum_distance_matrix(positions, lattice, atomic_numbers)
+
+    assert np.allclose(d_min, [[20., 2.5], [2.5, 2.5]])
+
+
+def test_optimal_muffin_tin_radii():
+    """ Regression test for cubic ZrO2. O has the smaller rgkmax, so the smaller MT radius.
+    The Zr-O bond, sqrt(3) a / 4, limits the radii rather than the O-O bond, a / 2
+    """
+    system = ZrO2Primitive()
+    radii = optimal_muffin_tin_radii(system.positions, system.lattice, system.atomic_numbers)
+
+    a = 2. * 2.53574055
+    assert sorted(radii.keys()) == [8, 40]
+    assert radii[8] == pytest.approx(np.sqrt(3.) * a / 4. / (1. + 11.664200 / 10.239864))
+    assert radii[8] == pytest.approx(1.02660869, abs=1.e-8)
+    assert radii[40] == pytest.approx(radii[8] * fixed_precision_rgkmax(40) / fixed_precision_rgkmax(8))
+
+    scaled = batch_optimal_muffin_tin_radii([system, system], scaling_factor=0.8)
+    assert len(scaled) == 2
+    assert scaled[1] == pytest.approx({an: 0.8 * radius for an, radius in radii.items()})